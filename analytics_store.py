@@ -0,0 +1,230 @@
+import sqlite3
+import argparse
+import os
+import time
+
+# ==========================================
+# FILE-BACKED ANALYTICS STORE (SQLite)
+# day2_sql.py builds a ':memory:' table and reads every report into one
+# DataFrame. For millions of rows we keep the tables in a SQLite file:
+#   - WAL journal: readers don't block the writer, commits are cheap
+#   - indexes on (department, salary) and (status, amount), so the window
+#     functions walk an index instead of sorting the whole table
+#   - bulk loads run as ONE transaction (one fsync, not one per row)
+#   - results stream back through the cursor, 'chunksize' rows at a time
+#   - one long-lived connection, so sqlite3's statement cache keeps every
+#     report's prepared statement between runs
+# pandas is imported only where DataFrames are built: rows() and plain
+# tuples need nothing but sqlite3, so SQL-only commands start fast.
+# ==========================================
+
+DEFAULT_PATH = 'aurum_analytics.db'
+
+SCHEMA = {
+    'employees': '''
+        CREATE TABLE IF NOT EXISTS employees (
+        id INTEGER PRIMARY KEY,
+        name TEXT,
+        department TEXT,
+        salary INTEGER
+        )''',
+    'transactions': '''
+        CREATE TABLE IF NOT EXISTS transactions (
+        transaction_id INTEGER PRIMARY KEY,
+        client_name TEXT,
+        city TEXT,
+        asset_class TEXT,
+        amount INTEGER,
+        status TEXT
+        )''',
+}
+
+INDEXES = {
+    'employees': {'idx_employees_department_salary': 'employees (department, salary)'},
+    'transactions': {'idx_transactions_status_amount': 'transactions (status, amount)'},
+}
+
+# The day2 reports, by name
+REPORTS = {
+    'dense_rank': '''
+        SELECT name, department, salary,
+        DENSE_RANK() OVER (PARTITION BY department ORDER BY salary DESC) as salary_rank
+        FROM employees''',
+    'lag': '''
+        SELECT name, salary,
+        LAG(salary, 1, 0) OVER (ORDER BY salary) as previous_person_salary,
+        (salary - LAG(salary, 1, 0) OVER (ORDER BY salary)) as salary_diff
+        FROM employees''',
+    'high_earners': '''
+        WITH HighEarners AS (
+        SELECT * FROM employees
+        WHERE salary > ? )
+        SELECT * FROM HighEarners''',
+}
+
+class AnalyticsStore:
+    """
+    The employee/transaction tables in one SQLite file.
+    Keep one store open across report runs; it owns the connection
+    (and with it the prepared statement cache).
+    """
+
+    def __init__(self, path=DEFAULT_PATH, cached_statements=256):
+        self.path = path
+        self.conn = sqlite3.connect(path, cached_statements=cached_statements)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')   # safe with WAL, no fsync per commit
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        for table, ddl in SCHEMA.items():
+            self.conn.execute(ddl)
+            self._create_indexes(table)
+        self.conn.commit()
+
+    def _create_indexes(self, table):
+        for name, target in INDEXES[table].items():
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {target}')
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def load(self, table, rows, replace=False, batch_size=100_000):
+        """
+        Inserts rows (a DataFrame in table column order, or an iterable of
+        tuples) inside a single transaction. With replace=True the table is
+        emptied first, in the same transaction. The indexes are dropped for
+        the load and rebuilt once at the end, which is much faster than
+        updating them row by row. Returns the number of rows inserted.
+        """
+        if table not in SCHEMA:
+            raise ValueError(f"unknown table '{table}' (use {list(SCHEMA)})")
+        columns = [row[1] for row in self.conn.execute(f'PRAGMA table_info({table})')]
+        insert = f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})"
+
+        count = 0
+        with self.conn:  # BEGIN ... COMMIT (ROLLBACK on error)
+            # sqlite3 only opens a transaction by itself before DML: without this,
+            # the DROP INDEXes would commit on their own and survive a failed load
+            if not self.conn.in_transaction:
+                self.conn.execute('BEGIN')
+            if replace:
+                self.conn.execute(f'DELETE FROM {table}')
+            for name in INDEXES[table]:
+                self.conn.execute(f'DROP INDEX IF EXISTS {name}')
+            for batch in _batches(rows, batch_size):
+                self.conn.executemany(insert, batch)
+                count += len(batch)
+            self._create_indexes(table)
+        self.conn.execute(f'ANALYZE {table}')
+        return count
+
+    def rows(self, sql, params=(), chunksize=50_000):
+        """
+        Yields (column names, list of row tuples) of at most 'chunksize' rows,
+        fetched from the cursor as they are needed. No pandas involved.
+        """
+        cursor = self.conn.execute(sql, params)
+        columns = [d[0] for d in cursor.description]
+        try:
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                yield columns, rows
+        finally:
+            cursor.close()
+
+    def query(self, sql, params=(), chunksize=50_000):
+        """
+        Yields the result as DataFrames of at most 'chunksize' rows,
+        fetched from the cursor as they are needed.
+        """
+        import pandas as pd
+        for columns, rows in self.rows(sql, params, chunksize):
+            yield pd.DataFrame.from_records(rows, columns=columns)
+
+    def report(self, name, params=(), chunksize=50_000):
+        """
+        query() for one of the named REPORTS.
+        """
+        return self.query(REPORTS[name], params, chunksize)
+
+    def read(self, sql, params=()):
+        """
+        The whole result as one DataFrame (for small results).
+        """
+        import pandas as pd
+        chunks = list(self.query(sql, params))
+        if chunks:
+            return pd.concat(chunks, ignore_index=True)
+        cursor = self.conn.execute(sql, params)
+        return pd.DataFrame(columns=[d[0] for d in cursor.description])
+
+def _batches(rows, batch_size):
+    """
+    Lists of plain-Python tuples, 'batch_size' at a time.
+    """
+    if hasattr(rows, 'itertuples'):  # a DataFrame
+        for start in range(0, len(rows), batch_size):
+            # object dtype -> Python ints/strs that sqlite3 can bind (NaN -> None)
+            part = rows.iloc[start:start + batch_size].astype(object)
+            yield list(part.where(part.notna(), None).itertuples(index=False, name=None))
+        return
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+# ==========================================
+# BENCHMARK: load N employees, stream every report
+# python analytics_store.py --rows 2000000
+# ==========================================
+def make_employees(n_rows, seed=42):
+    """
+    Synthetic employees: a few departments, salaries in steps of 1000 (many ties).
+    """
+    import pandas as pd
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    departments = np.array(['IT', 'Sales', 'HR', 'Finance', 'Ops'], dtype=object)
+    return pd.DataFrame({
+        'id': np.arange(1, n_rows + 1),
+        'name': pd.Series(rng.integers(0, 100_000, n_rows)).map('emp_{}'.format),
+        'department': departments[rng.integers(0, len(departments), n_rows)],
+        'salary': rng.integers(30, 150, n_rows) * 1000,
+    })
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='SQLite analytics store: bulk load + streamed window reports')
+    parser.add_argument('--db', default=DEFAULT_PATH)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print("--- SYSTEM: ANALYTICS STORE ---")
+    with AnalyticsStore(args.db) as store:
+        start = time.perf_counter()
+        loaded = store.load('employees', make_employees(args.rows), replace=True)
+        print(f">> Loaded {loaded:,} employees into '{args.db}' in {time.perf_counter() - start:.2f}s")
+
+        for run in (1, 2):
+            for name, params in (('dense_rank', ()), ('lag', ()), ('high_earners', (75000,))):
+                start = time.perf_counter()
+                rows, chunks, biggest = 0, 0, 0
+                for chunk in store.report(name, params, chunksize=args.chunksize):
+                    rows += len(chunk)
+                    chunks += 1
+                    biggest = max(biggest, len(chunk))
+                print(f"  run {run} {name:<13} {rows:>10,} rows in {chunks:>3} chunks "
+                      f"(<= {biggest:,} rows in memory) {time.perf_counter() - start:6.2f}s")
+
+    print(f">> Database file: {os.path.getsize(args.db) / 1e6:.1f} MB")
@@ -0,0 +1,172 @@
+import argparse
+import os
+import re
+import runpy
+import sys
+
+# ==========================================
+# ONE COMMAND LINE (Lazy Imports, Fast Start)
+# python aurum.py <command> [args...]
+# Every script imports pandas / numpy / matplotlib / sklearn at the top, so
+# even 'what does ₹75,000 of marketing give?' paid seconds before printing.
+# This entry point imports only the standard library. A command loads its
+# module when it runs, through that module's own command line (runpy), so:
+#   predict  -> model_service (numpy only, no pandas / sklearn)
+#   sql      -> analytics_store (sqlite3 only, no pandas)
+#   pipeline -> day6_pipeline (pandas; matplotlib only when the report is drawn)
+# 'python aurum.py startup' times cold starts with python -X importtime.
+# ==========================================
+
+# command -> (module run as __main__, help)
+COMMANDS = {
+    'predict': ('model_service', 'Predict from (or update) a saved linear model'),
+    'pipeline': ('day6_pipeline', 'Client ETL pipeline (DAG / streaming / parallel)'),
+    'train': ('online_regression', 'Chunked least-squares training over partitions'),
+    'bench': ('benchmarks', 'Benchmark suite for the pipeline hot paths'),
+    'metrics': ('instrumentation', 'Per-stage summary of a pipeline metrics log'),
+    'kernels': ('kernels', 'Formula kernels vs masks and loops'),
+    'store': ('datastore', 'Parquet data layer benchmark'),
+    'queries': ('query_pool', 'Concurrent read-only SQL benchmark'),
+    'ingest': ('ingest', 'Live transaction / gold tick ingestion (replay, socket or tailed file)'),
+}
+
+# The lessons, runnable by name: python aurum.py day 6 --chunksize 1000
+DAYS = {
+    '1': 'day1_test', '2': 'day2_sql', '3': 'day3_pandas', '4': 'day4_cleaning', '5': 'day5_viz',
+    '6': 'day6_pipeline', '7': 'day7_ml', '8': 'day8_aggregation', '9': 'day9_quant', '10': 'day10_prediction',
+}
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def run_module(module, argv):
+    """
+    Runs a module's own command line as if it were 'python <module>.py argv...'.
+    """
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    sys.argv = [f'{module}.py'] + list(argv)
+    runpy.run_module(module, run_name='__main__', alter_sys=True)
+
+def sql(args):
+    """
+    A named report (or any SELECT) on the analytics store, printed as text.
+    """
+    from analytics_store import AnalyticsStore, DEFAULT_PATH, REPORTS
+    if args.report not in REPORTS and not args.report.lstrip().upper().startswith(('SELECT', 'WITH')):
+        sys.exit(f"unknown report '{args.report}' (use one of {sorted(REPORTS)} or a SELECT statement)")
+    path = args.db or DEFAULT_PATH
+    if not os.path.exists(path):
+        sys.exit(f"no database '{path}' (run 'python aurum.py day 2' first)")
+    sql_text = REPORTS.get(args.report, args.report)
+    params = [float(p) if re.fullmatch(r'-?\d+(\.\d+)?', p) else p for p in args.params]
+    with AnalyticsStore(path) as store:
+        printed = False
+        for columns, rows in store.rows(sql_text, params, chunksize=args.chunksize):
+            if not printed:
+                print('\t'.join(columns))
+                printed = True
+            for row in rows:
+                print('\t'.join('' if v is None else str(v) for v in row))
+
+# ==========================================
+# STARTUP BENCHMARK
+# python aurum.py startup [--repeats 5] [--budget-ms 300]
+# Each command runs in a fresh interpreter under -X importtime: wall time
+# of the whole process, plus what the imports cost and which were heaviest.
+# ==========================================
+def _import_times(stderr):
+    """
+    {module: (cumulative microseconds, top level?)} from -X importtime output.
+    """
+    times = {}
+    for line in stderr.splitlines():
+        match = re.match(r'import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)$', line)
+        if match:
+            times[match.group(3)] = (int(match.group(1)), match.group(2) == '')
+    return times
+
+def _startup_fixtures(folder):
+    """
+    A saved model and a small database, so 'predict' and 'sql' have something to read.
+    """
+    import subprocess
+    run = lambda code: subprocess.run([sys.executable, '-c', code], cwd=HERE, check=True)
+    run(f"from model_service import LinearModel, ModelService\n"
+        f"ModelService({os.path.join(folder, 'models')!r}).save('revenue', LinearModel().fit([[1.0], [2.0], [3.0]], [2.0, 4.1, 5.9]))")
+    run(f"from analytics_store import AnalyticsStore\n"
+        f"AnalyticsStore({os.path.join(folder, 'aurum.db')!r}).load('employees', "
+        f"[(1, 'Ankit', 'IT', 80000), (2, 'Rahul', 'IT', 90000)], replace=True)")
+
+def startup(args):
+    import subprocess
+    import tempfile
+    import time
+    folder = tempfile.mkdtemp()
+    _startup_fixtures(folder)
+    cases = {
+        'predict': ['predict', 'revenue', '75000', '--dir', os.path.join(folder, 'models')],
+        'sql': ['sql', 'dense_rank', '--db', os.path.join(folder, 'aurum.db')],
+        'help': ['--help'],
+    }
+    print(f"--- SYSTEM: COLD START ({args.repeats} runs each, budget {args.budget_ms} ms) ---")
+    over = []
+    for name, argv in cases.items():
+        walls, imports = [], {}
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            done = subprocess.run([sys.executable, '-X', 'importtime', os.path.join(HERE, 'aurum.py')] + argv,
+                                  capture_output=True, text=True, cwd=folder)
+            walls.append((time.perf_counter() - start) * 1e3)
+            if done.returncode != 0:
+                sys.exit(f"'{' '.join(argv)}' failed:\n{done.stderr[-2000:]}")
+            imports = _import_times(done.stderr)
+        wall = sorted(walls)[len(walls) // 2]
+        top = {module: t for module, (t, top_level) in imports.items() if top_level}
+        heaviest = sorted(top.items(), key=lambda kv: -kv[1])[:4]
+        heavy = [m for m in ('numpy', 'pandas', 'pyarrow', 'matplotlib', 'sklearn') if m in imports]
+        flag = 'OK' if wall <= args.budget_ms else 'OVER'
+        print(f"  {name:<8} median {wall:7.1f} ms  imports {sum(top.values()) / 1e3:7.1f} ms  {flag}")
+        print(f"           heaviest: {', '.join(f'{m} {t / 1e3:.1f} ms' for m, t in heaviest)}")
+        print(f"           heavy packages loaded: {', '.join(heavy) or 'none'}")
+        if flag == 'OVER':
+            over.append(name)
+    if over:
+        sys.exit(f">> Over budget: {', '.join(over)}")
+    print(">> All commands start within budget")
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Module commands hand everything after their name to the module, --help included
+    if argv and argv[0] in COMMANDS:
+        return run_module(COMMANDS[argv[0]][0], argv[1:])
+    if argv[:1] == ['day'] and len(argv) > 1 and argv[1] in DAYS:
+        return run_module(DAYS[argv[1]], argv[2:])
+
+    parser = argparse.ArgumentParser(prog='aurum', description='Aurum Wealth tools: one command line for every script')
+    commands = parser.add_subparsers(dest='command', metavar='command', required=True)
+    for name, (module, text) in COMMANDS.items():
+        sub = commands.add_parser(name, help=text, add_help=False)
+        sub.add_argument('args', nargs=argparse.REMAINDER, help=f"Arguments for {module}.py (try: {name} --help)")
+
+    day = commands.add_parser('day', help='Run one of the day scripts')
+    day.add_argument('number', choices=list(DAYS), help='Day number')
+    day.add_argument('args', nargs=argparse.REMAINDER)
+
+    report = commands.add_parser('sql', help='Print a named report or a SELECT from the analytics store')
+    report.add_argument('report', help="Report name (dense_rank, lag, high_earners) or a SELECT statement")
+    report.add_argument('params', nargs='*', help='Values for the ? placeholders')
+    report.add_argument('--db', help='SQLite file (default: the analytics store)')
+    report.add_argument('--chunksize', type=int, default=50_000)
+
+    bench = commands.add_parser('startup', help='Cold-start time of the light commands (python -X importtime)')
+    bench.add_argument('--repeats', type=int, default=5)
+    bench.add_argument('--budget-ms', type=float, default=300)
+
+    args = parser.parse_args(argv)
+    if args.command == 'sql':
+        sql(args)
+    elif args.command == 'startup':
+        startup(args)
+
+if __name__ == "__main__":
+    main()
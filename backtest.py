@@ -0,0 +1,220 @@
+import pandas as pd
+import numpy as np
+import argparse
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+# ==========================================
+# VECTORIZED BACKTEST GRID (SMA Crossover)
+# day9_quant.py checks ONE pair (20/50) on ONE gold series and never asks
+# "did it make money?". Here every (fast, slow) pair runs on every instrument
+# at once with 2-D arrays:
+#   - all SMAs come from one cumulative sum per window (no rolling() per pair)
+#   - one fast window is compared against ALL slow windows in a single array op
+#   - P&L, drawdown and Sharpe are reductions over the time axis
+# Strategy: long when SMA_fast > SMA_slow (Bullish, like day9), flat otherwise.
+# The signal from today's close is traded on the next bar (no look-ahead).
+# SPEED: the target was "seconds" for the full sweep; it is not met on one core.
+# SMAs are computed once per block and shared by every pair, but each pair
+# still needs its own pass over time (the drawdown's running peak is a
+# sequential accumulate), so cost is ~pairs x bars x instruments:
+# 100 x 100 pairs, 100 instruments, 10 years = 2.5e9 cells, about 50 s on
+# one core (about 0.5 s per instrument). Run with --workers (one block of
+# instruments per process) or narrow the grid; a bars-last memory layout
+# was measured at only ~10% faster, so it is not used.
+# ==========================================
+
+TRADING_DAYS = 252
+
+def sma_table(prices, windows):
+    """
+    {window: SMA array} for prices of shape (bars, instruments).
+    NaN until the window is full, same as rolling(window).mean().
+    """
+    csum = np.vstack([np.zeros((1, prices.shape[1])), np.cumsum(prices, axis=0)])
+    table = {}
+    for w in windows:
+        sma = np.full(prices.shape, np.nan)
+        sma[w - 1:] = (csum[w:] - csum[:-w]) / w
+        table[w] = sma
+    return table
+
+def _run_block(prices, fast_windows, slow_windows):
+    """
+    Backtests one block of instruments. Returns (total_return, max_drawdown, sharpe),
+    each of shape (len(fast), len(slow), instruments).
+    """
+    n_fast, n_slow, n_inst = len(fast_windows), len(slow_windows), prices.shape[1]
+    smas = sma_table(prices, sorted(set(fast_windows) | set(slow_windows)))
+    slow_stack = np.stack([smas[w] for w in slow_windows])          # (slow, bars, inst)
+
+    returns = np.zeros_like(prices)
+    returns[1:] = prices[1:] / prices[:-1] - 1
+    log_returns = np.log1p(returns).astype(np.float32)
+    returns = returns.astype(np.float32)
+    returns_sq = returns ** 2
+    n_returns = prices.shape[0] - 1
+
+    total = np.full((n_fast, n_slow, n_inst), np.nan)
+    drawdown = np.full((n_fast, n_slow, n_inst), np.nan)
+    sharpe = np.full((n_fast, n_slow, n_inst), np.nan)
+
+    position = np.zeros(slow_stack.shape, dtype=np.float32)
+    equity = np.empty(slow_stack.shape, dtype=np.float32)
+    peak = np.empty(slow_stack.shape, dtype=np.float32)
+    for i, fast in enumerate(fast_windows):
+        valid = np.array([fast < slow for slow in slow_windows])
+        if not valid.any():
+            continue
+
+        # Bullish today -> hold tomorrow
+        np.greater(smas[fast][None, :-1], slow_stack[:, :-1], out=position[:, 1:], casting='unsafe')
+
+        # Total return: long/flat, so log-returns just add up
+        np.multiply(position, log_returns[None], out=equity)
+        np.cumsum(equity, axis=1, out=equity)
+        total[i] = np.expm1(equity[:, -1])
+
+        # Max drawdown: worst fall from the running peak (the start counts as a peak)
+        np.maximum.accumulate(equity, axis=1, out=peak)
+        np.maximum(peak, 0, out=peak)
+        np.subtract(equity, peak, out=peak)
+        drawdown[i] = -np.expm1(peak.min(axis=1))
+
+        # Sharpe from sums only: position is 0/1, so (pos * r)^2 = pos * r^2
+        # (plain einsum: optimize=True turns this into a much slower tensordot)
+        s1 = np.einsum('stn,tn->sn', position, returns)
+        s2 = np.einsum('stn,tn->sn', position, returns_sq)
+        mean = s1 / n_returns
+        var = (s2 - n_returns * mean ** 2) / (n_returns - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe[i] = np.where(var > 0, mean / np.sqrt(var) * np.sqrt(TRADING_DAYS), np.nan)
+
+        total[i, ~valid] = drawdown[i, ~valid] = sharpe[i, ~valid] = np.nan
+    return total, drawdown, sharpe
+
+def _run_block_task(task):
+    return _run_block(*task)
+
+def backtest_grid(prices, fast_windows, slow_windows, memory_budget=1 << 29, workers=1):
+    """
+    SMA-crossover backtest for every (fast, slow) pair on every instrument.
+    'prices' is (bars, instruments) or a DataFrame with one column per instrument.
+    Pairs with fast >= slow are NaN.
+
+    Returns a dict of arrays shaped (fast, slow, instrument):
+      total_return  - compounded return over the whole period
+      max_drawdown  - largest peak-to-trough loss (0.25 = -25%)
+      sharpe        - annualised Sharpe ratio of daily returns (risk-free = 0)
+    Instruments are processed in blocks so the working set stays near 'memory_budget'
+    bytes per process; with workers > 1 the blocks run in a process pool.
+    """
+    columns = list(prices.columns) if isinstance(prices, pd.DataFrame) else None
+    prices = np.asarray(prices, dtype=np.float64)
+    if prices.ndim == 1:
+        prices = prices[:, None]
+    fast_windows, slow_windows = list(fast_windows), list(slow_windows)
+    n_bars, n_inst = prices.shape
+
+    # Per instrument: the SMA table (8 bytes) + slow stack (8) + position/equity/peak (4+4+4)
+    per_instrument = n_bars * (8 * len(set(fast_windows) | set(slow_windows)) + 20 * len(slow_windows))
+    block = max(1, int(memory_budget // per_instrument))
+
+    results = {name: np.empty((len(fast_windows), len(slow_windows), n_inst))
+               for name in ('total_return', 'max_drawdown', 'sharpe')}
+    if workers > 1:
+        # Small enough blocks that every worker gets some
+        block = max(1, min(block, -(-n_inst // workers)))
+    starts = list(range(0, n_inst, block))
+    tasks = [(prices[:, start:start + block], fast_windows, slow_windows) for start in starts]
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outputs = list(pool.map(_run_block_task, tasks))
+    else:
+        outputs = map(_run_block_task, tasks)
+
+    for start, parts in zip(starts, outputs):
+        for name, part in zip(('total_return', 'max_drawdown', 'sharpe'), parts):
+            results[name][:, :, start:start + block] = part
+
+    results['fast'] = np.array(fast_windows)
+    results['slow'] = np.array(slow_windows)
+    results['instruments'] = columns if columns is not None else list(range(n_inst))
+    return results
+
+def summarize_grid(results):
+    """
+    One row per (fast, slow) pair, averaged over instruments, best Sharpe first.
+    """
+    fast, slow = np.meshgrid(results['fast'], results['slow'], indexing='ij')
+    with warnings.catch_warnings():
+        # Pairs with fast >= slow are all-NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        summary = pd.DataFrame({
+            'fast': fast.ravel(),
+            'slow': slow.ravel(),
+            'mean_return': np.nanmean(results['total_return'], axis=2).ravel(),
+            'mean_drawdown': np.nanmean(results['max_drawdown'], axis=2).ravel(),
+            'mean_sharpe': np.nanmean(results['sharpe'], axis=2).ravel(),
+        })
+    return summary.dropna().sort_values('mean_sharpe', ascending=False).reset_index(drop=True)
+
+def backtest_pair(prices, fast, slow):
+    """
+    The slow, obvious pandas version for one pair and one series (used to check the grid).
+    """
+    prices = pd.Series(prices)
+    signal = np.where(prices.rolling(fast).mean() > prices.rolling(slow).mean(), 1.0, 0.0)
+    strategy = pd.Series(signal).shift(1).fillna(0) * prices.pct_change().fillna(0)
+    equity = (1 + strategy).cumprod()
+    peak = np.maximum(equity.cummax(), 1)
+    daily = strategy.iloc[1:]
+    return {
+        'total_return': equity.iloc[-1] - 1,
+        'max_drawdown': 1 - (equity / peak).min(),
+        'sharpe': daily.mean() / daily.std() * np.sqrt(TRADING_DAYS),
+    }
+
+# ==========================================
+# DEMO: sweep a 100 x 100 grid over many simulated gold-like series
+# python backtest.py --instruments 500 --years 10
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='SMA crossover backtest grid')
+    parser.add_argument('--instruments', type=int, default=500)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--fast', type=int, nargs=3, default=[5, 105, 1], metavar=('START', 'STOP', 'STEP'))
+    parser.add_argument('--slow', type=int, nargs=3, default=[20, 420, 4], metavar=('START', 'STOP', 'STEP'))
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Processes to spread the instruments over (default: all cores)')
+    args = parser.parse_args()
+
+    print("--- SYSTEM: INITIALIZING BACKTEST GRID ---")
+    np.random.seed(42)
+    n_bars = args.years * TRADING_DAYS
+    daily_moves = np.random.normal(loc=0.0003, scale=0.01, size=(n_bars, args.instruments))
+    prices = 50000 * np.exp(np.cumsum(daily_moves, axis=0))
+
+    fast_windows = range(*args.fast)
+    slow_windows = range(*args.slow)
+    print(f">> {len(fast_windows)} x {len(slow_windows)} window pairs, "
+          f"{args.instruments} instruments, {n_bars} bars")
+
+    start = time.perf_counter()
+    results = backtest_grid(prices, fast_windows, slow_windows, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f">> Grid done in {elapsed:.1f}s on {args.workers} worker(s)")
+
+    print("\n--- TOP 5 PAIRS (by average Sharpe) ---")
+    print(summarize_grid(results).head())
+
+    # Spot check one cell against the plain pandas version
+    i, j = next((i, j) for i, fast in enumerate(fast_windows)
+                for j, slow in enumerate(slow_windows) if fast >= 20 and slow > fast)
+    check = backtest_pair(prices[:, 0], fast_windows[i], slow_windows[j])
+    grid = {name: results[name][i, j, 0] for name in check}
+    print(f"\n>> Check {fast_windows[i]}/{slow_windows[j]} on instrument 0: "
+          + ", ".join(f"{name} {grid[name]:.6f} vs {check[name]:.6f}" for name in check))
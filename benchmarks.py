@@ -0,0 +1,243 @@
+import pandas as pd
+import numpy as np
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# ==========================================
+# BENCHMARK SUITE (Hot Paths, Many Sizes, JSON + Regression Check)
+# day3_pandas.py times one loop against one multiplication with time.time().
+# Here every hot path of the project is a CASE:
+#   setup(size) -> state        built once per size, not timed
+#   fresh(state) -> input       optional, per run, not timed (for code that mutates its input)
+#   run(input)                  the timed part
+# Each case gets warmup runs, then 'repeats' timed runs with perf_counter,
+# then one extra run under tracemalloc for the peak memory it allocates.
+# Results go to JSON; --compare flags cases that got slower than a baseline.
+# ==========================================
+
+CASES = {}
+
+def case(name, max_size=None):
+    """
+    Registers setup/run/fresh functions: @case('name') on a function that
+    returns them as a dict. 'max_size' skips sizes a case can't reasonably
+    run at (the iterrows loop at 1e8 rows would take hours).
+    """
+    def register(factory):
+        CASES[name] = dict(factory(), max_size=max_size)
+        return factory
+    return register
+
+def _quiet(func, *args):
+    # The pipeline stages print progress; keep the benchmark output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+def _trades(size, seed=42):
+    # day3_pandas.py's table
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'investment_id': np.arange(1, size + 1),
+        'amount': rng.integers(1000, 100000, size),
+        'interest_rate': rng.uniform(0.05, 0.15, size),
+    })
+
+def _clients(size, seed=42):
+    # day6_pipeline.py's raw client book: dirty amounts, some missing
+    rng = np.random.default_rng(seed)
+    amounts = rng.integers(10000, 50000, size).astype(object)
+    commas = rng.random(size) < 0.2
+    amounts[commas] = [f'{a:,}' for a in amounts[commas]]   # '15,000'
+    amounts[rng.random(size) < 0.05] = np.nan
+    return pd.DataFrame({
+        'client_id': np.arange(101, 101 + size),
+        'client_name': rng.choice(['Ankit', 'Rohan', 'Priya', 'Rahul', 'Sonal'], size),
+        'investment_amount': amounts,
+        'risk_level': rng.choice(['High', 'Medium', 'Low'], size),
+    })
+
+@case('profit_iterrows', max_size=100_000)
+def _profit_iterrows():
+    def run(df):
+        return [row['amount'] * row['interest_rate'] for _, row in df.iterrows()]
+    return dict(setup=_trades, run=run)
+
+@case('profit_vectorized')
+def _profit_vectorized():
+    return dict(setup=_trades, run=lambda df: df['amount'] * df['interest_rate'])
+
+@case('profit_kernel')
+def _profit_kernel():
+    import kernels
+    return dict(setup=_trades, run=lambda df: kernels.profit(df['amount'], df['interest_rate']))
+
+@case('day6_clean_data')
+def _clean_data():
+    from day6_pipeline import clean_data
+    return dict(setup=_clients, fresh=lambda df: df.copy(), run=lambda df: _quiet(clean_data, df))
+
+@case('day6_analyze_data')
+def _analyze_data():
+    from day6_pipeline import clean_data, analyze_data
+    return dict(setup=lambda size: _quiet(clean_data, _clients(size)), fresh=lambda df: df.copy(),
+                run=lambda df: _quiet(analyze_data, df))
+
+@case('day8_groupby_pivot')
+def _groupby_pivot():
+    from groupby_engine import make_transactions
+
+    def run(df):
+        df.groupby('Client_Name')['Amount'].sum().sort_values(ascending=False)
+        df.groupby(['City', 'Asset_Class'])['Amount'].sum()
+        return df.pivot_table(values='Amount', index='City', columns='Asset_Class', aggfunc='sum', fill_value=0)
+    return dict(setup=make_transactions, run=run)
+
+@case('day9_rolling')
+def _rolling():
+    def setup(size):
+        rng = np.random.default_rng(42)
+        dates = pd.date_range('2025-01-01', periods=size, freq='min')
+        return pd.DataFrame({'Gold_Price': 50000 + np.cumsum(rng.normal(10, 500, size))}, index=dates)
+
+    def run(df):
+        sma_20 = df['Gold_Price'].rolling(window=20).mean()
+        sma_50 = df['Gold_Price'].rolling(window=50).mean()
+        return np.where(sma_20 > sma_50, 'Bullish', 'Bearish')
+    return dict(setup=setup, run=run)
+
+def best_time(func, repeats=3, warmup=0):
+    """
+    Fastest of 'repeats' perf_counter-timed calls to func() (after 'warmup'
+    untimed ones): the quick A/B number the module demos print.
+    """
+    for _ in range(warmup):
+        func()
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def measure(spec, size, warmup=1, repeats=5):
+    """
+    Times one case at one size. Returns a result dict (seconds, bytes).
+    """
+    state = spec['setup'](size)
+    fresh = spec.get('fresh') or (lambda s: s)
+
+    for _ in range(warmup):
+        spec['run'](fresh(state))
+
+    times = []
+    for _ in range(repeats):
+        data = fresh(state)
+        start = time.perf_counter()
+        spec['run'](data)
+        times.append(time.perf_counter() - start)
+
+    # Separate run for memory: tracemalloc slows code down, so it never overlaps the timings
+    data = fresh(state)
+    tracemalloc.start()
+    spec['run'](data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    times = np.array(times)
+    return {
+        'size': size, 'repeats': repeats, 'warmup': warmup,
+        'best': float(times.min()), 'median': float(np.median(times)), 'mean': float(times.mean()),
+        'ns_per_row': float(np.median(times) / size * 1e9),
+        'peak_alloc_bytes': int(peak),
+    }
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'commit': commit,
+        'python': platform.python_version(), 'numpy': np.__version__, 'pandas': pd.__version__,
+        'machine': platform.machine(), 'cpus': os.cpu_count(),
+    }
+
+def run_suite(names, sizes, warmup=1, repeats=5):
+    results = []
+    for name in names:
+        spec = CASES[name]
+        for size in sizes:
+            if spec['max_size'] and size > spec['max_size']:
+                print(f"  {name:<20} {size:>12,}  skipped (max {spec['max_size']:,})")
+                continue
+            result = dict(case=name, **measure(spec, size, warmup, repeats))
+            results.append(result)
+            print(f"  {name:<20} {size:>12,}  median {result['median'] * 1e3:10.2f} ms  "
+                  f"{result['ns_per_row']:8.1f} ns/row  peak {result['peak_alloc_bytes'] / 1e6:9.1f} MB")
+    return {'environment': environment(), 'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            'results': results}
+
+def compare(current, baseline, threshold=0.10):
+    """
+    Cases (case, size) whose best time got more than 'threshold' slower than
+    the baseline file. The best of the repeats is compared, not the median:
+    it is the run least disturbed by whatever else the machine was doing.
+    Returns the list of regressions.
+    """
+    before = {(r['case'], r['size']): r for r in baseline['results']}
+    regressions = []
+    print(f"\n--- COMPARED WITH BASELINE ({baseline['environment'].get('commit') or 'unknown commit'}) ---")
+    for result in current['results']:
+        old = before.get((result['case'], result['size']))
+        if old is None:
+            continue
+        ratio = result['best'] / old['best']
+        flag = 'SLOWER' if ratio > 1 + threshold else ('faster' if ratio < 1 - threshold else 'same')
+        print(f"  {result['case']:<20} {result['size']:>12,}  {old['best'] * 1e3:10.2f} -> "
+              f"{result['best'] * 1e3:10.2f} ms  x{ratio:5.2f}  {flag}")
+        if flag == 'SLOWER':
+            regressions.append({**result, 'baseline_best': old['best'], 'ratio': ratio})
+    return regressions
+
+# ==========================================
+# COMMAND LINE
+# python benchmarks.py --sizes 1e4 1e5 1e6 --output nightly.json
+# python benchmarks.py --sizes 1e4 1e5 1e6 --compare nightly.json     (exit 1 on regression)
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark suite for the pipeline hot paths')
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES))
+    parser.add_argument('--sizes', nargs='+', type=lambda s: int(float(s)), default=[10_000, 100_000, 1_000_000],
+                        help='Row counts, e.g. 1e4 1e6 1e8')
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--output', help='Write results to this JSON file')
+    parser.add_argument('--compare', help='Baseline JSON to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Slowdown that counts as a regression')
+    args = parser.parse_args()
+
+    print("--- SYSTEM: RUNNING BENCHMARK SUITE ---")
+    report = run_suite(args.cases, args.sizes, args.warmup, args.repeats)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=1)
+        print(f">> Results written to '{args.output}'")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print(f">> {len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+        print(">> No regressions")
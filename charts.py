@@ -0,0 +1,84 @@
+import matplotlib.pyplot as plt
+import seaborn as sns
+import numpy as np
+
+# ==========================================
+# CHART DRAWING FUNCTIONS
+# The figure code of the day scripts, one function per chart, so rendering.py
+# can run them in worker processes and cache their PNGs.
+# Each one draws on the current figure: draw(data, **options).
+# ==========================================
+
+# --- day5_viz.py ---
+def portfolio_growth(df_long):
+    sns.set_theme(style="whitegrid")
+    sns.lineplot(data=df_long, x='Month', y='Value', hue='Asset_Class', marker='o', linewidth=2.5)
+
+    plt.title('Aurum Wealth: Portfolio Growth (H1 2025)', fontsize=16, fontweight='bold')
+    plt.xlabel('Month')
+    plt.ylabel('Portfolio Value (INR)')
+    plt.legend(title='Asset Type')
+
+def asset_allocation(june_data):
+    sns.set_theme(style="whitegrid")
+    # A distinct color palette (Pastel is classy)
+    colors = sns.color_palette('pastel')
+
+    sns.barplot(data=june_data, x='Asset_Class', y='Value', palette=colors)
+
+    plt.title('Current Asset Allocation (June)', fontsize=14)
+    plt.ylabel('Value (INR)')
+
+    # Add actual numbers on top of bars (The "Data Analyst" touch)
+    for index, row in enumerate(june_data.itertuples()):
+        plt.text(index, row.Value + 1000, f"₹{row.Value}", color='black', ha="center")
+
+# --- day6_pipeline.py ---
+def risk_profit(summary):
+    sns.set_theme(style="whitegrid")
+    sns.barplot(data=summary, x='risk_level', y='projected_profit', palette='viridis')
+
+    plt.title('Aurum Wealth: Projected Profit by Risk Profile', fontsize=14, fontweight='bold')
+    plt.ylabel('Total Projected Profit (INR)')
+    plt.xlabel('Risk Category')
+
+# --- day8_aggregation.py ---
+def investment_heatmap(pivot_df):
+    sns.heatmap(pivot_df, annot=True, fmt="d", cmap="YlGnBu") # YlGnBu = Yellow Green Blue
+    plt.title('Investment Heatmap: City vs Asset Class')
+
+# --- day9_quant.py ---
+def gold_strategy(df):
+    sns.set_theme(style="darkgrid")
+
+    # Plot Actual Price (Light gray, to show noise)
+    plt.plot(df.index, df['Gold_Price'], label='Gold Price', color='lightgray', alpha=0.6)
+
+    # Plot SMAs (The Signals)
+    plt.plot(df.index, df['SMA_20'], label='20-Day SMA (Fast)', color='blue', linewidth=1.5)
+    plt.plot(df.index, df['SMA_50'], label='50-Day SMA (Slow)', color='red', linewidth=1.5, linestyle='--')
+
+    plt.title('Gold Price Algo Strategy: SMA Crossover', fontsize=14)
+    plt.xlabel('Date')
+    plt.ylabel('Price (INR)')
+    plt.legend()
+
+# --- day10_prediction.py ---
+def revenue_fit(data, score):
+    if 'density' in data:
+        # Too many rows to scatter: counts per cell (downsample.density_grid)
+        grid = data['density']
+        counts = np.ma.masked_equal(grid['counts'].T, 0)
+        plt.pcolormesh(grid['x_edges'], grid['y_edges'], counts, cmap='Blues')
+        plt.colorbar(label='Actual Data (months per cell)')
+    else:
+        df = data['df']
+        sns.scatterplot(x='Marketing_Spend', y='Revenue', data=df, color='blue', alpha=0.6, label='Actual Data')
+
+    # The regression line, predicted across the whole range of X
+    plt.plot(data['line_x'], data['line_y'], color='red', linewidth=2, label='Prediction Model')
+
+    plt.title(f'Marketing ROI Prediction (Accuracy: {score:.2f})')
+    plt.xlabel('Marketing Spend (₹)')
+    plt.ylabel('Revenue (₹)')
+    plt.legend()
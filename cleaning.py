@@ -0,0 +1,231 @@
+import pandas as pd
+import numpy as np
+import argparse
+import time
+import warnings
+
+# ==========================================
+# AMOUNT CLEANING (Fast Path)
+# The old way: astype(str).str.replace(',', '') + pd.to_numeric.
+# That turns EVERY value (even clean floats) into a Python string and back.
+# The fast way: real numbers go straight to float64,
+# and only the text cells ('12,000', '₹5,000') are stripped and parsed.
+# ==========================================
+
+# Characters that decorate a number without changing it
+CURRENCY_JUNK = r'[,\s₹$]'
+
+def parse_amounts(series):
+    """
+    Turns a dirty amount column (12000, '15,000', '₹5,000', NaN, 'abc') into floats.
+    Returns (clean_series, report) where report counts:
+      numeric - values that were already numbers
+      coerced - text values converted to numbers ('12,000' -> 12000.0)
+      invalid - values that could not be read and became NaN
+      missing - values that were NaN/None to begin with
+    """
+    # Fast path 1: the column is already numeric, nothing to parse
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        clean = series.astype('float64')
+        missing = int(clean.isna().sum())
+        report = {'numeric': len(clean) - missing, 'coerced': 0, 'invalid': 0, 'missing': missing}
+        return clean, report
+
+    # Fast path 2: split the column into real numbers and text cells.
+    # Numbers go straight to float64 (no string round trip),
+    # only the text cells get separators stripped and parsed.
+    raw = series.to_numpy(dtype=object)
+    is_text = np.frompyfunc(type, 1, 1)(raw) == str
+    values = np.empty(len(raw), dtype='float64')
+    try:
+        values[~is_text] = raw[~is_text].astype('float64')
+        # Only None/NaN can come out of a plain number as NaN
+        missing_mask = np.isnan(values) & ~is_text
+    except (TypeError, ValueError):
+        # Odd objects (dates, lists...) take the slow, forgiving route
+        values[~is_text] = pd.to_numeric(pd.Series(raw[~is_text]), errors='coerce').to_numpy(dtype='float64')
+        missing_mask = series.isna().to_numpy()
+
+    text = pd.Series(raw[is_text], dtype=object).str.replace(CURRENCY_JUNK, '', regex=True)
+    values[is_text] = pd.to_numeric(text, errors='coerce').to_numpy(dtype='float64')
+
+    failed = np.isnan(values) & ~missing_mask
+    report = {
+        'numeric': int((~is_text & ~missing_mask & ~failed).sum()),
+        'coerced': int((is_text & ~failed).sum()),
+        'invalid': int(failed.sum()),
+        'missing': int(missing_mask.sum()),
+    }
+    return pd.Series(values, index=series.index, name=series.name), report
+
+def print_report(column, report):
+    """
+    One-line summary of what parse_amounts did to a column.
+    """
+    print(f">> {column}: {report['numeric']} numeric, {report['coerced']} coerced, "
+          f"{report['invalid']} invalid, {report['missing']} missing")
+
+# ==========================================
+# DATE NORMALIZATION (Format Detection + Caching)
+# pd.to_datetime(errors='coerce') on a mixed column guesses one format,
+# reads '01/02/2025' month-first (or not at all) and crawls through the rest.
+# Deposit dates repeat a lot, so we parse each DISTINCT string once,
+# grouped by its detected format, and broadcast the results back.
+# ==========================================
+
+# Pattern -> strptime format. Slash dates are Indian style: DD/MM/YYYY
+DATE_FORMATS = {
+    r'^\d{4}-\d{2}-\d{2}$': '%Y-%m-%d',
+    r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$': '%Y-%m-%d %H:%M:%S',
+    r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$': '%Y-%m-%dT%H:%M:%S',
+    r'^\d{1,2}/\d{1,2}/\d{4}$': '%d/%m/%Y',
+    r'^\d{1,2}-\d{1,2}-\d{4}$': '%d-%m-%Y',
+}
+
+def normalize_dates(series, formats=None, cache=None):
+    """
+    Parses a mixed-format date column into datetime64.
+    Returns (dates, rejected) where 'rejected' is a DataFrame of the rows
+    that became NaT: their original value and why ('unknown format' or
+    'invalid date', e.g. 31/02/2025). Missing values are not rejected.
+
+    'cache' is an optional dict {string: (Timestamp or NaT, reason)} that is
+    read and filled in, so chunk after chunk of a big file only parses new strings.
+    """
+    formats = DATE_FORMATS if formats is None else formats
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series, pd.DataFrame({'value': [], 'reason': []})
+
+    # 1. Every distinct value once (codes = -1 for NaN/None)
+    codes, uniques = pd.factorize(series)
+    uniques = pd.Series(uniques, dtype=object)
+    parsed = pd.Series(pd.NaT, index=uniques.index, dtype='datetime64[ns]')
+    reason = pd.Series('unknown format', index=uniques.index, dtype=object)
+
+    todo = np.ones(len(uniques), dtype=bool)
+    if cache:
+        for i, value in enumerate(uniques):
+            hit = cache.get(value)
+            if hit is not None:
+                parsed.iat[i], reason.iat[i] = hit
+                todo[i] = False
+
+    # 2. Detect the format of each new distinct value, then parse each group in one pass
+    text = uniques.where(uniques.map(type) == str)
+    for pattern, fmt in formats.items():
+        group = todo & text.str.match(pattern, na=False).to_numpy()
+        if group.any():
+            parsed[group] = pd.to_datetime(text[group], format=fmt, errors='coerce')
+            reason[group] = np.where(parsed[group].isna(), 'invalid date', None)
+            todo &= ~group
+
+    # Real date objects (datetime, Timestamp) need no format
+    objects = todo & text.isna().to_numpy()
+    if objects.any():
+        parsed[objects] = pd.to_datetime(uniques[objects], errors='coerce')
+        reason[objects] = np.where(parsed[objects].isna(), 'invalid date', None)
+
+    if cache is not None:
+        cache.update(zip(uniques, zip(parsed, reason)))
+
+    # 3. Broadcast back to every row (code -1 = missing, lands on the extra NaT/None slot)
+    parsed = np.append(parsed.to_numpy(), np.datetime64('NaT'))
+    reason = np.append(reason.to_numpy(), None)
+    dates = pd.Series(parsed.take(codes), index=series.index, name=series.name)
+
+    row_reason = reason.take(codes)
+    bad = pd.notna(row_reason)
+    rejected = pd.DataFrame({'value': series[bad], 'reason': row_reason[bad]})
+    return dates, rejected
+
+# ==========================================
+# BENCHMARK: OLD WAY vs FAST PATH
+# python cleaning.py --what amounts dates --rows 1000000 10000000
+# ==========================================
+def make_dirty_amounts(n_rows, seed=42):
+    """
+    Mock 'amount' column: mostly numbers, some '12,000' text, NaNs and junk.
+    """
+    rng = np.random.default_rng(seed)
+    amounts = rng.integers(1000, 100000, n_rows).astype(object)
+    kind = rng.random(n_rows)
+    text = kind < 0.10
+    amounts[text] = [f"{v:,}" for v in amounts[text]]
+    amounts[(kind >= 0.10) & (kind < 0.13)] = np.nan
+    amounts[(kind >= 0.13) & (kind < 0.14)] = 'Invalid'
+    return pd.Series(amounts, name='amount')
+
+def old_parse(series):
+    series = series.astype(str).str.replace(',', '')
+    return pd.to_numeric(series, errors='coerce')
+
+def benchmark(n_rows, repeats=3):
+    series = make_dirty_amounts(n_rows)
+
+    old_times, new_times = [], []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        expected = old_parse(series)
+        old_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        result, report = parse_amounts(series)
+        new_times.append(time.perf_counter() - start)
+
+    assert np.array_equal(expected.to_numpy(dtype='float64'), result.to_numpy(), equal_nan=True)
+    old_best, new_best = min(old_times), min(new_times)
+    print(f"{n_rows:>12,} rows | old: {old_best:8.3f}s | fast: {new_best:8.3f}s | "
+          f"{old_best / new_best:5.1f}x faster")
+    print_report('amount', report)
+
+def make_dirty_dates(n_rows, n_days=2000, seed=42):
+    """
+    Mock 'deposit_date' column: ISO and DD/MM/YYYY strings that repeat a lot, plus junk.
+    """
+    rng = np.random.default_rng(seed)
+    days = pd.date_range('2020-01-01', periods=n_days, freq='D')
+    pool = np.concatenate([
+        days.strftime('%Y-%m-%d').to_numpy(dtype=object),
+        days.strftime('%d/%m/%Y').to_numpy(dtype=object),
+        np.array(['Invalid_Date', 'N/A', '31/02/2025'], dtype=object),
+    ])
+    return pd.Series(pool[rng.integers(0, len(pool), n_rows)], name='deposit_date')
+
+def benchmark_dates(n_rows, repeats=3):
+    series = make_dirty_dates(n_rows)
+
+    old_times, new_times = [], []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        with warnings.catch_warnings():
+            # pandas warns that it could not infer one format for the column
+            warnings.simplefilter('ignore')
+            expected = pd.to_datetime(series, errors='coerce')
+        old_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        result, rejected = normalize_dates(series)
+        new_times.append(time.perf_counter() - start)
+
+    old_best, new_best = min(old_times), min(new_times)
+    print(f"{n_rows:>12,} rows | old: {old_best:8.3f}s | fast: {new_best:8.3f}s | "
+          f"{old_best / new_best:5.1f}x faster")
+    print(f">> deposit_date: old NaT {int(expected.isna().sum()):,} | "
+          f"new NaT {int(result.isna().sum()):,} ({len(rejected):,} rejected)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark the cleaning fast paths against the old pandas calls')
+    parser.add_argument('--what', nargs='+', choices=['amounts', 'dates'], default=['amounts', 'dates'])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000, 10_000_000])
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    if 'amounts' in args.what:
+        print("--- SYSTEM: BENCHMARKING AMOUNT CLEANING ---")
+        for n_rows in args.rows:
+            benchmark(n_rows, args.repeats)
+
+    if 'dates' in args.what:
+        print("--- SYSTEM: BENCHMARKING DATE NORMALIZATION ---")
+        for n_rows in args.rows:
+            benchmark_dates(n_rows, args.repeats)
@@ -0,0 +1,345 @@
+import pandas as pd
+import numpy as np
+import argparse
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import pickle
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from instrumentation import RECORDER
+
+# ==========================================
+# STAGE DAG (Fingerprinted, Cached, Concurrent)
+# A pipeline is a set of STAGES: name, function, the stages it reads from.
+# Each stage's result is stored on disk under a FINGERPRINT:
+#   sha256(stage name + function source + version + params
+#          + the content hash of every input)
+# so a rerun skips every stage whose code and inputs are unchanged, and a
+# stage whose output comes out identical stops the change from spreading.
+# DataFrames are stored as Parquet, anything else as a pickle. Files a stage
+# writes as a side effect (a chart) are copied into the cache too: a cache
+# hit puts back any that were since overwritten or deleted.
+# Only the stages the requested targets need are looked at (lazy), and
+# stages whose inputs are ready run side by side in a process pool; they
+# hand results to each other through the cache directory. Stage metrics
+# recorded in a worker (instrumentation.RECORDER) are sent back to the parent.
+# ==========================================
+
+CACHE_DIR = '.stage_cache'
+
+class Stage:
+    """
+    func(*inputs) -> output. 'inputs' are stage names.
+    version - bump it when code the stage CALLS changes (only func's own source is hashed)
+    params  - extra values that change the result (a file path and its mtime, a setting)
+    files   - paths the stage writes as a side effect; a cache hit restores them
+    """
+
+    def __init__(self, name, func, inputs=(), version='', params=None, files=()):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.version = version
+        self.params = params or {}
+        self.files = tuple(files)
+
+    def code_hash(self):
+        func, bound = self.func, []
+        while isinstance(func, functools.partial):
+            bound.append(repr((func.args, sorted(func.keywords.items()))))
+            func = func.func
+        try:
+            source = inspect.getsource(func)
+        except (OSError, TypeError):
+            source = f'{func.__module__}.{func.__qualname__}'
+        return hashlib.sha256(f'{source}\n{bound}\n{self.version}'.encode()).hexdigest()
+
+    def fingerprint(self, input_hashes):
+        spec = {'stage': self.name, 'code': self.code_hash(), 'inputs': input_hashes,
+                'params': self.params}
+        return hashlib.sha256(json.dumps(spec, sort_keys=True, default=repr).encode()).hexdigest()
+
+def code_version(*objects):
+    """
+    A version string from the source of the functions / modules a stage relies on,
+    e.g. Stage(..., version=code_version(cleaning)): editing them reruns the stage.
+    """
+    digest = hashlib.sha256()
+    for obj in objects:
+        digest.update(inspect.getsource(obj).encode())
+    return digest.hexdigest()[:16]
+
+def module_version(*names):
+    """
+    code_version() for modules by name, hashing their source files without
+    importing them (a cached stage shouldn't pay for loading matplotlib).
+    """
+    digest = hashlib.sha256()
+    for name in names:
+        spec = importlib.util.find_spec(name)
+        if spec is None or not spec.origin or not os.path.isfile(spec.origin):
+            raise ImportError(f"no source file for module '{name}'")
+        with open(spec.origin, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+def content_hash(value):
+    """
+    Hash of a stage output's content (what downstream fingerprints are built from).
+    """
+    digest = hashlib.sha256()
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        labels = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+        dtypes = list(value.dtypes) if isinstance(value, pd.DataFrame) else [value.dtype]
+        digest.update(repr((type(value).__name__, labels, [str(t) for t in dtypes])).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.shape, str(value.dtype))).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    else:
+        digest.update(pickle.dumps(value))
+    return digest.hexdigest()
+
+def _store(value, base):
+    """
+    Writes an output next to 'base' (Parquet for DataFrames, pickle otherwise).
+    """
+    if isinstance(value, pd.DataFrame) and all(isinstance(c, str) for c in value.columns):
+        path, tmp = base + '.parquet', base + '.parquet.tmp'
+        try:
+            value.to_parquet(tmp)
+            os.replace(tmp, path)
+            return path
+        except (ImportError, TypeError, ValueError, NotImplementedError):
+            # No pyarrow, or columns Parquet can't hold (e.g. raw mixed text/number cells)
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    path, tmp = base + '.pkl', base + '.pkl.tmp'
+    with open(tmp, 'wb') as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    return path
+
+def _load(path):
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _save_file(path, cache_dir):
+    """
+    Copies a side-effect file into the cache under its content hash; returns the copy's path.
+    """
+    saved = os.path.join(cache_dir, _file_hash(path) + os.path.splitext(path)[1])
+    if not os.path.exists(saved):
+        shutil.copyfile(path, saved + '.tmp')
+        os.replace(saved + '.tmp', saved)
+    return saved
+
+def _restore_files(files):
+    """
+    Makes every {path: saved copy} match its copy. False if a copy is gone.
+    """
+    for path, saved in files.items():
+        if not os.path.exists(saved):
+            return False
+        if not os.path.exists(path) or _file_hash(path) != os.path.splitext(os.path.basename(saved))[0]:
+            shutil.copyfile(saved, path + '.tmp')
+            os.replace(path + '.tmp', path)
+    return True
+
+def _execute(stage, input_paths, key, cache_dir):
+    """
+    Runs one stage (here or in a worker): loads its inputs from the cache,
+    stores its output. Returns the cache entry (small: no data).
+    """
+    inputs = [_load(path) for path in input_paths]
+    start = time.perf_counter()
+    value = stage.func(*inputs)
+    seconds = time.perf_counter() - start
+    entry = {'stage': stage.name, 'key': key, 'hash': content_hash(value), 'seconds': seconds,
+             'path': _store(value, os.path.join(cache_dir, key)),
+             'files': {path: _save_file(path, cache_dir) for path in stage.files}}
+    meta = os.path.join(cache_dir, key + '.json')
+    with open(meta + '.tmp', 'w') as f:
+        json.dump(entry, f)
+    os.replace(meta + '.tmp', meta)  # metadata last: an entry is complete or absent
+    return entry
+
+def _start_worker(settings):
+    """
+    Pool initializer: record stage metrics like the parent does (any start method).
+    """
+    RECORDER.records = []
+    if settings:
+        RECORDER.configure(**settings)
+
+def _execute_in_worker(*task):
+    """
+    _execute() in a pool worker: also returns the metrics records it made.
+    """
+    start = len(RECORDER.records)
+    entry = _execute(*task)
+    return entry, RECORDER.records[start:]
+
+class Pipeline:
+    """
+    A DAG of Stages. run(targets) brings the targets up to date and returns their values.
+    workers - stages run at the same time (None = CPU count, 1 = in this process)
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, workers=None):
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.stages = {}
+        self.status = {}
+        self.entries = {}
+
+    def add(self, name, func, inputs=(), **options):
+        for upstream in inputs:
+            if upstream not in self.stages:
+                raise ValueError(f"stage '{name}' reads '{upstream}', which is not defined (add stages in order)")
+        self.stages[name] = Stage(name, func, inputs, **options)
+        return self.stages[name]
+
+    def stage(self, name=None, inputs=(), **options):
+        """
+        Decorator form of add(): @pipeline.stage(inputs=['clean']).
+        """
+        def register(func):
+            self.add(name or func.__name__, func, inputs, **options)
+            return func
+        return register
+
+    def needed(self, targets):
+        """
+        The targets and everything upstream of them, in dependency order.
+        """
+        order, seen = [], set()
+
+        def visit(name):
+            if name in seen:
+                return
+            seen.add(name)
+            for upstream in self.stages[name].inputs:
+                visit(upstream)
+            order.append(name)
+        for target in targets:
+            if target not in self.stages:
+                raise KeyError(f"unknown stage '{target}'")
+            visit(target)
+        return order
+
+    def _cached(self, key, stage):
+        meta = os.path.join(self.cache_dir, key + '.json')
+        if not os.path.exists(meta):
+            return None
+        with open(meta) as f:
+            entry = json.load(f)
+        if not os.path.exists(entry['path']):
+            return None
+        # The files on disk may come from a later run of something else (same name, other data)
+        files = entry.get('files', {})
+        if set(files) != set(stage.files) or not _restore_files(files):
+            return None
+        return entry
+
+    def run(self, targets=None, force=()):
+        """
+        Brings 'targets' (default: every stage) up to date and returns {target: value}.
+        'force' stages run even if cached. self.status says what ran: {stage: 'ran' | 'cached'}.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        order = self.needed(targets or list(self.stages))
+        entries, self.status = {}, {}
+        pending = list(order)
+        workers = min(self.workers or os.cpu_count() or 1, len(order))
+        pool = None
+        if workers > 1:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_start_worker,
+                                       initargs=(RECORDER.settings(),))
+        running = {}
+        try:
+            while pending or running:
+                # Everything whose inputs are known: a cache hit, or ready to run
+                for name in [n for n in pending if all(u in entries for u in self.stages[n].inputs)]:
+                    stage = self.stages[name]
+                    key = stage.fingerprint([entries[u]['hash'] for u in stage.inputs])
+                    entry = None if name in force else self._cached(key, stage)
+                    pending.remove(name)
+                    if entry is not None:
+                        entries[name], self.status[name] = entry, 'cached'
+                        continue
+                    task = (stage, [entries[u]['path'] for u in stage.inputs], key, self.cache_dir)
+                    if pool is None:
+                        entries[name], self.status[name] = _execute(*task), 'ran'
+                    else:
+                        running[pool.submit(_execute_in_worker, *task)] = name
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        entries[name], records = future.result()
+                        self.status[name] = 'ran'
+                        RECORDER.extend(records)
+                elif pending and not any(all(u in entries for u in self.stages[n].inputs) for n in pending):
+                    raise RuntimeError(f"stages can't run: {pending}")
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        self.entries = entries
+        return {name: _load(entries[name]['path']) for name in (targets or order)}
+
+    def report(self):
+        """
+        One line per stage of the last run: ran / cached and how long it took when it ran.
+        """
+        return pd.DataFrame([{'stage': name, 'status': status,
+                              'seconds': self.entries[name]['seconds'] if status == 'ran' else 0.0}
+                             for name, status in self.status.items()])
+
+# ==========================================
+# DEMO: python dag.py (run twice: the second run is all cache hits)
+# ==========================================
+def _demo_numbers(n):
+    return pd.DataFrame({'x': np.arange(n, dtype=np.float64)})
+
+def _demo_square(df):
+    return df.assign(y=df['x'] ** 2)
+
+def _demo_total(df):
+    return float(df['y'].sum())
+
+def _demo_mean(df):
+    return float(df['y'].mean())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Stage DAG demo')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--force', nargs='*', default=[], help='Stages to rerun even if cached')
+    args = parser.parse_args()
+
+    print("--- SYSTEM: RUNNING STAGE DAG ---")
+    pipeline = Pipeline(workers=args.workers)
+    pipeline.add('numbers', functools.partial(_demo_numbers, args.rows))
+    pipeline.add('square', _demo_square, ['numbers'])
+    pipeline.add('total', _demo_total, ['square'])
+    pipeline.add('mean', _demo_mean, ['square'])
+    start = time.perf_counter()
+    results = pipeline.run(['total', 'mean'], force=args.force)
+    print(pipeline.report().to_string(index=False))
+    print(f">> total={results['total']:.6g} mean={results['mean']:.6g} in {time.perf_counter() - start:.2f}s")
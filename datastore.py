@@ -0,0 +1,254 @@
+import pandas as pd
+import numpy as np
+import argparse
+import os
+import shutil
+import time
+from collections import OrderedDict
+
+# pyarrow is imported on first use (_require_arrow), not when this module is
+pa = ds = None
+
+# ==========================================
+# COLUMNAR DATA LAYER (Partitioned Parquet via Arrow)
+# The day scripts build their tables from inline dicts. Real history lives
+# in Parquet datasets: directories of files, optionally hive-partitioned
+# (<root>/day=2025-03-01/part-0.parquet). read():
+#   - decodes only the requested COLUMNS
+#   - turns FILTERS like [('Status', '==', 'Completed'), ('Date', '>=', ...)]
+#     into an Arrow expression: partition directories that can't match are
+#     never opened, and row groups whose min/max statistics can't match are
+#     never decoded (write() sorts rows so those statistics are tight)
+#   - keeps recently decoded frames in an LRU cache, keyed by the query and
+#     the dataset's file list / sizes / mtimes (a rewrite invalidates it)
+# ==========================================
+
+DEFAULT_ROOT = 'aurum_data'
+
+OPERATORS = {
+    '==': lambda f, v: f == v, '!=': lambda f, v: f != v,
+    '<': lambda f, v: f < v, '<=': lambda f, v: f <= v,
+    '>': lambda f, v: f > v, '>=': lambda f, v: f >= v,
+    'in': lambda f, v: f.isin(list(v)), 'not in': lambda f, v: ~f.isin(list(v)),
+}
+
+def _require_arrow():
+    global pa, ds
+    if ds is None:
+        try:
+            import pyarrow as pa
+            import pyarrow.dataset as ds
+        except ImportError:
+            raise ImportError("pyarrow is required for Parquet datasets (pip install pyarrow)") from None
+
+def _scalar(value):
+    # Timestamps/dates compare against Arrow timestamp columns as plain datetimes
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).to_pydatetime()
+    return value.item() if isinstance(value, np.generic) else value
+
+def to_expression(filters):
+    """
+    [(column, op, value), ...] (all must hold) -> Arrow filter expression, or None.
+    """
+    if not filters:
+        return None
+    _require_arrow()
+    expression = None
+    for column, op, value in filters:
+        if op not in OPERATORS:
+            raise ValueError(f"unknown operator '{op}' (use one of {sorted(OPERATORS)})")
+        value = [_scalar(v) for v in value] if op in ('in', 'not in') else _scalar(value)
+        term = OPERATORS[op](ds.field(column), value)
+        expression = term if expression is None else expression & term
+    return expression
+
+def fingerprint(path):
+    """
+    (file, size, mtime) of every file under 'path': changes whenever the data does.
+    """
+    if os.path.isfile(path):
+        stat = os.stat(path)
+        return ((path, stat.st_size, stat.st_mtime_ns),)
+    files = []
+    for folder, _, names in os.walk(path):
+        for name in names:
+            stat = os.stat(os.path.join(folder, name))
+            files.append((os.path.relpath(os.path.join(folder, name), path), stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(files))
+
+class DataStore:
+    """
+    Named Parquet datasets under one root directory.
+    A name may also be a path to any Parquet file or dataset directory.
+    cache_size - how many decoded frames to keep in memory (0 = no cache)
+    """
+
+    def __init__(self, root=DEFAULT_ROOT, cache_size=8):
+        self.root = root
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = self.misses = 0
+
+    def path(self, name):
+        return name if os.path.exists(name) else os.path.join(self.root, name)
+
+    def exists(self, name):
+        return os.path.exists(self.path(name))
+
+    def write(self, name, df, partition_by=None, sort_by=None, mode='overwrite', row_group_size=128_000):
+        """
+        Writes a frame as a Parquet dataset (hive-partitioned on 'partition_by').
+        Rows are sorted on 'sort_by' first, so each row group covers a narrow
+        range and filters on those columns skip most of them.
+        mode='overwrite' replaces the dataset (swapped in atomically),
+        mode='append' only adds new files (uniquely named) next to the existing ones.
+        """
+        _require_arrow()
+        if mode not in ('overwrite', 'append'):
+            raise ValueError(f"unknown mode '{mode}' (use 'overwrite' or 'append')")
+        if sort_by:
+            df = df.sort_values(sort_by, kind='stable')
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        partitioning = None
+        if partition_by:
+            partitioning = ds.partitioning(pa.schema([table.schema.field(c) for c in partition_by]), flavor='hive')
+
+        path = self.path(name)
+        replace = mode == 'overwrite' and os.path.exists(path)
+        destination = path + '.tmp' if replace else path
+        if replace:
+            shutil.rmtree(destination, ignore_errors=True)
+        ds.write_dataset(table, destination, format='parquet', partitioning=partitioning,
+                         max_rows_per_group=row_group_size, min_rows_per_group=max(min(row_group_size, len(df)), 1),
+                         basename_template=f'part-{time.time_ns()}-{{i}}.parquet',
+                         existing_data_behavior='overwrite_or_ignore')
+        if replace:
+            # Built next to the old dataset, then swapped in: readers never see half of it
+            os.replace(path, path + '.old')
+            os.replace(destination, path)
+            shutil.rmtree(path + '.old', ignore_errors=True)
+        return path
+
+    def dataset(self, name):
+        _require_arrow()
+        return ds.dataset(self.path(name), format='parquet', partitioning='hive')
+
+    def read(self, name, columns=None, filters=None):
+        """
+        The rows matching 'filters', only 'columns', as a DataFrame.
+        The result may be shared with the cache: it is a copy-on-write view,
+        so changing it never changes what the next read returns.
+        """
+        path = self.path(name)
+        key = (os.path.abspath(path), tuple(columns) if columns else None, repr(filters), fingerprint(path))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return cached.copy(deep=False)
+
+        self.misses += 1
+        table = self.dataset(name).to_table(columns=list(columns) if columns else None,
+                                            filter=to_expression(filters))
+        frame = table.to_pandas()
+        if self.cache_size:
+            # Older entries for the same query (before the data changed) are dead weight
+            for stale in [k for k in self._cache if k[:3] == key[:3]]:
+                del self._cache[stale]
+            self._cache[key] = frame
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return frame.copy(deep=False)
+
+    def batches(self, name, columns=None, filters=None, batch_size=100_000):
+        """
+        Same query as read(), as DataFrames of at most 'batch_size' rows (not cached).
+        """
+        scanner = self.dataset(name).scanner(columns=list(columns) if columns else None,
+                                             filter=to_expression(filters), batch_size=batch_size)
+        for batch in scanner.to_batches():
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+# The store the day scripts read through
+STORE = DataStore()
+
+def read(name, columns=None, filters=None):
+    """
+    STORE.read(): a Parquet file/dataset path, or a dataset name under DEFAULT_ROOT.
+    """
+    return STORE.read(name, columns, filters)
+
+def date_filters(column, start=None, end=None):
+    """
+    [(column, '>=', start), (column, '<=', end)] for the bounds that are given.
+    """
+    filters = []
+    if start is not None:
+        filters.append((column, '>=', pd.Timestamp(start)))
+    if end is not None:
+        filters.append((column, '<=', pd.Timestamp(end)))
+    return filters
+
+def make_history(days, rows_per_day, start='2024-01-01', seed=42):
+    """
+    Synthetic day8-style transactions with a Date, 'rows_per_day' per day.
+    """
+    rng = np.random.default_rng(seed)
+    n = days * rows_per_day
+    day_index = np.repeat(np.arange(days), rows_per_day)
+    seconds = rng.integers(0, 86_400, n)
+    dates = pd.Timestamp(start) + pd.to_timedelta(day_index, unit='D') + pd.to_timedelta(seconds, unit='s')
+    return pd.DataFrame({
+        'Transaction_ID': np.arange(1001, 1001 + n),
+        'Date': dates,
+        'day': pd.date_range(start, periods=days).strftime('%Y-%m-%d').to_numpy()[day_index],
+        'Client_Name': rng.choice(['Ankit', 'Rohan', 'Priya', 'Amit', 'Neha', 'Sonal'], n),
+        'City': rng.choice(['Korba', 'Raipur', 'Bilaspur', 'Durg'], n),
+        'Asset_Class': rng.choice(['Gold', 'Equity', 'Mutual Fund'], n),
+        'Amount': rng.integers(5000, 60000, n),
+        'Status': rng.choice(['Completed', 'Pending', 'Failed'], n, p=[0.85, 0.1, 0.05]),
+    })
+
+# ==========================================
+# BENCHMARK: one day out of a long history
+# python datastore.py --days 365 --rows-per-day 20000
+# ==========================================
+if __name__ == "__main__":
+    import tempfile
+
+    parser = argparse.ArgumentParser(description='Daily slice of a partitioned history vs reading it all')
+    parser.add_argument('--days', type=int, default=180)
+    parser.add_argument('--rows-per-day', type=int, default=20_000)
+    args = parser.parse_args()
+
+    print("--- SYSTEM: BENCHMARKING THE PARQUET DATA LAYER ---")
+    store = DataStore(tempfile.mkdtemp())
+    history = make_history(args.days, args.rows_per_day)
+    start = time.perf_counter()
+    store.write('history', history, partition_by=['day'], sort_by=['Status', 'Date'])
+    print(f">> Wrote {len(history):,} rows ({args.days} day partitions) in {time.perf_counter() - start:.2f}s")
+
+    day = history['day'].iloc[len(history) // 2]
+    columns = ['Client_Name', 'Amount', 'Status']
+    query = [('day', '==', day), ('Status', '==', 'Completed')]
+
+    def timed(label, func):
+        start = time.perf_counter()
+        result = func()
+        print(f"  {label:<46} {time.perf_counter() - start:8.3f}s  {len(result):>10,} rows")
+        return result
+
+    full = timed("read everything, filter in pandas", lambda: (
+        lambda df: df[(df['day'] == day) & (df['Status'] == 'Completed')][columns])(pd.read_parquet(store.path('history'))))
+    sliced = timed("partition + column + predicate pushdown", lambda: store.read('history', columns, query))
+    cached = timed("same query again (decoded-frame cache)", lambda: store.read('history', columns, query))
+    dated = timed("Date range inside the day (row-group stats)", lambda: store.read(
+        'history', columns, [('day', '==', day)] + date_filters('Date', day + ' 09:00', day + ' 10:00')))
+
+    same = full.sort_values(columns).reset_index(drop=True).equals(
+        sliced.sort_values(columns).reset_index(drop=True).astype(full.dtypes))
+    print(f">> Slice matches the full scan: {same}  (cache hits: {store.hits})")
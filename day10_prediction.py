@@ -1,10 +1,11 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
+from model_service import LinearModel, ModelService
+from rendering import Chart, render
+from downsample import density_grid, SCATTER_LIMIT
+import charts
 
 print("--- SYSTEM: INITIALIZING ML PREDICTION ENGINE ---")
 
@@ -35,8 +36,11 @@ y = df['Revenue']
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
 # 4. TRAIN THE MODEL (The "Learning" Phase)
-model = LinearRegression()
+# Same least squares as sklearn's LinearRegression, but it keeps its statistics,
+# so it can be saved, served and updated with new months without a refit
+model = LinearModel()
 model.fit(X_train, y_train)
+ModelService().save('revenue', model)
 
 print("\n--- TRAINING COMPLETE ---")
 print(f"Intercept (Base Revenue without Ads): ₹{model.intercept_:.2f}")
@@ -53,26 +57,24 @@ score = r2_score(y_test, y_pred)
 print(f"\n>> Model Accuracy (R2 Score): {score:.2f}")
 
 # 7. VISUALIZE THE "GOD LINE"
-plt.figure(figsize=(10, 6))
-sns.scatterplot(x='Marketing_Spend', y='Revenue', data=df, color='blue', alpha=0.6, label='Actual Data')
-
 # Plot the Regression Line
 # We predict across the whole range of X to draw the line
 line_X = np.linspace(df['Marketing_Spend'].min(), df['Marketing_Spend'].max(), 100).reshape(-1, 1)
 line_y = model.predict(pd.DataFrame(line_X, columns=['Marketing_Spend']))
-plt.plot(line_X, line_y, color='red', linewidth=2, label='Prediction Model')
-
-plt.title(f'Marketing ROI Prediction (Accuracy: {score:.2f})')
-plt.xlabel('Marketing Spend (₹)')
-plt.ylabel('Revenue (₹)')
-plt.legend()
 
-# SAVE with correct prefix
-plt.savefig('day10_revenue_prediction.png', dpi=300)
+# SAVE with correct prefix (scatter + line drawn by charts.revenue_fit, headless and cached)
+# (years of per-campaign rows are drawn as a density map instead of one marker each)
+plot_data = {'line_x': line_X, 'line_y': line_y}
+if len(df) > SCATTER_LIMIT:
+    plot_data['density'] = density_grid(df['Marketing_Spend'], df['Revenue'])
+else:
+    plot_data['df'] = df
+render(Chart(charts.revenue_fit, plot_data, 'day10_revenue_prediction.png', figsize=(10, 6), score=score))
 print("\n>> Plot saved as 'day10_revenue_prediction.png'")
 
 # 8. REAL WORLD TEST
 # "Dad asks: If I spend 75,000 next month, what happens?"
+# (Next time, no refit needed: python model_service.py revenue 75000)
 future_spend = pd.DataFrame({'Marketing_Spend': [75000]})
 future_pred = model.predict(future_spend)
 print(f"\n>> PREDICTION: If you spend ₹75,000, predicted revenue is ₹{future_pred[0]:,.2f}")
\ No newline at end of file
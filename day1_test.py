@@ -1,5 +1,4 @@
 import pandas as pd
-import numpy as np
 
 def create_data():
     # Create a DataFrame with sample data
@@ -1,18 +1,15 @@
-import sqlite3
-import pandas as pd
+import argparse
+from analytics_store import AnalyticsStore, DEFAULT_PATH
 
-# 1. Setup the "In-Memory" Database
-conn = sqlite3.connect(':memory:')
+parser = argparse.ArgumentParser(description='SQL window functions on the analytics store')
+parser.add_argument('--db', default=DEFAULT_PATH, help='SQLite file (kept between runs)')
+parser.add_argument('--chunksize', type=int, default=50_000, help='Rows fetched from the cursor at a time')
+args = parser.parse_args()
 
-# 2. Create a Dummy Table
-conn.execute('''
- CREATE TABLE employees (
- id INTEGER PRIMARY KEY,
- name TEXT,
- department TEXT,
- salary INTEGER
- )
-''')
+# 1. Open the file-backed database (WAL mode, indexed, created on first run)
+store = AnalyticsStore(args.db)
+
+# 2. The employees table (id, name, department, salary) comes from the store's schema
 
 # 3. Insert Data (Notice duplicates in Sales to test Ranking)
 data = [
@@ -23,48 +20,30 @@ data = [
  (5, 'Sneha', 'Sales', 60000),
  (6, 'Vikram', 'Sales', 60000)
 ]
-conn.executemany('INSERT INTO employees VALUES (?,?,?,?)', data)
+store.load('employees', data, replace=True)  # one transaction
 
 print("--- SQL LAB INITIALIZED ---\n")
 
+def show(report, params=()):
+    # Chunks come straight off the cursor; fine to print them one by one at any size
+    for chunk in store.report(report, params, chunksize=args.chunksize):
+        print(chunk)
+
 # --- CHALLENGE 1: RANKING ---
 # Question: Rank employees by salary inside their department.
 # If salaries are same, give same rank (Dense Rank).
-sql_rank = '''
- SELECT 
- name, 
- department, 
- salary,
- DENSE_RANK() OVER (PARTITION BY department ORDER BY salary DESC) as salary_rank
- FROM employees
-'''
 print("--- Output: Dense Rank ---")
-print(pd.read_sql_query(sql_rank, conn))
+show('dense_rank')
 print("\n")
 
 # --- CHALLENGE 2: GROWTH (LAG) ---
 # Question: Who earns more than the person listed just below them?
-sql_lag = '''
- SELECT 
- name,
- salary,
- LAG(salary, 1, 0) OVER (ORDER BY salary) as previous_person_salary,
- (salary - LAG(salary, 1, 0) OVER (ORDER BY salary)) as salary_diff
- FROM employees
-'''
 print("--- Output: Lead/Lag Analysis ---")
-print(pd.read_sql_query(sql_lag, conn))
+show('lag')
 
 # Get CTE with High earners
-sql_cte = '''
-with HighEarners AS (
-    Select * from employees
-    where salary > 75000 )
-Select * from HighEarners;
-'''
-
 print("\n--- Output: CTE High Earners ---")
-print(pd.read_sql_query(sql_cte, conn))
+show('high_earners', (75000,))
 
 # 4. Close the connection
-conn.close()
\ No newline at end of file
+store.close()
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 import time
+import kernels
 
 print("--- SYSTEM: GENERATING 500,000 MOCK TRADES ---")
 # 1. Create a massive dataset (Simulation of 5 Years of Aurum Wealth data)
@@ -46,6 +47,19 @@ end_time = time.time()
 vector_duration = end_time - start_time
 print(f"Time taken by Vectorization: {vector_duration:.4f} seconds")
 
+# ==========================================
+# METHOD 3: THE KERNEL WAY (kernels.py)
+# Logic: Same formula, written once, run on the raw arrays into one buffer
+# (Numba-compiled loop when numba is installed).
+# ==========================================
+print("\n--- METHOD 3: FORMULA KERNEL ---")
+start_time = time.time()
+
+df['profit_kernel'] = kernels.profit(df['amount'], df['interest_rate'])
+
+kernel_duration = time.time() - start_time
+print(f"Time taken by Kernel ({kernels.profit.backends[-1]}): {kernel_duration:.4f} seconds")
+
 # ==========================================
 # THE VERDICT
 # ==========================================
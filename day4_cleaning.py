@@ -1,5 +1,13 @@
 import pandas as pd
 import numpy as np
+import argparse
+from cleaning import parse_amounts, print_report, normalize_dates
+from dedup import drop_duplicates
+import datastore
+
+parser = argparse.ArgumentParser(description='Cleaning a messy client table')
+parser.add_argument('--data', help='Read the raw table from a Parquet file/dataset instead of the inline sample')
+args = parser.parse_args()
 
 print("--- SYSTEM: GENERATING DIRTY DATA ---")
 
@@ -11,8 +19,8 @@ data = {
     'status': ['Active', 'Active', 'Closed', 'Active', 'Active', 'active'] # Case sensitivity issue ('active' vs 'Active')
 }
 
-df = pd.read_csv("https://raw.githubusercontent.com/datasciencedojo/datasets/master/titanic.csv") # Just kidding, using our manual data
-df = pd.DataFrame(data)
+# Real exports come through the data layer (only these columns are decoded)
+df = datastore.read(args.data, columns=list(data)) if args.data else pd.DataFrame(data)
 
 print("\n--- 1. THE MESS (Raw Data) ---")
 print(df)
@@ -24,7 +32,8 @@ print(df.info())
 # ==========================================
 print("\n--- 2. REMOVING DUPLICATES ---")
 # If Ankit appears twice with exact same data, remove the copy.
-df = df.drop_duplicates()
+# (Row fingerprints, so the same code works chunk by chunk on huge dumps - see dedup.py)
+df = drop_duplicates(df)
 print(f"Duplicates removed. Rows remaining: {len(df)}")
 
 # ==========================================
@@ -33,8 +42,9 @@ print(f"Duplicates removed. Rows remaining: {len(df)}")
 print("\n--- 3. CLEANING NUMBERS ---")
 # '12,000' is text. We need to remove ',' and convert to float.
 # If we don't do this, math operations will fail.
-df['amount'] = df['amount'].astype(str).str.replace(',', '') # Remove comma
-df['amount'] = pd.to_numeric(df['amount'], errors='coerce') # Convert to number. 'coerce' turns errors into NaN
+# parse_amounts only touches the text cells; real numbers are left alone. Errors become NaN
+df['amount'], amount_report = parse_amounts(df['amount'])
+print_report('amount', amount_report)
 
 # FILL MISSING VALUES (Imputation)
 # Strategy: Fill missing amounts with the Median (safer than Mean)
@@ -48,7 +58,10 @@ print(df['amount'])
 # ==========================================
 print("\n--- 4. STANDARDISING DATES ---")
 # Convert everything to YYYY-MM-DD. Errors become NaT (Not a Time)
-df['deposit_date'] = pd.to_datetime(df['deposit_date'], errors='coerce')
+# '01/02/2025' is DD/MM/YYYY (1st Feb), not January 2nd
+df['deposit_date'], rejected_dates = normalize_dates(df['deposit_date'])
+print("Rejected dates:")
+print(rejected_dates)
 
 # Drop rows where Date is still unknown (if Date is critical)
 df = df.dropna(subset=['deposit_date'])
@@ -1,10 +1,27 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import argparse
+import functools
 import os
+from concurrent.futures import ProcessPoolExecutor
+from cleaning import parse_amounts
+from encoding import SharedVocabulary, VOCABULARY_PATH
+import kernels
+from instrumentation import RECORDER, instrumented
+from datastore import STORE, fingerprint
+from dag import Pipeline, code_version, module_version
+import cleaning
+
+# Codes for low-cardinality text columns, shared with the other scripts
+VOCABULARY = SharedVocabulary(VOCABULARY_PATH)
+
+# What the pipeline reads from a client book (Parquet inputs decode only these)
+RAW_COLUMNS = ['client_id', 'client_name', 'investment_amount', 'risk_level']
+
+REPORT_FILE = 'day6_Aurum_Risk_Analysis.png'
 
 # --- STEP 1: THE EXTRACTOR ---
+@instrumented
 def generate_mock_data():
     """
     Simulates fetching data from Aurum Wealth Database.
@@ -20,6 +37,14 @@ def generate_mock_data():
     return pd.DataFrame(data)
 
 # --- STEP 2: THE CLEANER ---
+def parse_amount(series):
+    """
+    Turns a dirty amount column ('15,000', 12000, NaN) into floats.
+    Anything that still isn't a number becomes NaN.
+    """
+    return parse_amounts(series)[0]
+
+@instrumented
 def clean_data(df):
     """
     Takes messy data, fixes numbers, fills NaNs.
@@ -27,62 +52,67 @@ def clean_data(df):
     print("[2/4] Cleaning Data...")
     
     # Fix 'investment_amount' (Remove commas, convert to number)
-    df['investment_amount'] = df['investment_amount'].astype(str).str.replace(',', '')
-    df['investment_amount'] = pd.to_numeric(df['investment_amount'], errors='coerce')
+    df['investment_amount'] = parse_amount(df['investment_amount'])
     
     # Fill Missing Values with Median
     median_val = df['investment_amount'].median()
     df['investment_amount'] = df['investment_amount'].fillna(median_val)
     
+    # Dictionary-encode risk_level, so the rate lookup indexes a table by its codes
+    df['risk_level'] = VOCABULARY.categorical(df['risk_level'], 'risk_level')
+    
     return df
 
 # --- STEP 3: THE ANALYST ---
+@instrumented
 def analyze_data(df):
     """
     Calculates projected returns based on Risk Level.
     """
     print("[3/4] Analyzing Portfolio...")
+    return project_returns(df)
+
+def project_returns(df):
+    """
+    The analyst's math without the progress print (reused chunk by chunk).
+    """
     
-    # Logic: High risk = 15%, Medium = 10%, Low = 6%
-    conditions = [
-        (df['risk_level'] == 'High'),
-        (df['risk_level'] == 'Medium'),
-        (df['risk_level'] == 'Low')
-    ]
-    values = [0.15, 0.10, 0.06]
-    
-    # Create 'expected_return_rate' column
-    df['return_rate'] = np.select(conditions, values)
+    # Create 'expected_return_rate' column: one table lookup per row (unknown levels get 0)
+    df['return_rate'] = kernels.lookup_rate(df['risk_level'], kernels.RISK_RATES)
     
-    # Vectorized Calculation (Day 3 Skill)
-    df['projected_profit'] = df['investment_amount'] * df['return_rate']
+    # Vectorized Calculation (Day 3 Skill), as a kernel
+    df['projected_profit'] = kernels.profit(df['investment_amount'], df['return_rate'])
     
     return df
 
 # --- STEP 4: THE ARTIST ---
-def generate_report(df):
+def summarize_risk(df):
+    """
+    Total projected profit per risk level (the numbers behind the chart).
+    """
+    return df.groupby('risk_level', observed=True)['projected_profit'].sum()
+
+@instrumented
+def generate_report(df, summary=None):
     """
     Creates a summary chart and saves it.
+    Pass a precomputed 'summary' (from summarize_risk) to skip the groupby,
+    which is how the streaming mode reports without holding every row.
     """
     print("[4/4] Generating Visual Report...")
     
-    # Setup
-    sns.set_theme(style="whitegrid")
-    plt.figure(figsize=(10, 6))
-    
     # Plot: Total Investment by Risk Level
     # We use 'groupby' to aggregate data before plotting
-    summary = df.groupby('risk_level')['projected_profit'].sum().reset_index()
+    if summary is None:
+        summary = summarize_risk(df)
+    summary = summary.sort_index().reset_index()
     
-    sns.barplot(data=summary, x='risk_level', y='projected_profit', palette='viridis')
-    
-    plt.title('Aurum Wealth: Projected Profit by Risk Profile', fontsize=14, fontweight='bold')
-    plt.ylabel('Total Projected Profit (INR)')
-    plt.xlabel('Risk Category')
-    
-    # Save
-    filename = 'day6_Aurum_Risk_Analysis.png'
-    plt.savefig(filename, dpi=300)
+    # Save (drawn headless by charts.risk_profit; an unchanged summary reuses the cached PNG)
+    # matplotlib/seaborn load here, not at import: the other stages never need them
+    from rendering import Chart, render
+    import charts
+    filename = REPORT_FILE
+    render(Chart(charts.risk_profit, summary, filename, figsize=(10, 6)))
     print(f">> Report saved as: {filename}")
     
     # Verify file exists
@@ -91,13 +121,462 @@ def generate_report(df):
     else:
         print(">> SYSTEM ERROR: File not found.")
 
+# ==========================================
+# STREAMING MODE (Out-of-Core)
+# Same four stages, but data flows through in fixed-size chunks,
+# so peak memory depends on --chunksize, not on the size of the client book.
+# ==========================================
+def read_chunks(source, chunksize):
+    """
+    Yields DataFrames of at most 'chunksize' rows.
+    'source' is a CSV path, a Parquet path, an in-memory DataFrame,
+    or a list of those (read one after another).
+    """
+    if isinstance(source, (list, tuple)):
+        for part in source:
+            yield from read_chunks(part, chunksize)
+        return
+
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize].copy()
+        return
+
+    if is_parquet(source):
+        yield from STORE.batches(source, RAW_COLUMNS, batch_size=chunksize)
+        return
+
+    for chunk in pd.read_csv(source, chunksize=chunksize):
+        yield chunk
+
+def is_parquet(source):
+    """
+    A Parquet file, or a directory holding a (partitioned) Parquet dataset
+    (at least one .parquet / .pq file; a folder of CSVs is not one).
+    """
+    source = str(source)
+    if os.path.isdir(source):
+        return any(name.endswith(('.parquet', '.pq')) for name, _, _ in fingerprint(source))
+    return source.endswith(('.parquet', '.pq'))
+
+def load_data(path):
+    """
+    Reads a whole CSV or Parquet file / dataset (the in-memory path).
+    Parquet goes through the data layer: only RAW_COLUMNS are decoded.
+    """
+    if isinstance(path, (list, tuple)):
+        return pd.concat([load_data(p) for p in path], ignore_index=True)
+    if is_parquet(path):
+        return STORE.read(path, RAW_COLUMNS)
+    return pd.read_csv(path)
+
+def _sortable_keys(values):
+    """
+    Maps float64 values to uint64 keys with the same ordering,
+    so we can histogram them 16 bits at a time (radix select).
+    """
+    bits = np.ascontiguousarray(values, dtype=np.float64).view(np.uint64)
+    negative = (bits >> np.uint64(63)).astype(bool)
+    return np.where(negative, ~bits, bits | np.uint64(1 << 63))
+
+def _key_to_float(key):
+    key = np.uint64(key)
+    if key >> np.uint64(63):
+        bits = key ^ np.uint64(1 << 63)
+    else:
+        bits = ~key
+    return float(np.array([bits], dtype=np.uint64).view(np.float64)[0])
+
+def _in_bucket(keys, prefix, shift):
+    if shift >= 64:
+        return np.ones(len(keys), dtype=bool)
+    return (keys >> np.uint64(shift)) == prefix
+
+def _histogram_pass(value_chunks, states):
+    """
+    One read of the source: a 65,536-bucket histogram of the next 16 bits
+    for every state, counting only keys still inside that state's bucket.
+    """
+    counts = [np.zeros(65536, dtype=np.int64) for _ in states]
+    for values in value_chunks:
+        keys = _sortable_keys(values[~np.isnan(values)])
+        for state, state_counts in zip(states, counts):
+            shift = state['shift'] - 16
+            keys_in = keys[_in_bucket(keys, state['prefix'], state['shift'])]
+            digits = ((keys_in >> np.uint64(shift)) & np.uint64(0xFFFF)).astype(np.intp)
+            state_counts += np.bincount(digits, minlength=65536)
+    return counts
+
+def _collect_pass(value_chunks, states):
+    """
+    One read of the source: pulls out the values left in each state's bucket.
+    """
+    parts = [[] for _ in states]
+    for values in value_chunks:
+        values = values[~np.isnan(values)]
+        keys = _sortable_keys(values)
+        for state, state_parts in zip(states, parts):
+            state_parts.append(values[_in_bucket(keys, state['prefix'], state['shift'])])
+    return [np.concatenate(state_parts) if state_parts else np.empty(0) for state_parts in parts]
+
+def _narrow(state, counts):
+    # Keep only the bucket that holds the k-th smallest value
+    below = np.cumsum(counts)
+    bucket = int(np.searchsorted(below, state['k'], side='right'))
+    if bucket > 0:
+        state['k'] -= int(below[bucket - 1])
+    state['shift'] -= 16
+    state['prefix'] = (np.uint64(state['prefix']) << np.uint64(16)) | np.uint64(bucket)
+    state['remaining'] = int(counts[bucket])
+
+def _median_search(histogram, collect, collect_limit):
+    """
+    The radix-select driver. 'histogram(states)' and 'collect(states)' run one
+    pass over the data; they are swapped out to run the passes serially or
+    across a process pool.
+    """
+    first = {'prefix': np.uint64(0), 'shift': 64}
+    counts = histogram([first])[0]
+    n = int(counts.sum())
+    if n == 0:
+        return np.nan
+
+    states = [{'k': k, 'prefix': np.uint64(0), 'shift': 64} for k in sorted({(n - 1) // 2, n // 2})]
+    for state in states:
+        _narrow(state, counts)
+
+    active = [s for s in states if s['shift'] > 0 and s['remaining'] > collect_limit]
+    while active:
+        for state, state_counts in zip(active, histogram(active)):
+            _narrow(state, state_counts)
+        active = [s for s in states if s['shift'] > 0 and s['remaining'] > collect_limit]
+
+    # Few enough candidates left: finish in memory
+    pending = [s for s in states if s['shift'] > 0]
+    if pending:
+        for state, candidates in zip(pending, collect(pending)):
+            state['value'] = float(np.partition(candidates, state['k'])[state['k']])
+
+    middles = [s['value'] if s['shift'] > 0 else _key_to_float(s['prefix']) for s in states]
+    return sum(middles) / len(middles)
+
+def streaming_median(make_value_chunks, collect_limit=1_000_000):
+    """
+    Exact median of a column that never fits in memory at once.
+    'make_value_chunks' is a function returning a fresh iterator of float arrays
+    (each call re-reads the source).
+
+    Every pass histograms 16 bits of a sortable key into 65,536 buckets and keeps
+    only the bucket holding the middle value. Once that bucket is small enough
+    ('collect_limit') its values are pulled into memory and finished with
+    np.partition, so usually the source is read three times.
+    Matches pandas: NaNs are ignored and an even count averages the two middles.
+    """
+    return _median_search(
+        lambda states: _histogram_pass(make_value_chunks(), states),
+        lambda states: _collect_pass(make_value_chunks(), states),
+        collect_limit,
+    )
+
+def clean_stream(chunks, fill_value):
+    """
+    Streaming version of clean_data: the median is computed up front
+    (streaming_median), so each chunk is cleaned on its own.
+    Works on a copy, the caller's chunk is left untouched.
+    """
+    for chunk in chunks:
+        chunk = chunk.copy()
+        chunk['investment_amount'] = parse_amount(chunk['investment_amount']).fillna(fill_value)
+        chunk['risk_level'] = VOCABULARY.categorical(chunk['risk_level'], 'risk_level')
+        yield chunk
+
+def analyze_stream(chunks):
+    """
+    Streaming version of analyze_data (the logic is row-wise, so it is reused as-is).
+    """
+    for chunk in chunks:
+        yield project_returns(chunk)
+
+def merge_summaries(total, partial):
+    """
+    Adds one chunk's per-risk_level sums onto the running total.
+    """
+    if total is None:
+        return partial
+    return total.add(partial, fill_value=0)
+
+def merge_top(top, chunk, n=3):
+    """
+    Keeps only the n best clients seen so far, so 'Top 3' needs no full table.
+    """
+    cols = ['client_name', 'projected_profit']
+    if top is not None:
+        chunk = pd.concat([top, chunk[cols]])
+    return chunk.nlargest(n, 'projected_profit')[cols]
+
+@instrumented
+def run_streaming(source, chunksize):
+    """
+    Out-of-core pipeline. Returns (risk summary, top 3 clients).
+    """
+    print(f"[STREAM] Chunk size: {chunksize:,} rows")
+
+    print("[1/4] Computing Median Across Chunks...")
+    def amount_chunks():
+        for chunk in read_chunks(source, chunksize):
+            yield parse_amount(chunk['investment_amount']).to_numpy(dtype=np.float64)
+    median_val = streaming_median(amount_chunks)
+    print(f">> Median investment_amount: {median_val:,.2f}")
+
+    print("[2/4] Cleaning + [3/4] Analyzing Chunks...")
+    summary, top, rows = None, None, 0
+    analyzed = analyze_stream(clean_stream(read_chunks(source, chunksize), median_val))
+    for chunk in analyzed:
+        summary = merge_summaries(summary, summarize_risk(chunk))
+        top = merge_top(top, chunk)
+        rows += len(chunk)
+    print(f">> Rows processed: {rows:,}")
+
+    return summary, top
+
+# ==========================================
+# PARALLEL MODE (Process Pool)
+# Cleaning and analysis are row-by-row, so the input is cut into partitions
+# (one per file, or client_id ranges) and each worker runs the streaming
+# stages on its own partition. Only the small partial aggregates come back.
+# ==========================================
+def plan_partitions(inputs, by='file', n_partitions=8, chunksize=100_000):
+    """
+    Splits the input into partitions: one per file, or 'n_partitions'
+    equal client_id ranges per file. The plan depends only on the data and
+    n_partitions (never on the worker count), which keeps results identical
+    no matter how many workers run it.
+    """
+    inputs = inputs if isinstance(inputs, (list, tuple)) else [inputs]
+    if by == 'file':
+        return [{'source': source, 'client_id': None} for source in inputs]
+    if by != 'client_id':
+        raise ValueError(f"Unknown partitioning: {by!r} (use 'file' or 'client_id')")
+
+    partitions = []
+    for source in inputs:
+        low, high = np.inf, -np.inf
+        for chunk in read_chunks(source, chunksize):
+            if len(chunk):
+                low = min(low, chunk['client_id'].min())
+                high = max(high, chunk['client_id'].max())
+        if low > high:
+            continue
+        edges = np.linspace(low, high + 1, n_partitions + 1)
+        for lo, hi in zip(edges[:-1], edges[1:]):
+            partitions.append({'source': source, 'client_id': (float(lo), float(hi))})
+    return partitions
+
+def read_partition(partition, chunksize):
+    """
+    Yields the chunks of one partition (rows outside its client_id range are dropped).
+    """
+    source, client_range = partition['source'], partition['client_id']
+    if client_range is None:
+        yield from read_chunks(source, chunksize)
+        return
+
+    lo, hi = client_range
+    if is_parquet(source):
+        # Let Arrow skip row groups outside the range
+        in_range = [('client_id', '>=', lo), ('client_id', '<', hi)]
+        yield from STORE.batches(source, RAW_COLUMNS, in_range, batch_size=chunksize)
+        return
+
+    for chunk in read_chunks(source, chunksize):
+        yield chunk[(chunk['client_id'] >= lo) & (chunk['client_id'] < hi)]
+
+def _partition_amounts(partition, chunksize):
+    for chunk in read_partition(partition, chunksize):
+        yield parse_amount(chunk['investment_amount']).to_numpy(dtype=np.float64)
+
+def _partition_histogram(task):
+    partition, chunksize, states = task
+    return _histogram_pass(_partition_amounts(partition, chunksize), states)
+
+def _partition_collect(task):
+    partition, chunksize, states = task
+    return _collect_pass(_partition_amounts(partition, chunksize), states)
+
+def learn_levels(levels):
+    """
+    Gives risk_level values met in worker processes their codes here. Worker
+    vocabularies are thrown away with the worker: only the parent saves, and
+    it learns the values in partition (or stage) order, whatever the scheduling.
+    """
+    vocab = VOCABULARY['risk_level']
+    for value in levels:
+        vocab.add(value)
+
+def _partition_process(task):
+    """
+    Worker: clean + analyze one partition, return its partial aggregates.
+    """
+    partition, chunksize, median_val = task
+    summary, top, rows, levels = None, None, 0, {}
+    for chunk in analyze_stream(clean_stream(read_partition(partition, chunksize), median_val)):
+        summary = merge_summaries(summary, summarize_risk(chunk))
+        top = merge_top(top, chunk)
+        rows += len(chunk)
+        levels.update(dict.fromkeys(chunk['risk_level'].dropna().unique()))
+    return summary, top, rows, list(levels)
+
+def parallel_median(partitions, chunksize, map_fn, collect_limit=1_000_000):
+    """
+    streaming_median with every pass fanned out over the partitions.
+    Histograms are summed and candidates concatenated in partition order.
+    No partitions means no values: NaN, like streaming_median over empty input.
+    """
+    if not partitions:
+        return np.nan
+
+    def histogram(states):
+        tasks = [(p, chunksize, states) for p in partitions]
+        return [sum(counts) for counts in zip(*map_fn(_partition_histogram, tasks))]
+
+    def collect(states):
+        tasks = [(p, chunksize, states) for p in partitions]
+        return [np.concatenate(parts) for parts in zip(*map_fn(_partition_collect, tasks))]
+
+    return _median_search(histogram, collect, collect_limit)
+
+@instrumented
+def run_parallel(partitions, chunksize, workers):
+    """
+    Partitioned pipeline on a process pool. Returns (risk summary, top 3 clients).
+    Partials are merged in partition order, so the output is the same
+    bit for bit whatever the worker count or scheduling.
+    """
+    if not partitions:
+        raise ValueError("nothing to process: no partitions (empty --input files?)")
+    print(f"[PARALLEL] {len(partitions)} partitions on {workers} workers")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        print("[1/4] Computing Median Across Partitions...")
+        median_val = parallel_median(partitions, chunksize, pool.map)
+        print(f">> Median investment_amount: {median_val:,.2f}")
+
+        print("[2/4] Cleaning + [3/4] Analyzing Partitions...")
+        tasks = [(p, chunksize, median_val) for p in partitions]
+        results = list(pool.map(_partition_process, tasks))
+
+    summary, top, rows = None, None, 0
+    for part_summary, part_top, part_rows, part_levels in results:
+        learn_levels(part_levels)
+        if part_rows == 0:
+            continue
+        summary = merge_summaries(summary, part_summary)
+        top = merge_top(top, part_top)
+        rows += part_rows
+    print(f">> Rows processed: {rows:,}")
+
+    return summary, top
+
+# ==========================================
+# DAG MODE (default, in-memory)
+# The four stages as a graph: raw -> clean -> analyzed -> summary -> report
+#                                       |            \-> top_clients
+#                                       \-> risk_levels (the parent saves their codes)
+# Every stage result is cached in .stage_cache under a fingerprint of its
+# code and inputs, so a rerun only redoes what changed (restyling the chart
+# reruns 'report' alone), and the two branches off 'analyzed' run side by side.
+# ==========================================
+def risk_levels(df):
+    """
+    The risk_level values of the cleaned data, for learn_levels() in the parent.
+    """
+    return list(df['risk_level'].dropna().unique())
+
+def report_stage(summary):
+    generate_report(None, summary=summary)
+    return REPORT_FILE
+
+def top_clients(df, n=3):
+    return df.nlargest(n, 'projected_profit')[['client_name', 'projected_profit']]
+
+def build_pipeline(inputs=None, workers=None):
+    """
+    The DAG for mock data (inputs=None) or a list of CSV / Parquet inputs.
+    Stage versions cover the helper code each stage calls (the plotting
+    modules by file, so building the DAG doesn't import matplotlib).
+    """
+    pipeline = Pipeline(workers=workers)
+    if inputs:
+        pipeline.add('raw', functools.partial(load_data, list(inputs)), version=code_version(is_parquet),
+                     params={'inputs': [fingerprint(path) for path in inputs], 'columns': RAW_COLUMNS})
+    else:
+        pipeline.add('raw', generate_mock_data)
+    pipeline.add('clean', clean_data, ['raw'], version=code_version(parse_amount, cleaning))
+    pipeline.add('risk_levels', risk_levels, ['clean'])
+    pipeline.add('analyzed', analyze_data, ['clean'], version=code_version(project_returns, kernels))
+    pipeline.add('summary', summarize_risk, ['analyzed'])
+    pipeline.add('report', report_stage, ['summary'], files=[REPORT_FILE],
+                 version=code_version(generate_report) + module_version('charts', 'rendering'))
+    pipeline.add('top_clients', top_clients, ['analyzed'])
+    return pipeline
+
 # --- THE MASTER SWITCH ---
 if __name__ == "__main__":
-    # This is the sequence of automation
-    raw_df = generate_mock_data()
-    clean_df = clean_data(raw_df)
-    final_df = analyze_data(clean_df)
-    generate_report(final_df)
-    
-    print("\nTop 3 Clients by Projected Profit:")
-    print(final_df.nlargest(3, 'projected_profit')[['client_name', 'projected_profit']])
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Aurum Wealth ETL Pipeline')
+    parser.add_argument('--input', nargs='+', help='CSV or Parquet file(s) to process (default: mock data)')
+    parser.add_argument('--chunksize', type=int,
+                        help='Stream the data in chunks of this many rows (out-of-core mode)')
+    parser.add_argument('--workers', type=int,
+                        help='Run clean/analyze in a pool of this many processes')
+    parser.add_argument('--partition-by', choices=['file', 'client_id'], default='file',
+                        help='How to split the input for --workers (default: file)')
+    parser.add_argument('--partitions', type=int, default=8,
+                        help='Number of client_id ranges per file for --partition-by client_id')
+    parser.add_argument('--jobs', type=int,
+                        help='Stages run at the same time in the default (DAG) mode (default: CPU count)')
+    parser.add_argument('--rerun', nargs='+', default=[], metavar='STAGE',
+                        help='Rerun these DAG stages even if cached (raw clean risk_levels analyzed summary report top_clients)')
+    parser.add_argument('--metrics', help='Append per-stage metrics (time, rows, memory) to this JSON-lines file')
+    parser.add_argument('--profile', action='store_true', help='Also save a cProfile dump per stage (profiles/)')
+    args = parser.parse_args()
+
+    if args.metrics or args.profile:
+        RECORDER.configure(log_path=args.metrics, profile=args.profile)
+
+    if args.workers or args.chunksize:
+        source = args.input if args.input else generate_mock_data()
+
+    if args.workers:
+        # Parallel mode: partitions streamed by a process pool
+        chunksize = args.chunksize or 100_000
+        partitions = plan_partitions(source, args.partition_by, args.partitions, chunksize)
+        summary, top = run_parallel(partitions, chunksize, args.workers)
+        generate_report(None, summary=summary)
+
+        print("\nTop 3 Clients by Projected Profit:")
+        print(top)
+    elif args.chunksize:
+        # Streaming mode: bounded memory, same results
+        summary, top = run_streaming(source, args.chunksize)
+        generate_report(None, summary=summary)
+
+        print("\nTop 3 Clients by Projected Profit:")
+        print(top)
+    else:
+        # This is the sequence of automation, as a DAG: unchanged stages come from the cache
+        pipeline = build_pipeline(args.input, workers=args.jobs)
+        results = pipeline.run(['report', 'top_clients', 'risk_levels'], force=args.rerun)
+        learn_levels(results['risk_levels'])
+        reused = [name for name, status in pipeline.status.items() if status == 'cached']
+        if reused:
+            print(f">> Reused from cache: {', '.join(reused)}")
+
+        print("\nTop 3 Clients by Projected Profit:")
+        print(results['top_clients'])
+
+    VOCABULARY.save()  # once, here: worker processes never write the file
+
+    if RECORDER.enabled:
+        print("\n--- STAGE METRICS ---")
+        print(RECORDER.summary().to_string(index=False))
+        if args.metrics:
+            print(f">> Metrics appended to '{args.metrics}'")
@@ -2,7 +2,7 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LinearRegression
+from model_service import LinearModel, ModelService
 
 print("--- SYSTEM: INITIALIZING AI MODEL ---")
 
@@ -24,8 +24,9 @@ y = df['Salary']
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
 # 3. TRAIN THE MODEL (The "Learning" Phase)
-model = LinearRegression()
+model = LinearModel()  # least squares like sklearn's LinearRegression, but saveable
 model.fit(X_train, y_train) 
+ModelService().save('salary', model)  # python model_service.py salary 12 15
 print(">> AI Training Complete.")
 
 # 4. PREDICT THE FUTURE
@@ -1,7 +1,18 @@
 import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
+import argparse
+from encoding import SharedVocabulary, VOCABULARY_PATH
+from transaction_index import TransactionIndex
+from rendering import Chart, render
+import charts
+import datastore
+
+parser = argparse.ArgumentParser(description='Transaction aggregation')
+parser.add_argument('--data', help='Read transactions from a Parquet file/dataset instead of the mock data')
+parser.add_argument('--status', nargs='+', help='Only load these statuses (filtered inside the Parquet scan)')
+parser.add_argument('--start', help='Only load transactions on/after this Date')
+parser.add_argument('--end', help='Only load transactions on/before this Date')
+args = parser.parse_args()
 
 print("--- SYSTEM: GENERATING COMPLEX MOCK DATA ---")
 
@@ -20,8 +31,22 @@ data = {
                'Completed', 'Completed', 'Completed', 'Pending', 'Completed', 'Completed', 'Completed', 'Completed', 'Completed', 'Completed']
 }
 
-df = pd.read_csv("https://raw.githubusercontent.com/datasciencedojo/datasets/master/titanic.csv") # Just kidding
-df = pd.DataFrame(data)
+if args.data:
+    # Only the columns used below are decoded; Status / Date filters skip
+    # whole partitions and row groups instead of loading and masking everything
+    filters = datastore.date_filters('Date', args.start, args.end)
+    if args.status:
+        filters.append(('Status', 'in', args.status))
+    df = datastore.read(args.data, columns=list(data), filters=filters)
+else:
+    df = pd.DataFrame(data)
+
+# Repeated text columns become integer codes (one shared, saved vocabulary),
+# so the groupbys and the 'Status' filter below compare ints, not strings
+vocabulary = SharedVocabulary(VOCABULARY_PATH)
+for column in ['Client_Name', 'City', 'Asset_Class', 'Status']:
+    df[column] = vocabulary.categorical(df[column], column)
+vocabulary.save()
 
 print(f"Data Loaded: {df.shape[0]} transactions.")
 
@@ -53,10 +78,8 @@ print(pivot_df)
 # SKILL 4: VISUALIZING THE PIVOT (Heatmap)
 # This is how you spot trends instantly.
 # ==========================================
-plt.figure(figsize=(8, 6))
-sns.heatmap(pivot_df, annot=True, fmt="d", cmap="YlGnBu") # YlGnBu = Yellow Green Blue
-plt.title('Investment Heatmap: City vs Asset Class')
-plt.savefig('heatmap_analysis.png', dpi=300)
+# (sns.heatmap in charts.investment_heatmap, drawn headless and cached)
+render(Chart(charts.investment_heatmap, pivot_df, 'heatmap_analysis.png', figsize=(8, 6)))
 print("\n>> Heatmap saved as 'heatmap_analysis.png'")
 
 # ==========================================
@@ -65,4 +88,10 @@ print("\n>> Heatmap saved as 'heatmap_analysis.png'")
 # ==========================================
 print("\n--- 4. HIGH VALUE COMPLETED TRANSACTIONS ---")
 high_value = df[ (df['Status'] == 'Completed') & (df['Amount'] > 10000) ]
-print(high_value[['Client_Name', 'Amount', 'Status']])
\ No newline at end of file
+print(high_value[['Client_Name', 'Amount', 'Status']])
+
+# Same question through the index (sorted Amount + Status/City bitmaps):
+# built once, then every threshold/status query skips the full scan
+index = TransactionIndex(df)
+indexed = index.filter(Status='Completed', Amount=('>', 10000))
+print(f">> Indexed query matches the mask: {indexed.equals(high_value)}")
\ No newline at end of file
@@ -1,34 +1,60 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import argparse
+from price_store import PriceStore
+from rollup import RollupCache
+from rendering import Chart, render
+from downsample import downsample_frame
+import charts
+import datastore
+
+parser = argparse.ArgumentParser(description='Gold SMA crossover strategy')
+parser.add_argument('--store', help='Read Gold_Price from a price_store.py directory instead of simulating it')
+parser.add_argument('--data', help='Read Date/Gold_Price from a Parquet file/dataset instead of simulating it')
+parser.add_argument('--start', help='With --data: first Date to load')
+parser.add_argument('--end', help='With --data: last Date to load')
+args = parser.parse_args()
 
 print("--- SYSTEM: INITIALIZING QUANT ENGINE ---")
 
-# 1. GENERATE MOCK TIME SERIES DATA
-# We create a date range for the year 2025
-dates = pd.date_range(start='2025-01-01', periods=365, freq='D')
-
-# Simulate a "Random Walk" for Gold Prices
-# We start at 50,000 and add random daily fluctuations
-np.random.seed(42) # Ensures we get the same random numbers every time
-price_changes = np.random.normal(loc=10, scale=500, size=365) 
-prices = 50000 + np.cumsum(price_changes)
-
-# Create the DataFrame
-df = pd.DataFrame({'Date': dates, 'Gold_Price': prices})
-
-# 2. THE CRITICAL STEP: CONVERT & INDEX
-# Python must treat 'Date' as a Time Object, not a String
-df['Date'] = pd.to_datetime(df['Date'])
-df.set_index('Date', inplace=True)
+if args.store:
+    # 1+2. LOAD FROM THE ON-DISK PRICE STORE
+    # Already indexed by Date; prices are memory-mapped, not copied
+    df = PriceStore(args.store).series(name='Gold_Price').to_frame()
+elif args.data:
+    # 1+2. LOAD FROM PARQUET: two columns, date range pushed into the scan
+    df = datastore.read(args.data, columns=['Date', 'Gold_Price'],
+                        filters=datastore.date_filters('Date', args.start, args.end))
+    df = df.set_index('Date').sort_index()
+else:
+    # 1. GENERATE MOCK TIME SERIES DATA
+    # We create a date range for the year 2025
+    dates = pd.date_range(start='2025-01-01', periods=365, freq='D')
+
+    # Simulate a "Random Walk" for Gold Prices
+    # We start at 50,000 and add random daily fluctuations
+    np.random.seed(42) # Ensures we get the same random numbers every time
+    price_changes = np.random.normal(loc=10, scale=500, size=365) 
+    prices = 50000 + np.cumsum(price_changes)
+
+    # Create the DataFrame
+    df = pd.DataFrame({'Date': dates, 'Gold_Price': prices})
+
+    # 2. THE CRITICAL STEP: CONVERT & INDEX
+    # Python must treat 'Date' as a Time Object, not a String
+    df['Date'] = pd.to_datetime(df['Date'])
+    df.set_index('Date', inplace=True)
 
 print(f">> Data Loaded: {df.shape[0]} Days of Trading.")
 print(df.head(3))
 
 # 3. RESAMPLING (Aggregating Time)
 # Let's see the Average Price per MONTH ('M')
-monthly_avg = df['Gold_Price'].resample('M').mean()
+# The rollup cache keeps sum/count/min/max/first/last per day, week and month,
+# so weekly/monthly/quarterly views are merged from partials, not rescanned
+rollups = RollupCache(levels=('D', 'W', 'M'))
+rollups.add_bars(df['Gold_Price'])
+monthly_avg = rollups.mean('M')
 print("\n--- MONTHLY AVERAGE PRICES ---")
 print(monthly_avg.head())
 
@@ -47,21 +73,8 @@ print("\n--- LATEST MARKET STATUS ---")
 print(df.tail(5))
 
 # 6. VISUALIZATION (The Chart)
-plt.figure(figsize=(12, 6))
-sns.set_theme(style="darkgrid")
-
-# Plot Actual Price (Light gray, to show noise)
-plt.plot(df.index, df['Gold_Price'], label='Gold Price', color='lightgray', alpha=0.6)
-
-# Plot SMAs (The Signals)
-plt.plot(df.index, df['SMA_20'], label='20-Day SMA (Fast)', color='blue', linewidth=1.5)
-plt.plot(df.index, df['SMA_50'], label='50-Day SMA (Slow)', color='red', linewidth=1.5, linestyle='--')
-
-plt.title('Gold Price Algo Strategy: SMA Crossover', fontsize=14)
-plt.xlabel('Date')
-plt.ylabel('Price (INR)')
-plt.legend()
-
-plt.savefig('gold_strategy.png', dpi=300)
+# Price + both SMAs (charts.gold_strategy), drawn headless; unchanged data reuses the cached PNG.
+# Long histories are cut to the points that matter at 12in x 300dpi (min/max per pixel column)
+plot_df = downsample_frame(df[['Gold_Price', 'SMA_20', 'SMA_50']], width_px=12 * 300)
+render(Chart(charts.gold_strategy, plot_df, 'gold_strategy.png', figsize=(12, 6)))
 print("\n>> Chart saved as 'gold_strategy.png'")
-plt.show()
\ No newline at end of file
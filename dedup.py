@@ -0,0 +1,232 @@
+import pandas as pd
+import numpy as np
+import argparse
+import os
+import tempfile
+
+# ==========================================
+# STREAMING DEDUPLICATION (Bigger Than Memory)
+# df.drop_duplicates() needs the whole frame in RAM and compares every column.
+# Here every row is boiled down to one 64-bit fingerprint, and we only remember
+# the fingerprints in a NumPy open-addressing hash table (16 bytes per slot,
+# at most half full). Chunks stream through; the table can live on disk.
+#
+# Note: two different rows share a 64-bit hash with probability ~n²/2^65,
+# about 3% for a billion distinct rows. Hash fewer columns (subset) or fewer rows
+# per table if that matters.
+# ==========================================
+
+EMPTY = np.uint64(0)  # Marks a free slot (the real hash 0 is stored separately)
+
+def _mix(keys):
+    # Spread the bits so that consecutive hashes don't land in consecutive slots
+    keys = keys ^ (keys >> np.uint64(33))
+    keys = keys * np.uint64(0xff51afd7ed558ccd)
+    return keys ^ (keys >> np.uint64(33))
+
+class FingerprintTable:
+    """
+    Open-addressing (linear probing) hash table of uint64 keys -> int64 values,
+    written with NumPy so whole batches are inserted at once.
+    Grows at 50% load. With 'spill_dir', arrays bigger than 'max_memory' bytes
+    are kept in np.memmap files there instead of RAM.
+    """
+
+    def __init__(self, capacity=1 << 20, spill_dir=None, max_memory=1 << 30):
+        self.spill_dir = spill_dir
+        self.max_memory = max_memory
+        self.size = 0
+        self.zero_value = None  # value for the key 0, which can't go in the table
+        self.keys, self.values = self._allocate(max(1024, 1 << int(capacity - 1).bit_length()))
+
+    def __len__(self):
+        return self.size + (self.zero_value is not None)
+
+    def _allocate(self, capacity):
+        self.mask = np.uint64(capacity - 1)
+        if self.spill_dir is not None and capacity * 16 > self.max_memory:
+            # Spill: let the OS page the table in and out of a file
+            os.makedirs(self.spill_dir, exist_ok=True)
+            fd, path = tempfile.mkstemp(dir=self.spill_dir, suffix='.fp')
+            os.close(fd)
+            keys = np.memmap(path, dtype=np.uint64, mode='w+', shape=(capacity,))
+            fd, path = tempfile.mkstemp(dir=self.spill_dir, suffix='.val')
+            os.close(fd)
+            values = np.memmap(path, dtype=np.int64, mode='w+', shape=(capacity,))
+            return keys, values
+        return np.zeros(capacity, dtype=np.uint64), np.full(capacity, -1, dtype=np.int64)
+
+    def _release(self, array):
+        if isinstance(array, np.memmap):
+            path = array.filename
+            del array
+            os.remove(path)
+
+    def _grow(self, block=1 << 22):
+        old_keys, old_values = self.keys, self.values
+        self.keys, self.values = self._allocate(len(old_keys) * 2)
+        self.size = 0
+        # Re-insert block by block, so a spilled table never has to fit in RAM
+        for start in range(0, len(old_keys), block):
+            keys = np.asarray(old_keys[start:start + block])
+            used = keys != EMPTY
+            self._place(keys[used], np.asarray(old_values[start:start + block])[used])
+        self._release(old_keys)
+        self._release(old_values)
+
+    def _place(self, keys, values):
+        """
+        Insert-or-update for distinct, non-zero keys. Returns a mask of the new ones.
+        Every round, all pending keys look at their current slot at once;
+        keys that collide on an empty slot race, the winner stays, losers probe on.
+        """
+        is_new = np.zeros(len(keys), dtype=bool)
+        pending = np.arange(len(keys))
+        slots = _mix(keys) & self.mask
+        while pending.size:
+            slot = slots[pending]
+            current = self.keys[slot]
+
+            found = current == keys[pending]
+            self.values[slot[found]] = values[pending[found]]
+
+            empty = current == EMPTY
+            self.keys[slot[empty]] = keys[pending[empty]]
+            won = empty & (self.keys[slot] == keys[pending])
+            self.values[slot[won]] = values[pending[won]]
+            is_new[pending[won]] = True
+
+            pending = pending[~(found | won)]
+            slots[pending] = (slots[pending] + np.uint64(1)) & self.mask
+        self.size += int(is_new.sum())
+        return is_new
+
+    def insert(self, keys, values=None):
+        """
+        Adds a batch of keys (duplicates allowed; the LAST value per key wins).
+        Returns a mask over 'keys' marking the first occurrence of each key
+        that was not in the table before.
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        values = np.zeros(len(keys), dtype=np.int64) if values is None else np.asarray(values, dtype=np.int64)
+
+        # Distinct keys of the batch: first position (for the mask), last value (for the table)
+        uniq, first = np.unique(keys, return_index=True)
+        last = len(keys) - 1 - np.unique(keys[::-1], return_index=True)[1]
+        is_new = np.zeros(len(keys), dtype=bool)
+
+        zero = uniq == EMPTY
+        if zero.any():
+            if self.zero_value is None:
+                is_new[first[zero]] = True
+            self.zero_value = int(values[last[zero]][0])
+            uniq, first, last = uniq[~zero], first[~zero], last[~zero]
+
+        while (self.size + len(uniq)) * 2 > len(self.keys):
+            self._grow()
+        is_new[first[self._place(uniq, values[last])]] = True
+        return is_new
+
+    def lookup(self, keys):
+        """
+        Values stored for 'keys' (-1 where a key is not in the table).
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        result = np.full(len(keys), -1, dtype=np.int64)
+        zero = keys == EMPTY
+        if zero.any() and self.zero_value is not None:
+            result[zero] = self.zero_value
+
+        pending = np.flatnonzero(~zero)
+        slots = _mix(keys) & self.mask
+        while pending.size:
+            slot = slots[pending]
+            current = self.keys[slot]
+            found = current == keys[pending]
+            result[pending[found]] = self.values[slot[found]]
+            pending = pending[~(found | (current == EMPTY))]
+            slots[pending] = (slots[pending] + np.uint64(1)) & self.mask
+        return result
+
+    def close(self):
+        """
+        Deletes spill files (if any).
+        """
+        self._release(self.keys)
+        self._release(self.values)
+        self.keys = self.values = None
+
+def row_hashes(df, subset=None):
+    """
+    One uint64 fingerprint per row, from all columns or just the 'subset' keys.
+    Equal rows give equal hashes in every chunk, as long as the column dtypes
+    match between chunks (read CSVs with dtype=str to be safe).
+    """
+    if subset is not None:
+        df = df[list(subset)]
+    return pd.util.hash_pandas_object(df, index=False).to_numpy(dtype=np.uint64)
+
+def drop_duplicates_stream(make_chunks, subset=None, keep='first', spill_dir=None, max_memory=1 << 30):
+    """
+    Streaming df.drop_duplicates(subset, keep). 'make_chunks' is a function
+    returning a fresh iterator of DataFrames; yields the de-duplicated chunks.
+
+    keep='first' reads the data once. keep='last' reads it twice: the first pass
+    records the last row number of every fingerprint, the second keeps only those rows.
+    """
+    if keep not in ('first', 'last'):
+        raise ValueError(f"keep must be 'first' or 'last', got {keep!r}")
+
+    table = FingerprintTable(spill_dir=spill_dir, max_memory=max_memory)
+    try:
+        if keep == 'first':
+            for chunk in make_chunks():
+                yield chunk[table.insert(row_hashes(chunk, subset))]
+            return
+
+        row = 0
+        for chunk in make_chunks():
+            table.insert(row_hashes(chunk, subset), np.arange(row, row + len(chunk)))
+            row += len(chunk)
+
+        row = 0
+        for chunk in make_chunks():
+            positions = np.arange(row, row + len(chunk))
+            yield chunk[table.lookup(row_hashes(chunk, subset)) == positions]
+            row += len(chunk)
+    finally:
+        table.close()
+
+def drop_duplicates(df, subset=None, keep='first'):
+    """
+    Same as drop_duplicates_stream, for one in-memory DataFrame.
+    """
+    return next(drop_duplicates_stream(lambda: iter([df]), subset, keep))
+
+# ==========================================
+# COMMAND LINE: de-duplicate daily CSV dumps into one file
+# python dedup.py day1.csv day2.csv -o clean.csv --subset client_name deposit_date --keep last
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Streaming de-duplication of CSV files')
+    parser.add_argument('inputs', nargs='+', help='CSV files, read in order')
+    parser.add_argument('-o', '--output', required=True, help='CSV file to write')
+    parser.add_argument('--subset', nargs='+', help='Key columns (default: all columns)')
+    parser.add_argument('--keep', choices=['first', 'last'], default='first')
+    parser.add_argument('--chunksize', type=int, default=500_000)
+    parser.add_argument('--spill-dir', help='Keep the fingerprint table on disk here once it outgrows RAM')
+    args = parser.parse_args()
+
+    def csv_chunks():
+        for path in args.inputs:
+            # dtype=str: every chunk hashes the same text the same way
+            yield from pd.read_csv(path, chunksize=args.chunksize, dtype=str, keep_default_na=False)
+
+    print("--- SYSTEM: REMOVING DUPLICATES ---")
+    rows_out = 0
+    header = True
+    for chunk in drop_duplicates_stream(csv_chunks, args.subset, args.keep, args.spill_dir):
+        chunk.to_csv(args.output, mode='w' if header else 'a', header=header, index=False)
+        header = False
+        rows_out += len(chunk)
+    print(f">> {rows_out:,} unique rows written to {args.output}")
@@ -0,0 +1,144 @@
+import pandas as pd
+import numpy as np
+import argparse
+import time
+
+# ==========================================
+# PLOT-DATA REDUCTION (Downsampling Before Drawing)
+# A 12-inch chart at dpi=300 is 3600 pixels wide. Drawing 10 million points
+# into it costs minutes and the extra points land on the same pixels anyway.
+# So before a chart is drawn:
+#   - lines keep, per PIXEL COLUMN, the first / min / max / last point
+#     (min/max buckets): the drawn line is the same, the work is O(pixels).
+#     method='lttb' picks the Largest-Triangle-Three-Buckets subset instead
+#   - dense scatters become a 2-D histogram (counts per cell), drawn as a
+#     density map instead of millions of markers
+# Small inputs are returned unchanged, so existing charts look exactly the same.
+# ==========================================
+
+def _as_numbers(x):
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+def _pixel_buckets(x, n_buckets):
+    span = x[-1] - x[0]
+    if span <= 0:
+        return np.zeros(len(x), dtype=np.int64)
+    return np.minimum(((x - x[0]) / span * n_buckets).astype(np.int64), n_buckets - 1)
+
+def minmax_indices(x, y, n_buckets):
+    """
+    Positions of the first, last, lowest and highest point of every x-bucket
+    (x sorted). At most 4 points per bucket; NaNs are never picked as min/max.
+    """
+    x, y = _as_numbers(x), np.asarray(y, dtype=np.float64)
+    if len(y) <= 4 * n_buckets:
+        return np.arange(len(y))
+    bucket = _pixel_buckets(x, n_buckets)
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(y)] - 1
+
+    picks = [starts, ends]
+    seg = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(y)]))
+    for fill, reduce in ((np.inf, np.minimum), (-np.inf, np.maximum)):
+        values = np.where(np.isnan(y), fill, y)
+        extreme = reduce.reduceat(values, starts)
+        hit = (values == extreme[seg]) & np.isfinite(extreme[seg])
+        first_hit = np.unique(seg[hit], return_index=True)[1]
+        picks.append(np.flatnonzero(hit)[first_hit])
+    return np.unique(np.concatenate(picks))
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: keeps the first and last point and, per
+    bucket, the point that forms the largest triangle with the previously
+    kept point and the average of the next bucket. NaNs are dropped first.
+    """
+    x, y = _as_numbers(x), np.asarray(y, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(y))
+    if len(valid) <= n_out or n_out < 3:
+        return valid
+    xv, yv = x[valid], y[valid]
+    edges = np.linspace(1, len(valid) - 1, n_out - 1).astype(np.int64)  # n_out - 2 inner buckets
+
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, len(valid) - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = hi, edges[i + 2] if i + 2 < len(edges) else len(valid)
+        avg_x, avg_y = xv[nxt_lo:nxt_hi].mean(), yv[nxt_lo:nxt_hi].mean()
+        area = np.abs((xv[a] - avg_x) * (yv[lo:hi] - yv[a]) - (xv[a] - xv[lo:hi]) * (avg_y - yv[a]))
+        a = lo + int(np.argmax(area))
+        kept[i + 1] = a
+    return valid[kept]
+
+def downsample_frame(df, width_px, method='minmax'):
+    """
+    Rows of a time-indexed frame worth drawing at 'width_px' pixels:
+    the union of what every column needs, so the chart code is unchanged.
+    """
+    if len(df) <= 4 * width_px:
+        return df
+    x = df.index.to_numpy()
+    keep = []
+    for column in df.columns:
+        if method == 'minmax':
+            keep.append(minmax_indices(x, df[column].to_numpy(), width_px))
+        elif method == 'lttb':
+            keep.append(lttb_indices(x, df[column].to_numpy(), width_px))
+        else:
+            raise ValueError(f"unknown method '{method}' (use 'minmax' or 'lttb')")
+    return df.iloc[np.unique(np.concatenate(keep))]
+
+SCATTER_LIMIT = 50_000  # above this many points a scatter is drawn as a density map
+
+def density_grid(x, y, bins=(400, 300)):
+    """
+    2-D histogram of a scatter: {'counts', 'x_edges', 'y_edges'} (counts[i, j]
+    = points with x in bin i and y in bin j). Size depends on 'bins' only.
+    """
+    counts, x_edges, y_edges = np.histogram2d(np.asarray(x, dtype=np.float64),
+                                              np.asarray(y, dtype=np.float64), bins=bins)
+    return {'counts': counts, 'x_edges': x_edges, 'y_edges': y_edges}
+
+# ==========================================
+# BENCHMARK: draw N points raw vs reduced
+# python downsample.py --points 5000000
+# ==========================================
+if __name__ == "__main__":
+    import tempfile
+    import matplotlib.image as mpimg
+    from rendering import Chart, render_many
+    import charts
+
+    parser = argparse.ArgumentParser(description='Rendering cost with and without plot-data reduction')
+    parser.add_argument('--points', type=int, default=2_000_000)
+    parser.add_argument('--method', choices=['minmax', 'lttb'], default='minmax')
+    args = parser.parse_args()
+
+    print("--- SYSTEM: BENCHMARKING PLOT DOWNSAMPLING ---")
+    np.random.seed(42)
+    dates = pd.date_range('2000-01-01', periods=args.points, freq='min')
+    prices = 50000 + np.cumsum(np.random.normal(loc=0.1, scale=50, size=args.points))
+    df = pd.DataFrame({'Gold_Price': prices}, index=dates)
+    df['SMA_20'] = df['Gold_Price'].rolling(20).mean()
+    df['SMA_50'] = df['Gold_Price'].rolling(50).mean()
+
+    start = time.perf_counter()
+    reduced = downsample_frame(df, width_px=12 * 300, method=args.method)
+    reduce_time = time.perf_counter() - start
+    print(f">> {len(df):,} rows -> {len(reduced):,} rows in {reduce_time:.2f}s ({args.method})")
+
+    cache_dir = tempfile.mkdtemp()  # no cache hits: time the drawing itself
+    for label, data in (('reduced', reduced), ('raw', df)):
+        start = time.perf_counter()
+        render_many([Chart(charts.gold_strategy, data, f'downsample_{label}.png', figsize=(12, 6))],
+                    workers=1, cache_dir=cache_dir)
+        print(f"  {label:<8} render {time.perf_counter() - start:7.2f}s -> downsample_{label}.png")
+
+    raw_png, reduced_png = mpimg.imread('downsample_raw.png'), mpimg.imread('downsample_reduced.png')
+    changed = np.abs(raw_png - reduced_png).max(axis=2) > 0.1
+    print(f">> Pixels that differ visibly: {changed.mean():.3%}")
@@ -0,0 +1,149 @@
+import pandas as pd
+import numpy as np
+import argparse
+import json
+import os
+import time
+
+# ==========================================
+# DICTIONARY ENCODING (Low-Cardinality Strings)
+# 'Client_Name', 'City', 'Asset_Class', 'Status', 'risk_level' hold a handful of
+# distinct strings repeated millions of times as Python objects.
+# We store each distinct string once in a vocabulary and keep int32 codes:
+#   - 4 bytes per row instead of an 8-byte pointer to a Python str
+#   - df['Status'] == 'Completed' becomes an integer comparison
+#   - groupby / np.select work on the codes
+# The vocabulary is saved to JSON, so every file and every run agrees on the codes.
+# ==========================================
+
+VOCABULARY_PATH = 'aurum_vocabulary.json'
+
+class Vocabulary:
+    """
+    Stable value -> integer code mapping that grows as new values show up.
+    """
+
+    def __init__(self, values=()):
+        self.codes = {}
+        self.values = []
+        for value in values:
+            self.add(value)
+
+    def __len__(self):
+        return len(self.values)
+
+    def add(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def encode(self, series):
+        """
+        Codes for a whole column (-1 for NaN). Only the chunk's distinct
+        values go through the Python dict, the rows are mapped with take().
+        """
+        local, uniques = pd.factorize(series)
+        mapping = np.empty(len(uniques) + 1, dtype=np.int64)
+        for i, value in enumerate(uniques):
+            mapping[i] = self.add(value)
+        mapping[-1] = -1  # local code -1 (NaN) lands here
+        return mapping.take(local)
+
+class SharedVocabulary:
+    """
+    One Vocabulary per column name, persisted as JSON ({column: [values...]}).
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.columns = {}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                for column, values in json.load(f).items():
+                    self.columns[column] = Vocabulary(values)
+
+    def __getitem__(self, column):
+        if column not in self.columns:
+            self.columns[column] = Vocabulary()
+        return self.columns[column]
+
+    def save(self, path=None):
+        path = path or self.path
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump({column: vocab.values for column, vocab in self.columns.items()}, f, indent=1)
+        os.replace(tmp, path)
+
+    def codes(self, df, column):
+        """
+        The persisted int32 codes of a column (-1 = missing), for storing on disk.
+        """
+        return self[column].encode(df[column]).astype(np.int32)
+
+    def categorical(self, series, column=None):
+        """
+        pandas Categorical for a column. Categories are sorted (so groupby and
+        pivot_table order rows exactly like they do for plain strings); the
+        stable vocabulary codes are remapped with one small lookup table.
+        """
+        vocab = self[column or series.name]
+        codes = vocab.encode(series)
+        order = np.argsort(np.array(vocab.values, dtype=object))
+        remap = np.empty(len(order) + 1, dtype=np.int32)
+        remap[order] = np.arange(len(order), dtype=np.int32)
+        remap[-1] = -1
+        categories = pd.Index([vocab.values[i] for i in order])
+        return pd.Categorical.from_codes(remap.take(codes), categories=categories)
+
+def encode_frame(df, columns, vocabulary):
+    """
+    Returns a copy of df with 'columns' dictionary-encoded as categoricals.
+    """
+    df = df.copy()
+    for column in columns:
+        if column in df:
+            df[column] = vocabulary.categorical(df[column], column)
+    return df
+
+# ==========================================
+# BENCHMARK: object strings vs dictionary codes
+# python encoding.py --rows 50000000
+# ==========================================
+def benchmark(n_rows, repeats=3):
+    from benchmarks import best_time
+    rng = np.random.default_rng(42)
+    cities = np.array(['Korba', 'Raipur', 'Bilaspur', 'Durg'], dtype=object)
+    statuses = np.array(['Completed', 'Pending', 'Failed'], dtype=object)
+    raw = pd.DataFrame({
+        'City': pd.Series(cities[rng.integers(0, 4, n_rows)], dtype=object),
+        'Status': pd.Series(statuses[rng.integers(0, 3, n_rows)], dtype=object),
+        'Amount': rng.integers(5000, 60000, n_rows),
+    })
+
+    start = time.perf_counter()
+    encoded = encode_frame(raw, ['City', 'Status'], SharedVocabulary())
+    encode_time = time.perf_counter() - start
+
+    def megabytes(df):
+        return df[['City', 'Status']].memory_usage(deep=True).sum() / 1e6
+
+    print(f"{n_rows:,} rows (encoding took {encode_time:.2f}s)")
+    print(f"  memory (City + Status): object {megabytes(raw):10,.1f} MB | codes {megabytes(encoded):8,.1f} MB")
+    for label, job in [
+        ("filter Status == 'Completed'", lambda df: df['Status'] == 'Completed'),
+        ("groupby City sum(Amount)    ", lambda df: df.groupby('City', observed=True)['Amount'].sum()),
+    ]:
+        before = best_time(lambda: job(raw), repeats)
+        after = best_time(lambda: job(encoded), repeats)
+        print(f"  {label}: object {before:7.3f}s | codes {after:7.3f}s | {before / after:5.1f}x faster")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Memory/throughput of dictionary-encoded string columns')
+    parser.add_argument('--rows', type=int, default=50_000_000)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    print("--- SYSTEM: BENCHMARKING DICTIONARY ENCODING ---")
+    benchmark(args.rows, args.repeats)
@@ -0,0 +1,207 @@
+import numpy as np
+import argparse
+import json
+import math
+
+# ==========================================
+# LIVE INDICATOR ENGINE (O(1) per tick)
+# day9_quant.py recomputes rolling().mean() over the whole year for every run.
+# For live gold ticks we keep a small state per window instead:
+# a ring buffer plus running sums. Each new price updates SMA, EMA and
+# rolling std in constant time, and the state can be saved and restored,
+# so a restart doesn't have to replay a year of prices.
+# ==========================================
+
+class RollingWindow:
+    """
+    Ring buffer of the last 'size' prices with running sums.
+    Sums are kept relative to an anchor price (better precision for the std)
+    and rebuilt from the buffer every 'size' ticks to stop rounding drift.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.buffer = [0.0] * size
+        self.count = 0     # prices seen so far (capped at size)
+        self.pos = 0       # next slot to overwrite
+        self.anchor = None
+        self.sum = 0.0     # sum of (price - anchor)
+        self.sumsq = 0.0   # sum of (price - anchor)^2
+        self.ticks = 0
+
+    def push(self, price):
+        if self.anchor is None:
+            self.anchor = price
+        if self.count == self.size:
+            old = self.buffer[self.pos] - self.anchor
+            self.sum -= old
+            self.sumsq -= old * old
+        else:
+            self.count += 1
+
+        self.buffer[self.pos] = price
+        self.pos = (self.pos + 1) % self.size
+        delta = price - self.anchor
+        self.sum += delta
+        self.sumsq += delta * delta
+
+        self.ticks += 1
+        if self.ticks % self.size == 0:
+            self._rebuild()
+
+    def _rebuild(self):
+        # O(size) once every 'size' ticks = O(1) per tick on average
+        prices = self.buffer[:self.count]
+        self.anchor = prices[self.pos - 1]
+        self.sum = math.fsum(p - self.anchor for p in prices)
+        self.sumsq = math.fsum((p - self.anchor) ** 2 for p in prices)
+
+    @property
+    def ready(self):
+        return self.count == self.size
+
+    def mean(self):
+        """
+        Same as rolling(size).mean(): NaN until the window is full.
+        """
+        if not self.ready:
+            return math.nan
+        return self.anchor + self.sum / self.size
+
+    def std(self):
+        """
+        Same as rolling(size).std() (sample std, ddof=1).
+        """
+        if not self.ready or self.size < 2:
+            return math.nan
+        var = (self.sumsq - self.sum * self.sum / self.size) / (self.size - 1)
+        return math.sqrt(max(var, 0.0))
+
+    def state(self):
+        return {'size': self.size, 'buffer': list(self.buffer), 'count': self.count,
+                'pos': self.pos, 'anchor': self.anchor, 'sum': self.sum,
+                'sumsq': self.sumsq, 'ticks': self.ticks}
+
+    @classmethod
+    def from_state(cls, state):
+        window = cls(state['size'])
+        for key, value in state.items():
+            setattr(window, key, value)
+        window.buffer = list(state['buffer'])
+        return window
+
+class IndicatorEngine:
+    """
+    Feed it one price at a time with update(). Returns the latest indicators:
+      SMA_<w>, STD_<w> for every rolling window, EMA_<span> for every span,
+      'Signal' (Bullish if SMA_fast > SMA_slow, like day9) and 'event',
+      which is only set on the tick where SMA_fast crosses SMA_slow.
+    """
+
+    def __init__(self, windows=(20, 50), ema_spans=(20,), fast=20, slow=50):
+        windows = sorted(set(windows) | {fast, slow})
+        self.windows = {w: RollingWindow(w) for w in windows}
+        self.emas = {span: math.nan for span in ema_spans}
+        self.fast, self.slow = fast, slow
+        self.signal = None
+        self.last_time = None
+
+    def update(self, price, timestamp=None):
+        price = float(price)
+        for window in self.windows.values():
+            window.push(price)
+
+        # EMA, same as ewm(span, adjust=False).mean()
+        for span, ema in self.emas.items():
+            alpha = 2.0 / (span + 1)
+            self.emas[span] = price if math.isnan(ema) else ema + alpha * (price - ema)
+
+        fast, slow = self.windows[self.fast].mean(), self.windows[self.slow].mean()
+        signal = 'Bullish' if fast > slow else 'Bearish'
+
+        event = None
+        if not math.isnan(slow):
+            if self.signal is not None and signal != self.signal:
+                event = f'{signal} crossover'
+            self.signal = signal
+        if timestamp is not None:
+            self.last_time = str(timestamp)
+
+        result = {'price': price}
+        for w, window in self.windows.items():
+            result[f'SMA_{w}'] = window.mean()
+            result[f'STD_{w}'] = window.std()
+        for span, ema in self.emas.items():
+            result[f'EMA_{span}'] = ema
+        result['Signal'] = signal
+        result['event'] = event
+        return result
+
+    def snapshot(self):
+        """
+        Everything needed to carry on later, as plain JSON-friendly data.
+        """
+        return {
+            'windows': [window.state() for window in self.windows.values()],
+            'emas': {str(span): (None if math.isnan(ema) else ema) for span, ema in self.emas.items()},
+            'fast': self.fast, 'slow': self.slow,
+            'signal': self.signal, 'last_time': self.last_time,
+        }
+
+    @classmethod
+    def restore(cls, snapshot):
+        engine = cls(windows=(), ema_spans=(), fast=snapshot['fast'], slow=snapshot['slow'])
+        engine.windows = {state['size']: RollingWindow.from_state(state) for state in snapshot['windows']}
+        engine.emas = {int(span): (math.nan if ema is None else ema) for span, ema in snapshot['emas'].items()}
+        engine.signal = snapshot['signal']
+        engine.last_time = snapshot['last_time']
+        return engine
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(), f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.restore(json.load(f))
+
+# ==========================================
+# DEMO: replay the day9 gold series tick by tick
+# python indicators.py --state gold_engine.json
+# ==========================================
+if __name__ == "__main__":
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description='Replay simulated gold prices through the live indicator engine')
+    parser.add_argument('--state', help='Save the engine state here after half the year, then resume from it')
+    args = parser.parse_args()
+
+    # Same random walk as day9_quant.py
+    dates = pd.date_range(start='2025-01-01', periods=365, freq='D')
+    np.random.seed(42)
+    prices = 50000 + np.cumsum(np.random.normal(loc=10, scale=500, size=365))
+
+    print("--- SYSTEM: LIVE INDICATOR ENGINE ---")
+    engine = IndicatorEngine(windows=(20, 50), ema_spans=(20,))
+    rows = []
+    for i, (date, price) in enumerate(zip(dates, prices)):
+        if args.state and i == 182:
+            # Simulate a restart: save, throw the engine away, load it back
+            engine.save(args.state)
+            engine = IndicatorEngine.load(args.state)
+            print(f">> State saved to '{args.state}' and restored at {date.date()}")
+        tick = engine.update(price, date)
+        if tick['event']:
+            print(f"{date.date()}  {tick['event']:<20} price ₹{price:,.2f}")
+        rows.append(tick)
+
+    live = pd.DataFrame(rows, index=dates)
+    batch = pd.Series(prices, index=dates)
+    for w in (20, 50):
+        error = np.nanmax(np.abs(live[f'SMA_{w}'] - batch.rolling(w).mean()))
+        print(f">> SMA_{w} max difference vs pandas rolling(): {error:.2e}")
+    error = np.nanmax(np.abs(live['STD_20'] - batch.rolling(20).std()))
+    print(f">> STD_20 max difference vs pandas rolling().std(): {error:.2e}")
+    error = np.nanmax(np.abs(live['EMA_20'] - batch.ewm(span=20, adjust=False).mean()))
+    print(f">> EMA_20 max difference vs pandas ewm(): {error:.2e}")
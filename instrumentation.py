@@ -0,0 +1,225 @@
+import pandas as pd
+import argparse
+import contextlib
+import cProfile
+import functools
+import json
+import os
+import resource
+import time
+
+# ==========================================
+# STAGE INSTRUMENTATION (Timings, Rows, Memory, Optional cProfile)
+# The pipelines only say "[2/4] Cleaning Data...". Wrapping a stage in
+# @instrumented (or 'with RECORDER.stage(name):') records, per call:
+#   - wall time (perf_counter) and CPU time (process_time)
+#   - rows in / rows out (first DataFrame/Series argument, the return value)
+#   - DataFrame memory in / out (memory_usage(deep=True))
+#   - peak RSS during the stage (Linux: the kernel's high-water mark is reset
+#     at stage start; elsewhere the process-wide ru_maxrss)
+#   - optionally a cProfile dump of the stage
+# Records are appended to a JSON-lines log, one object per stage call.
+# Until RECORDER.configure() is called the decorator is a plain call-through.
+# ==========================================
+
+def _rows(obj):
+    return len(obj) if isinstance(obj, (pd.DataFrame, pd.Series)) else None
+
+def _frame_bytes(obj):
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=True, deep=True))
+    return None
+
+def _first_frame(args, kwargs):
+    for value in list(args) + list(kwargs.values()):
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return value
+    return None
+
+def _reset_peak_rss():
+    """
+    Resets the kernel's peak-RSS counter (VmHWM). True if that worked,
+    so the next reading is the peak of this stage alone.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+def _peak_rss_bytes():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # Linux reports KB
+
+class StageRecorder:
+    """
+    Collects one record per stage call. configure() turns it on:
+    log_path   - JSON-lines file the records are appended to (None = memory only)
+    profile    - also run each top-level stage under cProfile
+    profile_dir - where the .prof files go (open with pstats / snakeviz)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.log_path = None
+        self.profile = False
+        self.profile_dir = 'profiles'
+        self.records = []
+        self.run_id = None
+        self._depth = 0
+
+    def configure(self, log_path=None, profile=False, profile_dir='profiles', run_id=None):
+        self.enabled = True
+        self.log_path = log_path
+        self.profile = profile
+        self.profile_dir = profile_dir
+        self.run_id = run_id or time.strftime('%Y%m%dT%H%M%S') + f'-{os.getpid()}'
+        if profile:
+            os.makedirs(profile_dir, exist_ok=True)
+        return self
+
+    def settings(self):
+        """
+        configure() arguments for a worker process to record into the same
+        run and log (None while disabled). The worker's records are its own:
+        hand them back and extend() the parent's with them.
+        """
+        if not self.enabled:
+            return None
+        return {'log_path': self.log_path, 'profile': self.profile,
+                'profile_dir': self.profile_dir, 'run_id': self.run_id}
+
+    def extend(self, records):
+        """
+        Adds records made in a worker (which already appended them to the log).
+        """
+        self.records.extend(records)
+
+    @contextlib.contextmanager
+    def stage(self, name, data_in=None):
+        """
+        Context manager for one stage. Yields the record; call
+        record_output(record, df) for what came out (it is measured after
+        the clocks stop, so sizing the output isn't billed to the stage).
+        """
+        if not self.enabled:
+            yield {}
+            return
+
+        record = {'run_id': self.run_id, 'stage': name, 'pid': os.getpid(),
+                  'started': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                  'rows_in': _rows(data_in), 'frame_bytes_in': _frame_bytes(data_in),
+                  'rows_out': None, 'frame_bytes_out': None}
+        # Nested stages: only the outermost one resets the RSS counter or profiles
+        outer = self._depth == 0
+        record['peak_rss_scope'] = 'stage' if outer and _reset_peak_rss() else 'process'
+        profiler = cProfile.Profile() if self.profile and outer else None
+
+        self._depth += 1
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profiler:
+            profiler.enable()
+        try:
+            yield record
+            record['status'] = 'ok'
+        except BaseException as exc:
+            record['status'] = f'error: {type(exc).__name__}'
+            raise
+        finally:
+            if profiler:
+                profiler.disable()
+            record['wall_s'] = time.perf_counter() - wall
+            record['cpu_s'] = time.process_time() - cpu
+            record['peak_rss_bytes'] = _peak_rss_bytes()
+            if '_data_out' in record:
+                data_out = record.pop('_data_out')
+                record['rows_out'] = _rows(data_out)
+                record['frame_bytes_out'] = _frame_bytes(data_out)
+            self._depth -= 1
+            if profiler:
+                path = os.path.join(self.profile_dir, f'{self.run_id}_{name}.prof')
+                profiler.dump_stats(path)
+                record['profile'] = path
+            self._write(record)
+
+    def _write(self, record):
+        self.records.append(record)
+        if self.log_path:
+            # One write per line: records from worker processes don't interleave
+            with open(self.log_path, 'a') as f:
+                f.write(json.dumps(record) + '\n')
+
+    def summary(self):
+        """
+        The records of this run as a table (one row per stage call).
+        """
+        counts = ['rows_in', 'rows_out', 'frame_bytes_in', 'frame_bytes_out', 'peak_rss_bytes']
+        table = pd.DataFrame(self.records, columns=['stage', 'wall_s', 'cpu_s'] + counts)
+        return table.astype({col: 'Int64' for col in counts})
+
+def record_output(record, data_out):
+    """
+    Fills the 'out' side of a stage record from what the stage produced
+    (measured when the stage's 'with' block ends, after its timings).
+    """
+    if record:
+        record['_data_out'] = data_out
+
+# The recorder the pipelines report to
+RECORDER = StageRecorder()
+
+def instrumented(func=None, name=None):
+    """
+    Decorator: @instrumented or @instrumented(name='...').
+    Rows/memory in come from the first DataFrame or Series argument,
+    rows/memory out from the return value.
+    """
+    if func is None:
+        return functools.partial(instrumented, name=name)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not RECORDER.enabled:
+            return func(*args, **kwargs)
+        with RECORDER.stage(name or func.__name__, _first_frame(args, kwargs)) as record:
+            result = func(*args, **kwargs)
+            record_output(record, result)
+        return result
+    return wrapper
+
+def load_log(path):
+    """
+    Reads a JSON-lines metrics log into a DataFrame.
+    """
+    return pd.read_json(path, lines=True)
+
+# ==========================================
+# COMMAND LINE: compare runs in a metrics log
+# python instrumentation.py pipeline_metrics.jsonl
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Per-stage summary of a pipeline metrics log')
+    parser.add_argument('log', help='JSON-lines file written by --metrics')
+    parser.add_argument('--last', type=int, default=5, help='How many recent runs to show')
+    args = parser.parse_args()
+
+    print("--- SYSTEM: STAGE METRICS ---")
+    log = load_log(args.log)
+    runs = list(dict.fromkeys(log['run_id']))[-args.last:]
+    log = log[log['run_id'].isin(runs)]
+    log['peak_rss_mb'] = log['peak_rss_bytes'] / 1e6
+    table = log.pivot_table(index='stage', columns='run_id', values='wall_s', aggfunc='sum', sort=False)
+    print(">> Wall time per stage (s), oldest run first:")
+    print(table.round(4).to_string())
+    print("\n>> Latest run:")
+    print(log[log['run_id'] == runs[-1]][['stage', 'wall_s', 'cpu_s', 'rows_in', 'rows_out', 'peak_rss_mb']]
+          .to_string(index=False))
@@ -0,0 +1,235 @@
+import pandas as pd
+import numpy as np
+import argparse
+import importlib
+import importlib.util
+import time
+
+# numba is optional: without it every kernel runs its NumPy version.
+# It is only imported when a loop is first compiled (importing it takes ~0.5 s).
+HAVE_NUMBA = importlib.util.find_spec('numba') is not None
+
+# ==========================================
+# FORMULA KERNELS (NumPy ufunc chains / optional Numba loops)
+# Compounding, tiered rates and tax slabs keep getting written as iterrows
+# loops or as np.select over one full boolean mask per tier. Here each
+# formula is a Kernel with:
+#   - a NumPy version: ufuncs writing into preallocated buffers (out=...),
+#     so a chain of steps allocates its result once and no temporaries
+#   - optionally a plain loop over contiguous float64 arrays, compiled with
+#     numba.njit when numba is installed (one pass, no buffers at all)
+# Tiers are found with searchsorted / a lookup table: one O(log tiers) probe
+# per row instead of one mask per tier.
+# ==========================================
+
+# Annual return per risk level (the day6 pipeline's rates; one definition for both)
+# Logic: High risk = 15%, Medium = 10%, Low = 6%
+RISK_RATES = {'High': 0.15, 'Medium': 0.10, 'Low': 0.06}
+
+class Kernel:
+    """
+    One formula, two implementations: kernel(*args, backend='auto', out=None).
+    'numpy' is always there; 'numba' is used by 'auto' when numba is installed.
+    The first 'elementwise' arguments are per-row arrays; the rest are scalars
+    or small tables passed through unchanged.
+    """
+
+    def __init__(self, numpy_impl, loop_impl=None, elementwise=None):
+        self.numpy_impl = numpy_impl
+        self.loop_impl = loop_impl
+        self.elementwise = elementwise
+        self._jitted = None
+        self.__name__ = numpy_impl.__name__
+        self.__doc__ = numpy_impl.__doc__
+
+    @property
+    def backends(self):
+        return ['numpy'] + (['numba'] if HAVE_NUMBA and self.loop_impl is not None else [])
+
+    def __call__(self, *args, backend='auto', out=None):
+        if backend == 'auto':
+            backend = self.backends[-1]
+        if backend == 'numpy':
+            return self.numpy_impl(*args, out=out)
+        if backend != 'numba' or 'numba' not in self.backends:
+            raise ValueError(f"backend '{backend}' not available for {self.__name__} (have {self.backends})")
+        if self._jitted is None:
+            self._jitted = importlib.import_module('numba').njit(cache=True)(self.loop_impl)
+        split = len(args) if self.elementwise is None else self.elementwise
+        rows = [np.ascontiguousarray(a) for a in np.broadcast_arrays(*[_values(a) for a in args[:split]])]
+        rest = [_values(a) if np.ndim(a) else float(a) for a in args[split:]]
+        out = _out(out, *rows)
+        self._jitted(*rows, *rest, out)
+        return out
+
+def kernel(loop_impl=None, elementwise=None):
+    """
+    @kernel(loop) on the NumPy version turns it into a Kernel.
+    """
+    def wrap(numpy_impl):
+        return Kernel(numpy_impl, loop_impl, elementwise)
+    return wrap
+
+def _values(x):
+    return x.to_numpy(dtype=np.float64) if isinstance(x, pd.Series) else np.asarray(x, dtype=np.float64)
+
+def _out(out, *arrays):
+    return np.empty(np.broadcast_shapes(*[np.shape(a) for a in arrays]), dtype=np.float64) if out is None else out
+
+# --- simple profit: amount * rate (day3, day6) ---
+def _profit_loop(amount, rate, out):
+    for i in range(out.shape[0]):
+        out[i] = amount[i] * rate[i]
+
+@kernel(_profit_loop)
+def profit(amount, rate, out=None):
+    """
+    amount * rate.
+    """
+    amount, rate = _values(amount), _values(rate)
+    return np.multiply(amount, rate, out=_out(out, amount, rate))
+
+# --- compounding: principal * (1 + rate / periods) ** (periods * years) ---
+def _compound_loop(principal, rate, years, periods, out):
+    for i in range(out.shape[0]):
+        out[i] = principal[i] * (1.0 + rate[i] / periods) ** (periods * years[i])
+
+@kernel(_compound_loop, elementwise=3)
+def compound(principal, rate, years, periods=1, out=None):
+    """
+    Value after compounding 'periods' times a year for 'years' years.
+    """
+    principal, rate, years = _values(principal), _values(rate), _values(years)
+    out = _out(out, principal, rate, years)
+    np.divide(rate, periods, out=out)
+    np.add(out, 1.0, out=out)
+    np.power(out, np.multiply(years, periods), out=out)
+    return np.multiply(principal, out, out=out)
+
+# --- tiered rates: the rate of the tier each amount falls in ---
+def tier_index(values, thresholds):
+    """
+    Tier number per value: 0 below thresholds[0], 1 from thresholds[0], ...
+    (thresholds sorted ascending).
+    """
+    return np.searchsorted(np.asarray(thresholds, dtype=np.float64), _values(values), side='right')
+
+def tiered_rate(values, thresholds, rates, out=None):
+    """
+    rates[tier] per value; len(rates) == len(thresholds) + 1.
+    """
+    rates = np.asarray(rates, dtype=np.float64)
+    if len(rates) != len(thresholds) + 1:
+        raise ValueError("need one rate per tier: len(rates) == len(thresholds) + 1")
+    index = tier_index(values, thresholds)
+    return np.take(rates, index, out=_out(out, index))
+
+def lookup_rate(labels, table, default=0.0):
+    """
+    Rate per label from a {label: rate} table (e.g. risk_level -> return rate).
+    Categorical columns use their codes directly, so the table is consulted
+    once per category, not once per row. Unknown / missing labels get 'default'.
+    """
+    labels = labels if isinstance(labels, pd.Series) else pd.Series(labels)
+    if isinstance(labels.dtype, pd.CategoricalDtype):
+        codes, categories = labels.cat.codes.to_numpy(), labels.cat.categories
+    else:
+        codes, categories = pd.factorize(labels)
+    lookup = np.array([table.get(c, default) for c in categories] + [default], dtype=np.float64)
+    return lookup.take(codes)  # code -1 (missing) takes the last slot
+
+# --- progressive tax slabs ---
+def _slab_tables(slabs):
+    """
+    slabs = [(lower bound, rate), ...] ascending, first bound 0.
+    Returns (lower, tax due at each lower bound, rate) arrays.
+    """
+    lower = np.array([s[0] for s in slabs], dtype=np.float64)
+    rates = np.array([s[1] for s in slabs], dtype=np.float64)
+    base = np.concatenate([[0.0], np.cumsum(np.diff(lower) * rates[:-1])])
+    return lower, base, rates
+
+def _slab_tax_loop(income, lower, base, rates, out):
+    for i in range(out.shape[0]):
+        x = income[i]
+        t = 0
+        while t + 1 < lower.shape[0] and x >= lower[t + 1]:
+            t += 1
+        out[i] = base[t] + (x - lower[t]) * rates[t] if x > 0 else 0.0
+
+@kernel(_slab_tax_loop, elementwise=1)
+def _slab_tax(income, lower, base, rates, out=None):
+    income = _values(income)
+    out = _out(out, income)
+    slab = np.searchsorted(lower, income, side='right') - 1
+    np.clip(slab, 0, None, out=slab)
+    np.subtract(income, lower.take(slab), out=out)
+    np.multiply(out, rates.take(slab), out=out)
+    np.add(out, base.take(slab), out=out)
+    np.copyto(out, 0.0, where=~(income > 0))
+    return out
+
+def tax(income, slabs, backend='auto', out=None):
+    """
+    Progressive tax: each slice of income is taxed at its slab's rate.
+    One searchsorted per row, then base[slab] + (income - lower[slab]) * rate[slab].
+    """
+    return _slab_tax(income, *_slab_tables(slabs), backend=backend, out=out)
+
+# ==========================================
+# BENCHMARK: row loops vs np.select masks vs kernels
+# python kernels.py --rows 5000000
+# ==========================================
+INCOME_SLABS = [(0, 0.0), (300_000, 0.05), (700_000, 0.10), (1_000_000, 0.15), (1_200_000, 0.20), (1_500_000, 0.30)]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Formula kernels vs masks and loops')
+    parser.add_argument('--rows', type=int, default=5_000_000)
+    parser.add_argument('--loop-rows', type=int, default=50_000, help='Rows for the iterrows baseline')
+    args = parser.parse_args()
+
+    print("--- SYSTEM: BENCHMARKING FORMULA KERNELS ---")
+    print(f">> Backends: {profit.backends}")
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        'investment_amount': rng.integers(10_000, 5_000_000, args.rows).astype(np.float64),
+        'risk_level': pd.Categorical(rng.choice(['High', 'Medium', 'Low'], args.rows)),
+        'years': rng.integers(1, 30, args.rows).astype(np.float64),
+    })
+
+    def timed(label, func, rows=args.rows):
+        start = time.perf_counter()
+        result = func()
+        print(f"  {label:<44} {(time.perf_counter() - start) / rows * 1e9:8.1f} ns/row")
+        return result
+
+    print("\nReturn rate by risk level:")
+    masks = timed("np.select (one mask per level)", lambda: np.select(
+        [df['risk_level'] == k for k in RISK_RATES], list(RISK_RATES.values())))
+    table = timed("lookup_rate (category codes -> table)", lambda: lookup_rate(df['risk_level'], RISK_RATES))
+    assert np.array_equal(masks, table)
+
+    print("\nCompounded value:")
+    small = df.iloc[:args.loop_rows]
+    loop = timed("row loop (itertuples)", lambda: [r.investment_amount * (1 + RISK_RATES[r.risk_level] / 12) ** (12 * r.years)
+                                      for r in small.itertuples()], rows=args.loop_rows)
+    expression = timed("pandas expression (temporaries)", lambda: df['investment_amount'] * (1 + table / 12) ** (12 * df['years']))
+    for backend in compound.backends:
+        fused = timed(f"compound kernel ({backend})", lambda: compound(df['investment_amount'], table, df['years'], 12, backend=backend))
+        assert np.allclose(fused, expression) and np.allclose(fused[:args.loop_rows], loop)
+
+    print("\nIncome tax (slabs):")
+    incomes = df['investment_amount']
+
+    def tax_masks():
+        # The chained-mask way: one full pass per slab
+        lower, base, rates = _slab_tables(INCOME_SLABS)
+        result = np.zeros(len(incomes))
+        for t in range(len(lower)):
+            upper = lower[t + 1] if t + 1 < len(lower) else np.inf
+            in_slab = (incomes >= lower[t]) & (incomes < upper)
+            result[in_slab] = base[t] + (incomes[in_slab] - lower[t]) * rates[t]
+        return result
+    expected = timed("boolean mask per slab", tax_masks)
+    for backend in _slab_tax.backends:
+        got = timed(f"tax kernel ({backend})", lambda: tax(incomes, INCOME_SLABS, backend=backend))
+        assert np.allclose(got, expected)
@@ -0,0 +1,223 @@
+import numpy as np
+import argparse
+import json
+import os
+import sys
+import time
+
+# ==========================================
+# MODEL SERVICE (Persisted Linear Models)
+# day7_ml.py and day10_prediction.py rebuild their data and refit a
+# LinearRegression on every run, just to predict one or two numbers.
+# A linear model is only a few floats, so we:
+#   - keep the least-squares SUFFICIENT STATISTICS (row count, means, X'X, X'y,
+#     all centred on the means) next to the coefficients
+#   - save them as a small JSON file; loading is a json.load, no sklearn, no pandas
+#   - predict() is one NumPy dot product on a batch of rows
+#   - partial_fit() folds NEW months into the statistics and re-solves a tiny
+#     (features x features) system, instead of refitting on all the history
+# Centred statistics give the same answer as X'X / X'y with an intercept
+# column, without the precision loss of squaring raw rupee amounts.
+# ==========================================
+
+MODEL_DIR = 'models'
+
+class LinearModel:
+    """
+    Ordinary least squares with an intercept, fitted from running statistics.
+    Same coef_ / intercept_ as sklearn's LinearRegression on the same rows
+    (or as Ridge(alpha) when alpha > 0).
+    """
+
+    def __init__(self, features=None, alpha=0.0):
+        self.features = list(features) if features is not None else None
+        self.alpha = alpha
+        self.n = 0
+        self.mean_x = None
+        self.mean_y = 0.0
+        self.xtx = None      # sum of (x - mean_x)(x - mean_x)'
+        self.xty = None      # sum of (x - mean_x)(y - mean_y)
+        self.yty = 0.0       # sum of (y - mean_y)^2
+        self.coef_ = None
+        self.intercept_ = None
+
+    def _matrix(self, X):
+        # DataFrames are reordered to the training columns; anything else is used as is
+        if hasattr(X, 'columns'):
+            if self.features is None:
+                self.features = list(X.columns)
+            X = X[self.features]
+        X = np.asarray(X, dtype=np.float64)
+        return X.reshape(-1, 1) if X.ndim == 1 else X
+
+    def partial_fit(self, X, y):
+        """
+        Adds rows to the statistics and re-solves the coefficients.
+        """
+        self._absorb(*self._batch_stats(X, y))
+        if self.n:
+            self._solve()
+        return self
+
+    def _batch_stats(self, X, y):
+        X = self._matrix(X)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if len(X) != len(y):
+            raise ValueError("X and y must have the same number of rows")
+        if len(y) == 0:
+            return 0, None, 0.0, None, None, 0.0
+        mean_x, mean_y = X.mean(axis=0), y.mean()
+        dx, dy = X - mean_x, y - mean_y
+        return len(y), mean_x, mean_y, dx.T @ dx, dx.T @ dy, dy @ dy
+
+    def _absorb(self, n_b, mean_xb, mean_yb, xtx_b, xty_b, yty_b):
+        # Merge another set of statistics into ours (Chan et al. pairwise update)
+        if n_b == 0:
+            return
+        if self.n == 0:
+            self.n, self.mean_x, self.mean_y = n_b, mean_xb, mean_yb
+            self.xtx, self.xty, self.yty = xtx_b, xty_b, yty_b
+            return
+        n = self.n + n_b
+        shift_x, shift_y = mean_xb - self.mean_x, mean_yb - self.mean_y
+        weight = self.n * n_b / n
+        self.xtx = self.xtx + xtx_b + weight * np.outer(shift_x, shift_x)
+        self.xty = self.xty + xty_b + weight * shift_x * shift_y
+        self.yty = self.yty + yty_b + weight * shift_y * shift_y
+        self.mean_x = self.mean_x + shift_x * n_b / n
+        self.mean_y = self.mean_y + shift_y * n_b / n
+        self.n = n
+
+    def merge(self, other):
+        """
+        Adds the rows another model was fitted on (e.g. from a worker process),
+        as if they had been passed to partial_fit() here.
+        """
+        if other.features != self.features and None not in (other.features, self.features):
+            raise ValueError(f"features differ: {self.features} vs {other.features}")
+        if self.features is None:
+            self.features = other.features
+        self._absorb(other.n, other.mean_x, other.mean_y, other.xtx, other.xty, other.yty)
+        if self.n:
+            self._solve()
+        return self
+
+    def fit(self, X, y):
+        """
+        Fits from scratch (forgets earlier rows).
+        """
+        features, alpha = self.features, self.alpha
+        self.__init__(features, alpha)
+        return self.partial_fit(X, y)
+
+    def _solve(self):
+        # alpha > 0: ridge penalty on the coefficients (not the intercept), like sklearn's Ridge.
+        # lstsq instead of solve: a constant feature gives a singular X'X
+        gram = self.xtx + self.alpha * np.eye(len(self.xtx)) if self.alpha else self.xtx
+        self.coef_ = np.linalg.lstsq(gram, self.xty, rcond=None)[0]
+        self.intercept_ = float(self.mean_y - self.mean_x @ self.coef_)
+
+    def predict(self, X):
+        """
+        Predictions for a batch of rows: X @ coef + intercept.
+        X can be a 2-D array, a list of rows, a 1-D array of single-feature
+        values, or a DataFrame (columns picked by name).
+        """
+        if self.coef_ is None:
+            raise ValueError("model is not fitted yet")
+        return self._matrix(X) @ self.coef_ + self.intercept_
+
+    def to_dict(self):
+        return {
+            'features': self.features, 'alpha': self.alpha, 'n': self.n,
+            'mean_x': self.mean_x.tolist(), 'mean_y': self.mean_y,
+            'xtx': self.xtx.tolist(), 'xty': self.xty.tolist(), 'yty': self.yty,
+            'coef': self.coef_.tolist(), 'intercept': self.intercept_,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        model = cls(state['features'], state.get('alpha', 0.0))
+        model.n = state['n']
+        model.mean_x = np.array(state['mean_x'])
+        model.mean_y = state['mean_y']
+        model.xtx = np.array(state['xtx'])
+        model.xty = np.array(state['xty'])
+        model.yty = state['yty']
+        model.coef_ = np.array(state['coef'])
+        model.intercept_ = state['intercept']
+        return model
+
+class ModelService:
+    """
+    Named models in one directory (<name>.json). Loaded models stay in memory
+    and are only re-read when their file changes.
+    """
+
+    def __init__(self, path=MODEL_DIR):
+        self.path = path
+        self._loaded = {}  # name -> (file mtime, model)
+
+    def _file(self, name):
+        return os.path.join(self.path, f'{name}.json')
+
+    def save(self, name, model):
+        os.makedirs(self.path, exist_ok=True)
+        tmp = self._file(name) + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(model.to_dict(), f)
+        os.replace(tmp, self._file(name))
+        self._loaded[name] = (os.stat(self._file(name)).st_mtime_ns, model)
+
+    def load(self, name):
+        mtime = os.stat(self._file(name)).st_mtime_ns
+        cached = self._loaded.get(name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(self._file(name)) as f:
+            model = LinearModel.from_dict(json.load(f))
+        self._loaded[name] = (mtime, model)
+        return model
+
+    def predict(self, name, X):
+        return self.load(name).predict(X)
+
+    def update(self, name, X, y):
+        """
+        Folds new rows (e.g. this month's figures) into a saved model and saves it.
+        """
+        model = self.load(name).partial_fit(X, y)
+        self.save(name, model)
+        return model
+
+# ==========================================
+# COMMAND LINE: answer from a saved model without refitting
+# python model_service.py revenue 75000 90000
+# python model_service.py revenue --add 80000 345000       (a new month)
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Predict from (or update) a saved linear model')
+    parser.add_argument('model', help="Model name, e.g. 'revenue' (day10) or 'salary' (day7)")
+    parser.add_argument('values', nargs='*', type=float, help='Single-feature inputs to predict')
+    parser.add_argument('--add', nargs=2, type=float, action='append', metavar=('X', 'Y'),
+                        help='Fold a new observation into the model (repeatable)')
+    parser.add_argument('--dir', default=MODEL_DIR)
+    args = parser.parse_args()
+
+    service = ModelService(args.dir)
+    if not os.path.exists(service._file(args.model)):
+        sys.exit(f"no saved model '{args.model}' in '{args.dir}' (run the day script that trains it first)")
+
+    if args.add:
+        observations = np.array(args.add)
+        model = service.update(args.model, observations[:, :1], observations[:, 1])
+        print(f">> '{args.model}' updated with {len(observations)} row(s): n={model.n}, "
+              f"intercept {model.intercept_:,.2f}, coef {model.coef_.round(4).tolist()}")
+
+    if args.values:
+        start = time.perf_counter()
+        predictions = service.predict(args.model, args.values)
+        elapsed = time.perf_counter() - start
+        for value, prediction in zip(args.values, predictions):
+            print(f"{value:>14,.2f} -> {prediction:,.2f}")
+        print(f">> load + predict: {elapsed * 1e6:.0f} us")
@@ -0,0 +1,220 @@
+import pandas as pd
+import numpy as np
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from model_service import LinearModel, ModelService
+
+# ==========================================
+# ONLINE LEAST SQUARES (Out-of-Core Regression)
+# LinearRegression.fit() needs the whole X matrix in memory. The least-squares
+# answer only needs the normal-equation statistics (means, X'X, X'y), which
+# are features x features no matter how many rows there are. So:
+#   - each chunk is folded into a LinearModel (model_service.py) and dropped
+#   - each worker process fits its own partitions; the statistics MERGE exactly
+#   - optional ridge term (alpha), solved at the end like sklearn's Ridge
+#   - rows are split into train / held-out by a hash of their position, and
+#     the held-out R2 is accumulated chunk by chunk as well (HeldOutR2)
+# Memory is O(chunksize x features + features^2), whatever the row count.
+# ==========================================
+
+class HeldOutR2:
+    """
+    R2 = 1 - SSE / SST accumulated over a stream of (y_true, y_pred) chunks.
+    SST uses a running mean (pairwise update), so chunks and workers merge exactly.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.sst = 0.0   # sum of (y - mean)^2
+        self.sse = 0.0   # sum of (y - y_pred)^2
+
+    def update(self, y_true, y_pred):
+        y_true = np.asarray(y_true, dtype=np.float64)
+        if len(y_true) == 0:
+            return self
+        other = HeldOutR2()
+        other.n, other.mean = len(y_true), y_true.mean()
+        other.sst = float(((y_true - other.mean) ** 2).sum())
+        other.sse = float(((y_true - np.asarray(y_pred)) ** 2).sum())
+        return self.merge(other)
+
+    def merge(self, other):
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        shift = other.mean - self.mean
+        self.sst += other.sst + shift * shift * self.n * other.n / n
+        self.mean += shift * other.n / n
+        self.sse += other.sse
+        self.n = n
+        return self
+
+    def score(self):
+        return 1 - self.sse / self.sst if self.sst > 0 else np.nan
+
+def holdout_mask(row_ids, test_fraction, seed=0):
+    """
+    True for rows that belong to the held-out set. Decided by a hash of the
+    row's position, so the training pass and the scoring pass agree without
+    storing anything.
+    """
+    if test_fraction <= 0:
+        return np.zeros(len(row_ids), dtype=bool)
+    mixed = (np.asarray(row_ids, dtype=np.uint64) + np.uint64(seed)) * np.uint64(0x9E3779B97F4A7C15)
+    mixed ^= mixed >> np.uint64(29)
+    return (mixed >> np.uint64(11)).astype(np.float64) / float(1 << 53) < test_fraction
+
+# ==========================================
+# PARTITIONS
+# A partition is a CSV/Parquet path, or ('synthetic', seed, rows, n_features)
+# for generated per-campaign data. Row ids are (partition number << 40) + row,
+# so the held-out split doesn't depend on chunk size or on the worker count.
+# ==========================================
+SYNTHETIC_INTERCEPT = 50_000.0
+
+def synthetic_coefficients(n_features):
+    return np.linspace(3.5, -1.0, n_features)
+
+def partition_arrays(partition, features, target, chunksize):
+    """
+    Yields (X, y) float64 chunks of at most 'chunksize' rows.
+    """
+    if isinstance(partition, tuple) and partition[0] == 'synthetic':
+        _, seed, rows, n_features = partition
+        rng = np.random.default_rng(seed)
+        coefs = synthetic_coefficients(n_features)
+        for start in range(0, rows, chunksize):
+            n = min(chunksize, rows - start)
+            X = rng.uniform(10_000, 100_000, (n, n_features))
+            y = X @ coefs + SYNTHETIC_INTERCEPT + rng.normal(0, 20_000, n)
+            yield X, y
+        return
+
+    columns = list(features) + [target]
+    if str(partition).endswith(('.parquet', '.pq')):
+        import pyarrow.parquet as pq
+        batches = (b.to_pandas() for b in pq.ParquetFile(partition).iter_batches(batch_size=chunksize, columns=columns))
+    else:
+        batches = pd.read_csv(partition, usecols=columns, chunksize=chunksize)
+    for chunk in batches:
+        chunk = chunk.dropna()
+        yield chunk[list(features)].to_numpy(dtype=np.float64), chunk[target].to_numpy(dtype=np.float64)
+
+def _chunks_with_ids(number, partition, features, target, chunksize):
+    offset = number << 40
+    for X, y in partition_arrays(partition, features, target, chunksize):
+        yield X, y, np.arange(offset, offset + len(y))
+        offset += len(y)
+
+def _fit_partition(task):
+    number, partition, features, target, chunksize, alpha, test_fraction, seed = task
+    model = LinearModel(features, alpha)
+    for X, y, ids in _chunks_with_ids(number, partition, features, target, chunksize):
+        train = ~holdout_mask(ids, test_fraction, seed)
+        model.partial_fit(X[train], y[train])
+    return model.to_dict() if model.n else None
+
+def _score_partition(task):
+    number, partition, features, target, chunksize, state, test_fraction, seed = task
+    model = LinearModel.from_dict(state)
+    r2 = HeldOutR2()
+    for X, y, ids in _chunks_with_ids(number, partition, features, target, chunksize):
+        test = holdout_mask(ids, test_fraction, seed)
+        r2.update(y[test], model.predict(X[test]))
+    return r2
+
+def fit_partitions(partitions, features, target, alpha=0.0, test_fraction=0.2, seed=0,
+                   chunksize=1_000_000, workers=1):
+    """
+    Fits one least-squares model over every partition, chunk by chunk.
+    Returns (model, held-out R2). Pass 1 fits the training rows (workers
+    merge in partition order, so the result doesn't depend on 'workers');
+    pass 2 scores the held-out rows with the final coefficients.
+    """
+    features = list(features)
+    fit_tasks = [(i, p, features, target, chunksize, alpha, test_fraction, seed) for i, p in enumerate(partitions)]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            states = list(pool.map(_fit_partition, fit_tasks))
+    else:
+        states = [_fit_partition(task) for task in fit_tasks]
+
+    model = LinearModel(features, alpha)
+    for state in states:
+        if state is not None:
+            model.merge(LinearModel.from_dict(state))
+    if model.n == 0:
+        raise ValueError("no training rows")
+
+    r2 = HeldOutR2()
+    if test_fraction > 0:
+        score_tasks = [(i, p, features, target, chunksize, model.to_dict(), test_fraction, seed)
+                       for i, p in enumerate(partitions)]
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_score_partition, score_tasks))
+        else:
+            parts = [_score_partition(task) for task in score_tasks]
+        for part in parts:
+            r2.merge(part)
+    return model, r2.score()
+
+# ==========================================
+# COMMAND LINE
+# python online_regression.py --input campaigns_*.csv --features Marketing_Spend --target Revenue
+# python online_regression.py --rows 100000000 --features 20 --workers 8    (synthetic)
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Chunked, mergeable least squares')
+    parser.add_argument('--input', nargs='+', help='CSV/Parquet partitions (default: synthetic data)')
+    parser.add_argument('--features', nargs='+', default=['20'],
+                        help='Feature columns (with --input) or the number of synthetic features')
+    parser.add_argument('--target', default='Revenue')
+    parser.add_argument('--rows', type=int, default=20_000_000, help='Synthetic rows')
+    parser.add_argument('--partitions', type=int, default=8, help='Synthetic partitions')
+    parser.add_argument('--chunksize', type=int, default=500_000)
+    parser.add_argument('--alpha', type=float, default=0.0, help='Ridge penalty (0 = plain least squares)')
+    parser.add_argument('--test-fraction', type=float, default=0.2)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--check-rows', type=int, default=200_000,
+                        help='Also fit sklearn on this many synthetic rows and compare (0 = skip)')
+    parser.add_argument('--save', help='Save the fitted model to the model service under this name')
+    args = parser.parse_args()
+
+    print("--- SYSTEM: ONLINE LEAST SQUARES ---")
+    if args.input:
+        partitions, features = args.input, args.features
+    else:
+        n_features = int(args.features[0])
+        features = [f'x{i}' for i in range(n_features)]
+        per_part = -(-args.rows // args.partitions)
+        partitions = [('synthetic', seed, min(per_part, args.rows - seed * per_part), n_features)
+                      for seed in range(args.partitions) if seed * per_part < args.rows]
+
+    start = time.perf_counter()
+    model, r2 = fit_partitions(partitions, features, args.target, args.alpha, args.test_fraction,
+                               chunksize=args.chunksize, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f">> Fitted on {model.n:,} training rows in {elapsed:.1f}s ({args.workers} worker(s)), "
+          f"held-out R2 {r2:.4f}")
+    print(f"   intercept {model.intercept_:,.2f}, coef {np.round(model.coef_, 4).tolist()}")
+
+    if not args.input and args.check_rows:
+        from sklearn.linear_model import LinearRegression, Ridge
+        X, y = next(partition_arrays(('synthetic', 99, args.check_rows, n_features),
+                                     features, args.target, args.check_rows))
+        streamed = LinearModel(features, args.alpha)
+        step = max(1, args.check_rows // 7)
+        for start in range(0, len(y), step):
+            streamed.partial_fit(X[start:start + step], y[start:start + step])
+        reference = (Ridge(alpha=args.alpha) if args.alpha else LinearRegression()).fit(X, y)
+        error = max(np.max(np.abs(streamed.coef_ - reference.coef_) / np.abs(reference.coef_).max()),
+                    abs(streamed.intercept_ - reference.intercept_) / abs(reference.intercept_))
+        print(f">> sklearn check on {args.check_rows:,} rows: max relative difference {error:.1e}")
+
+    if args.save:
+        ModelService().save(args.save, model)
+        print(f">> Saved as model '{args.save}'")
@@ -0,0 +1,169 @@
+import pandas as pd
+import numpy as np
+import argparse
+import json
+import os
+
+# ==========================================
+# COLUMNAR PRICE STORE (np.memmap)
+# day9_quant.py rebuilds its gold series in memory on every run.
+# Years of bars live better on disk as plain fixed-dtype columns:
+#   <store>/timestamp.i8   int64 nanoseconds since 1970, sorted
+#   <store>/price.f8       float64 prices
+#   <store>/index.json     row count + first/last timestamp
+# Opening is instant (np.memmap, nothing is read), date-range slices are
+# zero-copy views found with searchsorted, and new bars are appended.
+# ==========================================
+
+COLUMNS = {'timestamp': np.int64, 'price': np.float64}
+
+class PriceStore:
+    """
+    Append-only on-disk store of (timestamp, price) bars for one instrument.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._index_path = os.path.join(path, 'index.json')
+        if os.path.exists(self._index_path):
+            with open(self._index_path) as f:
+                self.index = json.load(f)
+        else:
+            self.index = {'rows': 0, 'first': None, 'last': None}
+            for name in COLUMNS:
+                open(self._column_path(name), 'wb').close()
+            self._save_index()
+        self._maps = {}
+
+    def _column_path(self, name):
+        suffix = 'i8' if COLUMNS[name] == np.int64 else 'f8'
+        return os.path.join(self.path, f'{name}.{suffix}')
+
+    def _save_index(self):
+        # Write then rename, so a crash never leaves a half-written index
+        tmp = self._index_path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.index, f)
+        os.replace(tmp, self._index_path)
+
+    def __len__(self):
+        return self.index['rows']
+
+    def column(self, name):
+        """
+        The whole column as a read-only memmap (no data is read until used).
+        """
+        rows = self.index['rows']
+        if rows == 0:
+            return np.empty(0, dtype=COLUMNS[name])
+        cached = self._maps.get(name)
+        if cached is None or len(cached) != rows:
+            cached = np.memmap(self._column_path(name), dtype=COLUMNS[name], mode='r', shape=(rows,))
+            self._maps[name] = cached
+        return cached
+
+    def append(self, timestamps, prices):
+        """
+        Adds new bars at the end. Timestamps must be sorted and later than
+        the last stored bar (corrections of old bars are not an append).
+        """
+        timestamps = pd.DatetimeIndex(pd.to_datetime(timestamps)).as_unit('ns').asi8
+        prices = np.asarray(prices, dtype=np.float64)
+        if len(timestamps) != len(prices):
+            raise ValueError("timestamps and prices must have the same length")
+        if len(timestamps) == 0:
+            return
+        if np.any(np.diff(timestamps) <= 0):
+            raise ValueError("timestamps must be strictly increasing")
+        if self.index['last'] is not None and timestamps[0] <= self.index['last']:
+            raise ValueError(f"bar at {pd.Timestamp(timestamps[0])} is not after the last stored bar "
+                             f"{pd.Timestamp(self.index['last'])}")
+
+        # Data first, index last: readers only ever see complete rows.
+        # Bytes past index['rows'] are left over from an append that crashed
+        # before its index write: cut them off, or the new rows land behind them.
+        for name, values in (('timestamp', timestamps), ('price', prices)):
+            with open(self._column_path(name), 'r+b') as f:
+                f.truncate(self.index['rows'] * np.dtype(COLUMNS[name]).itemsize)
+                f.seek(0, os.SEEK_END)
+                f.write(np.ascontiguousarray(values, dtype=COLUMNS[name]).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+        if self.index['first'] is None:
+            self.index['first'] = int(timestamps[0])
+        self.index['last'] = int(timestamps[-1])
+        self.index['rows'] += len(timestamps)
+        self._save_index()
+
+    def append_frame(self, df, column='price'):
+        """
+        append() for a DataFrame/Series with a DatetimeIndex (e.g. day9's df['Gold_Price']).
+        """
+        values = df[column] if isinstance(df, pd.DataFrame) else df
+        self.append(values.index, values.to_numpy())
+
+    def _bounds(self, start=None, end=None):
+        timestamps = self.column('timestamp')
+        lo = 0 if start is None else int(np.searchsorted(timestamps, pd.Timestamp(start).as_unit('ns').value, side='left'))
+        hi = len(timestamps) if end is None else int(np.searchsorted(timestamps, pd.Timestamp(end).as_unit('ns').value, side='right'))
+        return lo, hi
+
+    def slice(self, start=None, end=None):
+        """
+        (timestamps, prices) for start <= t <= end as zero-copy memmap views.
+        """
+        lo, hi = self._bounds(start, end)
+        return self.column('timestamp')[lo:hi], self.column('price')[lo:hi]
+
+    def series(self, start=None, end=None, name='Gold_Price'):
+        """
+        A pandas Series with a DatetimeIndex, ready for resample('M') or rolling().
+        The prices are not copied: the Series wraps the memmap slice.
+        """
+        timestamps, prices = self.slice(start, end)
+        index = pd.DatetimeIndex(np.asarray(timestamps).view('datetime64[ns]'), name='Date')
+        return pd.Series(prices, index=index, name=name, copy=False)
+
+    def rolling_mean(self, window, start=None, end=None):
+        """
+        SMA over [start, end], warmed up with the 'window - 1' bars before 'start',
+        so the first value is already defined (unlike slicing and then rolling).
+        """
+        lo, hi = self._bounds(start, end)
+        warm = max(0, lo - (window - 1))
+        prices = self.column('price')[warm:hi]
+        csum = np.concatenate([[0.0], np.cumsum(prices)])
+        sma = np.full(len(prices), np.nan)
+        sma[window - 1:] = (csum[window:] - csum[:-window]) / window
+        index = pd.DatetimeIndex(np.asarray(self.column('timestamp')[lo:hi]).view('datetime64[ns]'), name='Date')
+        return pd.Series(sma[lo - warm:], index=index, name=f'SMA_{window}')
+
+# ==========================================
+# DEMO: write the day9 gold series once, then read slices back
+# python price_store.py --store gold_store
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Memory-mapped gold price store')
+    parser.add_argument('--store', default='gold_store', help='Directory of the store')
+    args = parser.parse_args()
+
+    store = PriceStore(args.store)
+    if len(store) == 0:
+        # Same random walk as day9_quant.py, appended in two batches
+        dates = pd.date_range(start='2025-01-01', periods=365, freq='D')
+        np.random.seed(42)
+        prices = 50000 + np.cumsum(np.random.normal(loc=10, scale=500, size=365))
+        store.append(dates[:180], prices[:180])
+        store.append(dates[180:], prices[180:])
+        print(f">> Store created at '{args.store}' with {len(store)} bars.")
+    else:
+        print(f">> Store opened at '{args.store}' with {len(store)} bars.")
+
+    gold = store.series()
+    print("\n--- MONTHLY AVERAGE PRICES (straight from the memmap) ---")
+    print(gold.resample('ME').mean().head())
+
+    print("\n--- Q2 SLICE WITH A WARM 20-DAY SMA ---")
+    print(store.rolling_mean(20, '2025-04-01', '2025-06-30').head())
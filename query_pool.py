@@ -0,0 +1,170 @@
+import sqlite3
+import pandas as pd
+import argparse
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from analytics_store import AnalyticsStore, REPORTS, DEFAULT_PATH, make_employees
+
+# ==========================================
+# CONNECTION POOL + CONCURRENT QUERY RUNNER
+# A report request fires several independent read queries (rank, lag, CTE...).
+# Run one after another they wait on each other. Here:
+#   - a fixed number of READ-ONLY connections to the shared database file
+#     (WAL mode lets them all read while a writer commits)
+#   - checkout() hands one connection to one thread at a time, waiting at
+#     most 'checkout_timeout' seconds for a free one
+#   - every query gets a deadline; SQLite's progress handler aborts it when
+#     the deadline passes, so a slow report can't hold a connection forever
+#   - run_many() runs a dict of queries on a thread pool (sqlite3 releases
+#     the GIL while SQLite works) and returns one DataFrame per query
+# ==========================================
+
+class QueryTimeout(TimeoutError):
+    pass
+
+class ConnectionPool:
+    """
+    'size' read-only connections to one SQLite file, shared between threads.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, size=4, checkout_timeout=10.0):
+        self.path = path
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self._idle = queue.Queue()
+        self._all = []
+        self._lock = threading.Lock()
+        for _ in range(size):
+            conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True, check_same_thread=False)
+            conn.execute('PRAGMA query_only=ON')
+            self._all.append(conn)
+            self._idle.put(conn)
+
+    @contextmanager
+    def checkout(self):
+        """
+        with pool.checkout() as conn: ...   (the connection goes back afterwards)
+        """
+        try:
+            conn = self._idle.get(timeout=self.checkout_timeout)
+        except queue.Empty:
+            raise QueryTimeout(f"no free connection within {self.checkout_timeout}s "
+                               f"(pool size {self.size})") from None
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def read(self, sql, params=(), timeout=None):
+        """
+        Runs one query on a pooled connection and returns it as a DataFrame.
+        Raises QueryTimeout if it runs for longer than 'timeout' seconds.
+        """
+        with self.checkout() as conn:
+            if timeout is not None:
+                deadline = time.monotonic() + timeout
+                # Called every 10k SQLite VM steps; a non-zero return aborts the query
+                conn.set_progress_handler(lambda: time.monotonic() > deadline, 10_000)
+            try:
+                cursor = conn.execute(sql, params)
+                columns = [d[0] for d in cursor.description]
+                rows = cursor.fetchall()
+            except sqlite3.OperationalError as error:
+                if timeout is not None and time.monotonic() > deadline:
+                    raise QueryTimeout(f"query exceeded {timeout}s") from error
+                raise
+            finally:
+                if timeout is not None:
+                    conn.set_progress_handler(None, 0)
+        return pd.DataFrame.from_records(rows, columns=columns)
+
+    def close(self):
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def run_many(pool, queries, timeout=None):
+    """
+    Runs independent queries concurrently on the pool.
+    'queries' maps a name to SQL or to (SQL, params). Returns {name: DataFrame}
+    in the same order; the first failing query's error (e.g. QueryTimeout) is raised.
+    """
+    jobs = {name: (q, ()) if isinstance(q, str) else q for name, q in queries.items()}
+    with ThreadPoolExecutor(max_workers=min(pool.size, len(jobs)) or 1) as executor:
+        futures = {name: executor.submit(pool.read, sql, params, timeout) for name, (sql, params) in jobs.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+def run_serial(conn, queries):
+    """
+    The day2 way: one connection, one query after another (the baseline).
+    """
+    results = {}
+    for name, q in queries.items():
+        sql, params = (q, ()) if isinstance(q, str) else q
+        cursor = conn.execute(sql, params)
+        results[name] = pd.DataFrame.from_records(cursor.fetchall(), columns=[d[0] for d in cursor.description])
+    return results
+
+# ==========================================
+# BENCHMARK: the three day2 reports, serial vs run_many()
+# python query_pool.py --rows 200000 --requests 10 --pool 4
+# ==========================================
+DAY2_QUERIES = {
+    'dense_rank': REPORTS['dense_rank'],
+    'lag': REPORTS['lag'],
+    'high_earners': (REPORTS['high_earners'], (75000,)),
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Pooled, concurrent SQLite report queries')
+    parser.add_argument('--db', default=DEFAULT_PATH)
+    parser.add_argument('--rows', type=int, default=200_000, help='Employees to load first (0 = use the file as is)')
+    parser.add_argument('--requests', type=int, default=10, help='Report requests to time')
+    parser.add_argument('--pool', type=int, default=4, help='Read connections')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Per-query timeout in seconds')
+    args = parser.parse_args()
+
+    print("--- SYSTEM: QUERY POOL BENCHMARK ---")
+    if args.rows:
+        with AnalyticsStore(args.db) as store:
+            store.load('employees', make_employees(args.rows), replace=True)
+        print(f">> Loaded {args.rows:,} employees into '{args.db}'")
+
+    serial_conn = sqlite3.connect(f'file:{args.db}?mode=ro', uri=True)
+    with ConnectionPool(args.db, size=args.pool) as pool:
+        # Same answers both ways
+        expected = run_serial(serial_conn, DAY2_QUERIES)
+        got = run_many(pool, DAY2_QUERIES, timeout=args.timeout)
+        for name in DAY2_QUERIES:
+            pd.testing.assert_frame_equal(got[name], expected[name])
+
+        for label, run in (('serial   ', lambda: run_serial(serial_conn, DAY2_QUERIES)),
+                           ('run_many ', lambda: run_many(pool, DAY2_QUERIES, timeout=args.timeout))):
+            latencies = []
+            start = time.perf_counter()
+            for _ in range(args.requests):
+                t0 = time.perf_counter()
+                run()
+                latencies.append(time.perf_counter() - t0)
+            elapsed = time.perf_counter() - start
+            latencies = pd.Series(latencies)
+            print(f"  {label} p50 {latencies.median() * 1e3:8.1f} ms | max {latencies.max() * 1e3:8.1f} ms | "
+                  f"{args.requests / elapsed:6.2f} requests/s")
+
+        # A deadline far below the report time must abort, not hang
+        try:
+            pool.read(REPORTS['lag'], timeout=0.001)
+            print(">> Timeout check: query finished before the deadline")
+        except QueryTimeout as error:
+            print(f">> Timeout check: {error}")
+    serial_conn.close()
@@ -0,0 +1,138 @@
+import matplotlib
+matplotlib.use('Agg', force=True)  # never open a window, never block: charts only go to files
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import numpy as np
+import functools
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+# ==========================================
+# HEADLESS CHART RENDERING (Agg + Process Pool + PNG Cache)
+# The day scripts draw with pyplot at dpi=300 and some call plt.show(), which
+# waits for a human. Here a chart is a SPEC: a draw function (in charts.py),
+# its data, the output file, size and dpi. render_many():
+#   - hashes the spec + the data + the source of the draw function's module
+#     (its helpers included) + the matplotlib / seaborn versions
+#   - if <cache>/<hash>.png exists, just copies it (nothing is drawn)
+#   - otherwise draws the missing charts in a process pool, Agg backend
+#   - closes every figure it opens, so long-running jobs don't pile them up
+# ==========================================
+
+CACHE_DIR = '.chart_cache'
+
+class Chart:
+    """
+    One figure: draw(data, **options) is called with a fresh current figure
+    (so plain plt.* / seaborn calls land on it), then saved to 'filename'.
+    'draw' must be a module-level function so worker processes can import it.
+    """
+
+    def __init__(self, draw, data, filename, figsize=(10, 6), dpi=300, **options):
+        self.draw = draw
+        self.data = data
+        self.filename = filename
+        self.figsize = tuple(figsize)
+        self.dpi = dpi
+        self.options = options
+
+    def key(self):
+        """
+        Content address of the PNG: same key <=> same picture.
+        """
+        digest = hashlib.sha256()
+        # The whole module, not just the function: editing a helper it calls redraws too
+        try:
+            source = inspect.getsource(inspect.getmodule(self.draw))
+        except (OSError, TypeError):
+            source = ''
+        digest.update(f'{self.draw.__module__}.{self.draw.__qualname__}\n{source}'.encode())
+        spec = {'figsize': self.figsize, 'dpi': self.dpi, 'options': self.options,
+                'libraries': _library_versions()}
+        digest.update(json.dumps(spec, sort_keys=True, default=repr).encode())
+        _hash_data(self.data, digest)
+        return digest.hexdigest()
+
+@functools.cache
+def _library_versions():
+    # An upgrade can change every picture, so it is part of every key
+    versions = {'matplotlib': matplotlib.__version__}
+    for name in ('seaborn', 'numpy', 'pandas'):
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+def _hash_data(data, digest):
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        labels = list(data.columns) if isinstance(data, pd.DataFrame) else [data.name]
+        dtypes = list(data.dtypes) if isinstance(data, pd.DataFrame) else [data.dtype]
+        digest.update(repr((type(data).__name__, data.shape, labels, [str(t) for t in dtypes])).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    elif isinstance(data, np.ndarray):
+        digest.update(repr((data.shape, str(data.dtype))).encode())
+        digest.update(np.ascontiguousarray(data).tobytes())
+    elif isinstance(data, dict):
+        for name in sorted(data):
+            digest.update(repr(name).encode())
+            _hash_data(data[name], digest)
+    elif isinstance(data, (list, tuple)):
+        digest.update(f'{type(data).__name__}:{len(data)}'.encode())
+        for item in data:
+            _hash_data(item, digest)
+    else:
+        digest.update(repr(data).encode())
+
+def _draw(task):
+    """
+    Worker: draws one chart into the cache. Always closes its figure.
+    """
+    chart, path = task
+    fig = plt.figure(figsize=chart.figsize)
+    try:
+        chart.draw(chart.data, **chart.options)
+        tmp = path + '.tmp.png'
+        fig.savefig(tmp, dpi=chart.dpi)
+        os.replace(tmp, path)  # a crash never leaves a half-written PNG in the cache
+    finally:
+        plt.close(fig)
+    return path
+
+def render_many(charts, workers=None, cache_dir=CACHE_DIR):
+    """
+    Renders every chart (cache hits are copied, misses drawn in parallel).
+    Returns {filename: 'cached' | 'rendered'}.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    paths = [os.path.join(cache_dir, f'{chart.key()}.png') for chart in charts]
+
+    missing = {}
+    for chart, path in zip(charts, paths):
+        if not os.path.exists(path):
+            missing.setdefault(path, chart)  # identical specs are drawn once
+    workers = min(workers or os.cpu_count(), len(missing))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_draw, [(chart, path) for path, chart in missing.items()]))
+    else:
+        for path, chart in missing.items():
+            _draw((chart, path))
+
+    status = {}
+    for chart, path in zip(charts, paths):
+        shutil.copyfile(path, chart.filename)
+        status[chart.filename] = 'rendered' if path in missing else 'cached'
+    return status
+
+def render(chart, cache_dir=CACHE_DIR):
+    """
+    render_many() for a single chart, drawn in this process.
+    """
+    return render_many([chart], workers=1, cache_dir=cache_dir)[chart.filename]
@@ -0,0 +1,246 @@
+import pandas as pd
+import numpy as np
+import argparse
+import os
+
+# ==========================================
+# ROLLUP CACHE (Precomputed Resample Partials)
+# resample('M').mean() rescans every raw price on every call.
+# Instead we keep, per period, the partial aggregates that MERGE:
+#   sum, count, min, max, first, last
+# mean = sum / count, OHLC = first / max / min / last. A quarter is just three
+# merged months, a week is seven merged days, so no raw price is read twice.
+# New bars update only the latest periods. Corrected history must be
+# invalidated explicitly and re-added in full (see invalidate()).
+# ==========================================
+
+PARTIALS = ['sum', 'count', 'min', 'max', 'first', 'last']
+MERGE = {'sum': 'sum', 'count': 'sum', 'min': 'min', 'max': 'max', 'first': 'first', 'last': 'last'}
+
+# resample-style aliases -> Period frequencies
+ALIASES = {'D': 'D', 'W': 'W', 'M': 'M', 'ME': 'M', 'Q': 'Q', 'QE': 'Q', 'Y': 'Y', 'YE': 'Y', 'A': 'Y'}
+
+# Finest to coarsest
+LEVEL_ORDER = ['D', 'W', 'M', 'Q', 'Y']
+
+# Which stored levels tile which query periods exactly
+NESTS_IN = {'D': {'D', 'W', 'M', 'Q', 'Y'}, 'W': {'W'}, 'M': {'M', 'Q', 'Y'}, 'Q': {'Q', 'Y'}, 'Y': {'Y'}}
+
+def _partials(prices, level):
+    """
+    Partial aggregates of raw bars, one row per period of 'level'.
+    """
+    periods = prices.index.to_period(level)
+    return prices.groupby(periods, sort=True).agg(PARTIALS)
+
+def _no_bars():
+    return pd.Series(dtype='float64', index=pd.DatetimeIndex([]))
+
+def _merge(partials, level):
+    """
+    Combines partial rows (in time order) into coarser 'level' periods.
+    """
+    return partials.groupby(partials.index.asfreq(level), sort=True).agg(MERGE)
+
+class RollupCache:
+    """
+    Partial aggregates of one price series at several levels (default D, W, M).
+    Queries for any period that a stored level tiles (W, M, Q, Y...) merge
+    the stored partials instead of touching raw prices.
+    """
+
+    def __init__(self, levels=('D', 'W', 'M')):
+        self.levels = [ALIASES[level] for level in levels]
+        self.tables = {level: pd.DataFrame(columns=PARTIALS, index=pd.PeriodIndex([], freq=level))
+                       for level in self.levels}
+        self.last_bar = None
+        self.invalid = []  # invalidated ranges whose periods are not all re-added yet
+
+    def add_bars(self, prices):
+        """
+        Folds new bars (a Series with a DatetimeIndex) into every level.
+        Bars must be newer than everything added so far, unless they fall
+        inside a range that was invalidated (that is how corrections come back).
+        """
+        prices = prices.dropna().sort_index()
+        if prices.empty:
+            return
+
+        refill = self._in_invalid(prices.index)
+        if refill.any():
+            if not refill.all():
+                raise ValueError("mix of corrected (invalidated) bars and other bars; add them separately")
+            self._refill(prices)
+            return
+
+        if self.last_bar is not None and prices.index[0] <= self.last_bar:
+            raise ValueError(f"bar at {prices.index[0]} is not after the last bar {self.last_bar}; "
+                             "call invalidate() for corrections of history")
+
+        for level in self.levels:
+            new = _partials(prices, level)
+            table = self.tables[level]
+            # Only the current (last) period can already exist
+            overlap = new.index.intersection(table.index)
+            if len(overlap):
+                both = pd.concat([table.loc[overlap], new.loc[overlap]])
+                new.loc[overlap] = both.groupby(level=0, sort=True).agg(MERGE)
+                table = table.drop(overlap)
+            self.tables[level] = pd.concat([table, new]) if len(table) else new
+        self.last_bar = prices.index[-1]
+
+    def invalidate(self, start, end):
+        """
+        Historical bars in [start, end] were corrected: every level drops the
+        stored periods that touch them. Returns the (start, end) range of raw
+        bars (all dropped periods, end to end) that must be passed to add_bars()
+        again before queries answer. The bars may come back in several calls;
+        queries raise until every finest-level period of the range that had
+        bars (every day, with the 'D' level) has bars again.
+        """
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        dropped = {}
+        span_start, span_end = start, end
+        # Widest span first: every level drops what touches [start, end]
+        for level in self.levels:
+            table = self.tables[level]
+            hit = (table.index.end_time >= start) & (table.index.start_time <= end)
+            if hit.any():
+                span_start = min(span_start, table.index[hit].start_time.min())
+                span_end = max(span_end, table.index[hit].end_time.max())
+        # The finest level's periods in that span are what must come back
+        finest = min(self.levels, key=LEVEL_ORDER.index)
+        stored = self.tables[finest].index
+        expected = stored[(stored.end_time >= span_start) & (stored.start_time <= span_end)]
+        for level in self.levels:
+            table = self.tables[level]
+            hit = (table.index.end_time >= start) & (table.index.start_time <= end)
+            dropped[level] = table.index[hit]
+            self.tables[level] = table[~hit]
+        if any(len(periods) for periods in dropped.values()):
+            self.invalid.append({'start': span_start, 'end': span_end, 'dropped': dropped,
+                                 'finest': finest, 'unfilled': expected, 'bars': _no_bars()})
+        return span_start, span_end
+
+    def _in_invalid(self, index):
+        mask = np.zeros(len(index), dtype=bool)
+        for entry in self.invalid:
+            mask |= (index >= entry['start']) & (index <= entry['end'])
+        return mask
+
+    def _refill(self, prices):
+        for entry in list(self.invalid):
+            bars = prices[(prices.index >= entry['start']) & (prices.index <= entry['end'])]
+            if bars.empty:
+                continue
+            # Everything re-added for this range so far (a bar sent twice: the later one wins),
+            # so a period refilled in pieces is rebuilt from all of its bars
+            bars = pd.concat([entry['bars'], bars])
+            entry['bars'] = bars[~bars.index.duplicated(keep='last')].sort_index()
+            for level in self.levels:
+                # Only the periods this level dropped; the rest are still stored
+                new = _partials(entry['bars'], level)
+                new = new[new.index.isin(entry['dropped'][level])]
+                table = self.tables[level].drop(new.index, errors='ignore')
+                self.tables[level] = pd.concat([table, new]).sort_index()
+            # Done once every finest period that had bars has bars again
+            # (with the daily level: every trading day of the span)
+            entry['unfilled'] = entry['unfilled'].difference(entry['bars'].index.to_period(entry['finest']))
+            if not len(entry['unfilled']):
+                self.invalid.remove(entry)
+
+    def _source(self, freq):
+        freq = ALIASES[freq]
+        if self.invalid:
+            missing = sorted({str(p) for entry in self.invalid for p in entry['unfilled']})
+            spans = [(entry['start'], entry['end']) for entry in self.invalid]
+            raise ValueError(f"ranges {spans} were invalidated and not fully re-added yet "
+                             f"(periods without bars: {missing[:10]}{' ...' if len(missing) > 10 else ''})")
+        # Coarsest stored level that tiles the requested period = fewest rows to merge
+        for level in sorted(self.levels, key=LEVEL_ORDER.index, reverse=True):
+            if freq in NESTS_IN[level]:
+                table = self.tables[level]
+                return table if level == freq else _merge(table, freq)
+        raise ValueError(f"no stored level can build '{freq}' periods (stored: {self.levels})")
+
+    @staticmethod
+    def _label(index):
+        # Same labels as resample(): the last day of each period
+        return pd.DatetimeIndex(index.end_time.normalize(), name='Date')
+
+    def mean(self, freq='M'):
+        """
+        Same numbers as prices.resample(freq).mean() (for periods that have bars).
+        """
+        table = self._source(freq)
+        result = table['sum'] / table['count']
+        result.index = self._label(table.index)
+        return result
+
+    def ohlc(self, freq='M'):
+        """
+        Open/high/low/close plus mean and bar count per period.
+        """
+        table = self._source(freq)
+        result = pd.DataFrame({
+            'open': table['first'], 'high': table['max'], 'low': table['min'],
+            'close': table['last'], 'mean': table['sum'] / table['count'],
+            'count': table['count'].astype(int),
+        })
+        result.index = self._label(table.index)
+        return result
+
+    def save(self, path):
+        """
+        One CSV per level in 'path' (plus the last bar time).
+        """
+        os.makedirs(path, exist_ok=True)
+        for level, table in self.tables.items():
+            table.to_csv(os.path.join(path, f'rollup_{level}.csv'), index_label='period')
+        pd.Series({'last_bar': self.last_bar}).to_csv(os.path.join(path, 'rollup_meta.csv'))
+
+    @classmethod
+    def load(cls, path, levels=('D', 'W', 'M')):
+        cache = cls(levels)
+        for level in cache.levels:
+            table = pd.read_csv(os.path.join(path, f'rollup_{level}.csv'), index_col='period')
+            table.index = pd.PeriodIndex(table.index, freq=level)
+            cache.tables[level] = table[PARTIALS]
+        meta = pd.read_csv(os.path.join(path, 'rollup_meta.csv'), index_col=0).iloc[:, 0]
+        cache.last_bar = pd.Timestamp(meta['last_bar']) if pd.notna(meta['last_bar']) else None
+        return cache
+
+# ==========================================
+# DEMO: feed the day9 gold series in daily batches, query M/W/Q rollups
+# python rollup.py
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Rollup cache demo on simulated gold prices')
+    parser.add_argument('--save', help='Directory to save the rollup tables to')
+    args = parser.parse_args()
+
+    dates = pd.date_range(start='2025-01-01', periods=365, freq='D')
+    np.random.seed(42)
+    gold = pd.Series(50000 + np.cumsum(np.random.normal(loc=10, scale=500, size=365)), index=dates)
+
+    print("--- SYSTEM: BUILDING ROLLUP CACHE ---")
+    cache = RollupCache()
+    for start in range(0, len(gold), 30):
+        cache.add_bars(gold.iloc[start:start + 30])
+
+    print("\n--- MONTHLY AVERAGE PRICES (from partials) ---")
+    print(cache.mean('M').head())
+    print("\n--- QUARTERLY OHLC (merged from months) ---")
+    print(cache.ohlc('Q'))
+
+    # A correction to February: invalidate, re-add, query again
+    fixed = gold.copy()
+    fixed['2025-02-10'] += 1000
+    start, end = cache.invalidate('2025-02-10', '2025-02-10')
+    cache.add_bars(fixed[start:end])
+    error = (cache.mean('M') - fixed.resample('ME').mean()).abs().max()
+    print(f"\n>> After correcting {start.date()}..{end.date()}: max difference vs resample() {error:.2e}")
+
+    if args.save:
+        cache.save(args.save)
+        print(f">> Rollups saved to '{args.save}'")
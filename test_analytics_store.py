@@ -0,0 +1,25 @@
+import sqlite3
+import pytest
+from analytics_store import AnalyticsStore
+
+def index_names(store):
+    return {row[0] for row in store.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+def test_failed_load_keeps_rows_and_indexes(tmp_path):
+    with AnalyticsStore(str(tmp_path / 'aurum.db')) as store:
+        store.load('employees', [(1, 'Ankit', 'IT', 80000), (2, 'Rahul', 'IT', 90000)], replace=True)
+        before = index_names(store)
+        assert 'idx_employees_department_salary' in before
+
+        # Duplicate primary key: the whole load rolls back, indexes included
+        with pytest.raises(sqlite3.IntegrityError):
+            store.load('employees', [(3, 'Priya', 'HR', 70000), (1, 'Ankit', 'IT', 80000)])
+        assert index_names(store) == before
+        assert store.conn.execute('SELECT COUNT(*) FROM employees').fetchone()[0] == 2
+
+def test_load_replace(tmp_path):
+    with AnalyticsStore(str(tmp_path / 'aurum.db')) as store:
+        store.load('employees', [(1, 'Ankit', 'IT', 80000)])
+        assert store.load('employees', [(5, 'Neha', 'HR', 60000), (6, 'Amit', 'IT', 75000)], replace=True) == 2
+        names = [row for _, rows in store.rows('SELECT name FROM employees ORDER BY id') for row in rows]
+        assert names == [('Neha',), ('Amit',)]
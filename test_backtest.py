@@ -0,0 +1,17 @@
+import numpy as np
+from backtest import backtest_grid, backtest_pair, summarize_grid
+
+def test_grid_matches_pandas_pair():
+    rng = np.random.default_rng(42)
+    prices = 50000 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, size=(600, 3)), axis=0))
+    results = backtest_grid(prices, [5, 10, 40], [20, 50], memory_budget=1 << 16)
+    for i, fast in enumerate([5, 10, 40]):
+        for j, slow in enumerate([20, 50]):
+            for k in range(3):
+                if fast >= slow:
+                    assert np.isnan(results['sharpe'][i, j, k])
+                    continue
+                expected = backtest_pair(prices[:, k], fast, slow)
+                for name, value in expected.items():
+                    assert np.isclose(results[name][i, j, k], value, rtol=1e-4, atol=1e-5), (name, fast, slow, k)
+    assert len(summarize_grid(results)) == 5
@@ -0,0 +1,20 @@
+import pandas as pd
+import numpy as np
+from cleaning import normalize_dates, parse_amounts
+
+def test_normalize_dates_iso_separators():
+    dates, rejected = normalize_dates(pd.Series(['2025-01-01 10:00:00', '2025-01-01T10:00:00', '2025-01-02']))
+    assert list(dates) == [pd.Timestamp('2025-01-01 10:00'), pd.Timestamp('2025-01-01 10:00'),
+                           pd.Timestamp('2025-01-02')]
+    assert rejected.empty
+
+def test_normalize_dates_rejects():
+    dates, rejected = normalize_dates(pd.Series(['31/02/2025', 'soon', None, '05/03/2025']))
+    assert dates.iloc[3] == pd.Timestamp('2025-03-05')
+    assert dates.iloc[:3].isna().all()
+    assert list(rejected['reason']) == ['invalid date', 'unknown format']
+
+def test_parse_amounts():
+    clean, report = parse_amounts(pd.Series([12000, '15,000', '₹5,000', np.nan, 'abc'], dtype=object))
+    assert clean.iloc[:3].tolist() == [12000.0, 15000.0, 5000.0]
+    assert report == {'numeric': 1, 'coerced': 2, 'invalid': 1, 'missing': 1}
@@ -0,0 +1,72 @@
+import pandas as pd
+import functools
+from dag import Pipeline
+from instrumentation import RECORDER, instrumented
+
+def _numbers(n):
+    return pd.DataFrame({'x': range(n)})
+
+def _write_total(path, df):
+    with open(path, 'w') as f:
+        f.write(str(df['x'].sum()))
+    return path
+
+@instrumented
+def _square(df):
+    return df.assign(y=df['x'] ** 2)
+
+@instrumented
+def _total(df):
+    return int(df['x'].sum())
+
+def _pipeline(tmp_path, n):
+    pipeline = Pipeline(cache_dir=str(tmp_path / 'cache'), workers=1)
+    pipeline.add('numbers', functools.partial(_numbers, n))
+    report = str(tmp_path / 'total.txt')
+    pipeline.add('report', functools.partial(_write_total, report), ['numbers'], files=[report])
+    return pipeline, report
+
+def test_rerun_is_cached(tmp_path):
+    pipeline, _ = _pipeline(tmp_path, 10)
+    pipeline.run()
+    pipeline.run()
+    assert pipeline.status == {'numbers': 'cached', 'report': 'cached'}
+
+def test_cache_hit_restores_overwritten_file(tmp_path):
+    pipeline, report = _pipeline(tmp_path, 10)
+    pipeline.run()
+    with open(report, 'w') as f:
+        f.write('written by another run')
+    pipeline.run()
+    assert pipeline.status['report'] == 'cached'
+    assert open(report).read() == '45'
+
+def test_cache_hit_after_run_on_other_data(tmp_path):
+    pipeline, report = _pipeline(tmp_path, 10)
+    pipeline.run()
+    _pipeline(tmp_path, 5)[0].run()
+    assert open(report).read() == '10'
+    pipeline.run()
+    assert pipeline.status['report'] == 'cached'
+    assert open(report).read() == '45'
+
+def test_cache_hit_restores_deleted_file(tmp_path):
+    pipeline, report = _pipeline(tmp_path, 10)
+    pipeline.run()
+    (tmp_path / 'total.txt').unlink()
+    pipeline.run()
+    assert pipeline.status['report'] == 'cached'
+    assert open(report).read() == '45'
+
+def test_worker_metrics_reach_the_parent(tmp_path, monkeypatch):
+    for name, value in vars(type(RECORDER)()).items():
+        monkeypatch.setattr(RECORDER, name, value)   # put the global recorder back afterwards
+    log = tmp_path / 'metrics.jsonl'
+    RECORDER.configure(log_path=str(log))
+    pipeline = Pipeline(cache_dir=str(tmp_path / 'cache'), workers=2)
+    pipeline.add('numbers', functools.partial(_numbers, 10))
+    pipeline.add('square', _square, ['numbers'])
+    pipeline.add('total', _total, ['numbers'])
+    pipeline.run()
+    assert sorted(r['stage'] for r in RECORDER.records) == ['_square', '_total']
+    assert len(log.read_text().splitlines()) == 2   # written once, by the worker
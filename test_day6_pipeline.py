@@ -0,0 +1,40 @@
+import pandas as pd
+import numpy as np
+import pytest
+import day6_pipeline
+from day6_pipeline import is_parquet, parallel_median, plan_partitions, run_parallel
+from encoding import SharedVocabulary
+
+def test_is_parquet(tmp_path):
+    (tmp_path / 'csvs').mkdir()
+    (tmp_path / 'csvs' / 'book.csv').write_text('client_id\n1\n')
+    pd.DataFrame({'client_id': [1], 'day': ['2025-01-01']}).to_parquet(tmp_path / 'data', partition_cols=['day'])
+    assert not is_parquet(tmp_path / 'csvs')
+    assert is_parquet(tmp_path / 'data')
+    assert is_parquet('book.parquet') and not is_parquet('book.csv')
+
+def test_parallel_median_matches_pandas(tmp_path):
+    paths = []
+    for i, amounts in enumerate([[5000, 'bad', 12000], [], [7000.5, None, 3000]]):
+        path = tmp_path / f'book{i}.csv'
+        pd.DataFrame({'client_id': range(len(amounts)), 'client_name': 'x',
+                      'investment_amount': amounts, 'risk_level': 'Low'}).to_csv(path, index=False)
+        paths.append(str(path))
+    partitions = plan_partitions(paths, 'client_id', 2, chunksize=2)
+    assert parallel_median(partitions, 2, map) == pd.Series([5000, 12000, 7000.5, 3000]).median()
+    assert np.isnan(parallel_median(plan_partitions([paths[1]], 'client_id'), 2, map))
+
+def test_run_parallel_without_partitions():
+    with pytest.raises(ValueError):
+        run_parallel([], 10, 1)
+
+def test_worker_levels_reach_the_parent(tmp_path, monkeypatch):
+    monkeypatch.setattr(day6_pipeline, 'VOCABULARY', SharedVocabulary())
+    paths = []
+    for i, levels in enumerate([['Low', 'Extreme'], ['Medium', 'Low']]):
+        path = tmp_path / f'book{i}.csv'
+        pd.DataFrame({'client_id': [2 * i, 2 * i + 1], 'client_name': 'x',
+                      'investment_amount': [1000, 2000], 'risk_level': levels}).to_csv(path, index=False)
+        paths.append(str(path))
+    run_parallel(plan_partitions(paths, 'file'), 10, 2)
+    assert day6_pipeline.VOCABULARY['risk_level'].values == ['Low', 'Extreme', 'Medium']
@@ -0,0 +1,139 @@
+import pandas as pd
+import numpy as np
+import asyncio
+import json
+import os
+from ingest import IngestService, make_feed, parse_line, replay, tail_file, validate
+from datastore import DataStore
+from price_store import PriceStore
+
+def run_replay(service, records):
+    async def main():
+        consumer = asyncio.create_task(service.run())
+        await replay(service, records)
+        await consumer
+    asyncio.run(main())
+    return service
+
+def test_replay_matches_batch(tmp_path):
+    feed = make_feed(3000, 300)
+    service = run_replay(IngestService(store_root=str(tmp_path / 'data'), price_path=str(tmp_path / 'gold'),
+                                       batch_size=200, flush_rows=1000), feed)
+    transactions = pd.DataFrame([r for r in feed if r['type'] == 'transaction'])
+    assert service.status()['client_totals'].equals(transactions.groupby('Client_Name')['Amount'].sum())
+    prices = pd.Series([r['price'] for r in feed if r['type'] == 'tick'])
+    assert np.isclose(service.last_tick['SMA_20'], prices.rolling(20).mean().iloc[-1])
+    assert len(DataStore(str(tmp_path / 'data')).read('transactions')) == 3000
+    assert len(PriceStore(str(tmp_path / 'gold'))) == 300
+
+def test_bad_records_are_counted_and_dropped():
+    good = {'type': 'transaction', 'Client_Name': 'Ankit', 'City': 'Korba', 'Asset_Class': 'Gold',
+            'Amount': 100, 'Status': 'Completed', 'Date': '2025-01-01T10:00:00'}
+    records = [
+        good,
+        {k: v for k, v in good.items() if k != 'City'},
+        dict(good, Amount='lots'),
+        dict(good, Date='someday'),
+        {'type': 'tick', 'time': '2025-01-01T10:00:00'},
+        {'type': 'tick', 'price': 50000.0},
+        {'type': 'quote', 'price': 1.0},
+        {'type': 'tick', 'time': '2025-01-01T10:00:01', 'price': 50000.0},
+    ]
+    service = run_replay(IngestService(), records)
+    assert service.counts['rejected'] == 6
+    assert service.counts['transactions'] == 1 and service.counts['ticks'] == 1
+    assert service.status()['client_totals'].to_dict() == {'Ankit': 100}
+
+def test_parse_line():
+    assert parse_line('') is None
+    assert parse_line('{not json') is None
+    assert parse_line('{"type": "tick", "time": "2025-01-01T09:00:00"}') is None
+    assert parse_line('{"type": "tick", "time": "2025-01-01T09:00:00", "price": 1.5}')['price'] == 1.5
+    assert validate(['tick']) is None
+
+def test_tail_source_skips_bad_lines(tmp_path):
+    path = str(tmp_path / 'feed.jsonl')
+    lines = [json.dumps({'type': 'tick', 'time': f'2025-01-01T09:00:0{i}', 'price': 100.0 + i}) for i in range(3)]
+    with open(path, 'w') as f:
+        f.write(lines[0] + '\n{"type": "tick"}\n\n' + lines[1] + '\n' + lines[2] + '\n')
+
+    async def main():
+        service = IngestService()
+        stop = asyncio.Event()
+        consumer = asyncio.create_task(service.run())
+        tail = asyncio.create_task(tail_file(service, path, poll_interval=0.01, stop=stop))
+        await asyncio.sleep(0.1)
+        stop.set()
+        await tail
+        await consumer
+        return service
+    service = asyncio.run(main())
+    assert service.counts['ticks'] == 3 and service.counts['rejected'] == 1
+
+def test_failed_write_keeps_rows_and_engine_state(tmp_path, monkeypatch):
+    feed = make_feed(500, 100)
+    state = str(tmp_path / 'engine.json')
+    service = IngestService(store_root=str(tmp_path / 'data'), price_path=str(tmp_path / 'gold'),
+                            engine_state=state, flush_rows=10**9)
+    real_append = service.prices.append
+    calls = []
+
+    def flaky_append(timestamps, prices):
+        calls.append(len(prices))
+        if len(calls) == 1:
+            raise OSError('disk full')
+        real_append(timestamps, prices)
+
+    monkeypatch.setattr(service.prices, 'append', flaky_append)
+
+    async def main():
+        consumer = asyncio.create_task(service.run())
+        service.add_source()
+        for record in feed[:300]:
+            await service.put(record)
+        await asyncio.sleep(0.2)
+        await service.flush()
+        await service._flushing
+        # The ticks failed: still pending, and no engine state claims they are stored
+        assert service.counts['flush_errors'] == 1
+        assert len(service.pending_ticks) > 0 and not service.pending_transactions
+        assert not os.path.exists(state)
+        for record in feed[300:]:
+            await service.put(record)
+        await service.done()
+        await consumer
+    asyncio.run(main())
+
+    assert service.counts['flush_errors'] == 1
+    ticks = [r['price'] for r in feed if r['type'] == 'tick']
+    assert list(PriceStore(str(tmp_path / 'gold')).column('price')) == ticks
+    assert len(DataStore(str(tmp_path / 'data')).read('transactions')) == 500
+    with open(state) as f:
+        assert json.load(f)['last_time'] == str(pd.Timestamp([r for r in feed if r['type'] == 'tick'][-1]['time']))
+
+def test_lag_history_is_bounded():
+    service = run_replay(IngestService(batch_size=1, max_delay=0), make_feed(0, 1100))
+    assert service.counts['batches'] > 1000
+    assert len(service.lags) == 1000
+
+def test_flushes_share_one_schema(tmp_path):
+    base = {'type': 'transaction', 'Client_Name': 'Ankit', 'City': 'Korba', 'Asset_Class': 'Gold',
+            'Status': 'Completed', 'Date': '2025-01-01T10:00:00'}
+    records = [dict(base, Amount=5), dict(base, Amount=2.5, Transaction_ID=1002),
+               dict(base, Amount=7, Transaction_ID=None, Date='2025-01-02 09:00:00')]
+
+    async def main():
+        service = IngestService(store_root=str(tmp_path / 'data'), flush_rows=1, batch_size=1, max_delay=0)
+        consumer = asyncio.create_task(service.run())
+        service.add_source()
+        for record in records:
+            await service.put(record)
+            await asyncio.sleep(0.05)
+        await service.done()
+        await consumer
+        return service
+    service = asyncio.run(main())
+    assert service.counts['flushes'] == 3
+    stored = DataStore(str(tmp_path / 'data')).read('transactions').sort_values('Date')
+    assert stored['Amount'].tolist() == [5.0, 2.5, 7.0]
+    assert stored['Transaction_ID'].isna().tolist() == [True, False, True]
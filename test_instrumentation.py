@@ -0,0 +1,31 @@
+import pandas as pd
+import numpy as np
+from instrumentation import StageRecorder, record_output
+
+def test_stage_records_rows_and_bytes():
+    recorder = StageRecorder().configure()
+    df = pd.DataFrame({'name': ['a', 'b', 'c'], 'x': [1.0, 2.0, 3.0]})
+    with recorder.stage('double', df) as record:
+        out = df.assign(x=df['x'] * 2).iloc[:2]
+        record_output(record, out)
+    (record,) = recorder.records
+    assert record['rows_in'] == 3 and record['rows_out'] == 2
+    assert record['frame_bytes_out'] == int(out.memory_usage(index=True, deep=True).sum())
+    assert '_data_out' not in record and record['status'] == 'ok'
+    assert recorder.summary()['rows_out'].tolist() == [2]
+
+def test_output_sizing_is_not_timed(monkeypatch):
+    import instrumentation
+    recorder = StageRecorder().configure()
+
+    def slow_bytes(obj):
+        # sizing "costs" 100 s of wall clock: it must land outside wall_s
+        next_clock[0] += 100.0
+        return 1
+    next_clock = [0.0]
+    monkeypatch.setattr(instrumentation.time, 'perf_counter', lambda: next_clock[0])
+    monkeypatch.setattr(instrumentation, '_frame_bytes', slow_bytes)
+    with recorder.stage('noop') as record:
+        next_clock[0] += 1.0
+        record_output(record, pd.DataFrame({'x': [1]}))
+    assert recorder.records[0]['wall_s'] == 1.0
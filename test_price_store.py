@@ -0,0 +1,38 @@
+import pandas as pd
+import numpy as np
+import pytest
+from price_store import PriceStore
+
+def test_append_and_slice(tmp_path):
+    store = PriceStore(str(tmp_path / 'gold'))
+    dates = pd.date_range('2025-01-01', periods=10, freq='D')
+    store.append(dates[:4], np.arange(4.0))
+    store.append(dates[4:], np.arange(4.0, 10.0))
+    assert len(store) == 10
+    assert list(store.series('2025-01-03', '2025-01-05')) == [2.0, 3.0, 4.0]
+
+def test_append_rejects_old_bars(tmp_path):
+    store = PriceStore(str(tmp_path / 'gold'))
+    store.append(pd.date_range('2025-01-02', periods=2), [1.0, 2.0])
+    with pytest.raises(ValueError):
+        store.append([pd.Timestamp('2025-01-01')], [0.5])
+
+def test_append_after_crash_before_index_write(tmp_path, monkeypatch):
+    path = str(tmp_path / 'gold')
+    store = PriceStore(path)
+    dates = pd.date_range('2025-01-01', periods=6, freq='D')
+    store.append(dates[:2], [1.0, 2.0])
+
+    # The column bytes of the next append reach disk, the index write never happens
+    def crash():
+        raise OSError('crash')
+    monkeypatch.setattr(store, '_save_index', crash)
+    with pytest.raises(OSError):
+        store.append(dates[2:4], [99.0, 99.0])
+    monkeypatch.undo()
+
+    reopened = PriceStore(path)
+    assert len(reopened) == 2
+    reopened.append(dates[2:6], [3.0, 4.0, 5.0, 6.0])
+    assert list(reopened.column('price')) == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert list(PriceStore(path).series().index) == list(dates)
@@ -0,0 +1,28 @@
+import pandas as pd
+import rendering
+from rendering import Chart
+import charts
+
+def chart():
+    df = pd.DataFrame({'Month': ['Jan'], 'Asset_Class': ['Gold'], 'Value': [1]})
+    return Chart(charts.portfolio_growth, df, 'growth.png')
+
+def test_key_is_stable():
+    assert chart().key() == chart().key()
+
+def test_key_follows_library_versions(monkeypatch):
+    before = chart().key()
+    monkeypatch.setattr(rendering, '_library_versions', lambda: {'matplotlib': '0.0', 'seaborn': '0.0'})
+    assert chart().key() != before
+
+def test_key_follows_helpers_in_the_draw_module(monkeypatch):
+    before = chart().key()
+    source = rendering.inspect.getsource(charts)
+    monkeypatch.setattr(rendering.inspect, 'getsource', lambda obj: source + '\ndef helper():\n    pass\n')
+    assert chart().key() != before
+
+def test_render_many_caches(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache = str(tmp_path / 'cache')
+    assert rendering.render_many([chart()], workers=1, cache_dir=cache) == {'growth.png': 'rendered'}
+    assert rendering.render_many([chart()], workers=1, cache_dir=cache) == {'growth.png': 'cached'}
@@ -0,0 +1,38 @@
+import pandas as pd
+import numpy as np
+import pytest
+from rollup import RollupCache
+
+def gold():
+    dates = pd.date_range(start='2025-01-01', periods=120, freq='D')
+    rng = np.random.default_rng(42)
+    return pd.Series(50000 + np.cumsum(rng.normal(10, 500, 120)), index=dates)
+
+def built(prices):
+    cache = RollupCache()
+    for start in range(0, len(prices), 30):
+        cache.add_bars(prices.iloc[start:start + 30])
+    return cache
+
+def test_rollups_match_resample():
+    prices = gold()
+    cache = built(prices)
+    assert np.allclose(cache.mean('M'), prices.resample('ME').mean())
+    expected = prices.resample('QE').ohlc()
+    assert np.allclose(cache.ohlc('Q')[['open', 'high', 'low', 'close']], expected)
+
+def test_partial_refill_is_not_answered():
+    prices = gold()
+    cache = built(prices)
+    fixed = prices.copy()
+    fixed['2025-02-10'] += 1000
+    start, end = cache.invalidate('2025-02-10', '2025-02-10')
+
+    cache.add_bars(fixed['2025-02-10':'2025-02-10'])   # only the corrected bar, not the dropped span
+    with pytest.raises(ValueError, match='not fully re-added'):
+        cache.mean('M')
+
+    cache.add_bars(fixed[start:'2025-02-09'])          # the rest, in more pieces
+    cache.add_bars(fixed['2025-02-11':end])
+    assert np.allclose(cache.mean('M'), fixed.resample('ME').mean())
+    assert np.allclose(cache.mean('W'), fixed.resample('W').mean())
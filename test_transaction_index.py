@@ -0,0 +1,23 @@
+import pandas as pd
+import numpy as np
+import pytest
+from transaction_index import TransactionIndex, mask_for
+from groupby_engine import make_transactions
+
+QUERIES = [
+    dict(Status='Completed', Amount=('>', 10000)),
+    dict(City=['Raipur', 'Durg'], Status={'Completed', 'Pending'}),
+    dict(City='Korba', Amount=[('>=', 20000), ('<', 21000)]),
+    dict(Status=[]),
+]
+
+@pytest.mark.parametrize('predicates', QUERIES)
+def test_index_matches_mask(predicates):
+    df = make_transactions(20_000)
+    index = TransactionIndex(df)
+    assert np.array_equal(index.positions(**predicates), np.flatnonzero(mask_for(df, **predicates)))
+
+def test_tuple_is_rejected_for_bitmap_columns():
+    index = TransactionIndex(make_transactions(100))
+    with pytest.raises(ValueError):
+        index.positions(Status=('Completed', 'Pending'))
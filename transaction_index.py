@@ -0,0 +1,185 @@
+import pandas as pd
+import numpy as np
+import argparse
+import operator
+import time
+
+# ==========================================
+# INDEXED FILTERING (Sorted Column + Bitmaps)
+# df[(df['Status'] == 'Completed') & (df['Amount'] > 10000)] scans every row
+# for every query. When the same snapshot is asked many questions we build,
+# once:
+#   - a sorted copy of 'Amount' (+ the row order), so a range is two searchsorted()
+#   - one bitmap per distinct 'Status' / 'City' value (np.packbits, 1 bit per row)
+# A query is then: range -> candidate rows, equality -> AND of bitmaps.
+# The index is for a loaded, unchanging DataFrame; rebuild it after edits.
+# ==========================================
+
+OPERATORS = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le, '==': operator.eq}
+
+def _is_range(wanted):
+    # (op, value) or a list of them, as opposed to a value / list of values
+    if isinstance(wanted, tuple):
+        return True
+    return isinstance(wanted, list) and len(wanted) > 0 and all(isinstance(w, tuple) for w in wanted)
+
+class TransactionIndex:
+    """
+    Read-only index over one DataFrame.
+      index.positions(Status='Completed', Amount=('>', 10000))  -> row positions
+      index.filter(...)                                          -> df rows (same as the mask)
+    Bitmap columns take a value or a list/set of values (isin); sorted columns take
+    (op, value) or a list of them, op in '>', '>=', '<', '<=', '=='.
+    A tuple always means (op, value), so it is rejected for a bitmap column.
+    """
+
+    def __init__(self, df, sorted_columns=('Amount',), bitmap_columns=('Status', 'City')):
+        self.df = df
+        self.rows = len(df)
+        self.sorted = {}
+        self.columns = {}
+        for column in sorted_columns:
+            values = self.columns[column] = df[column].to_numpy()
+            order = np.argsort(values, kind='stable')
+            # NaNs sort last and never match a comparison, so ranges stop before them
+            valid = len(values) - int(pd.isna(values).sum())
+            self.sorted[column] = (values[order][:valid], order[:valid])
+
+        self.bitmaps = {}
+        for column in bitmap_columns:
+            codes, uniques = pd.factorize(df[column])
+            self.bitmaps[column] = {value: np.packbits(codes == code) for code, value in enumerate(uniques)}
+
+    def _bitmap(self, column, wanted):
+        if isinstance(wanted, tuple):
+            # A tuple is an (op, value) range everywhere else; don't guess here
+            raise ValueError(f"'{column}' takes a value or a list/set of values, got the tuple {wanted!r}")
+        values = wanted if isinstance(wanted, (list, set)) else [wanted]
+        bits = np.zeros((self.rows + 7) // 8, dtype=np.uint8)
+        for value in values:
+            if value in self.bitmaps[column]:
+                bits |= self.bitmaps[column][value]
+        return bits
+
+    def _range(self, column, conditions):
+        """
+        Row positions (in value order) whose 'column' meets every (op, value).
+        """
+        values, order = self.sorted[column]
+        lo, hi = 0, len(values)
+        if not _is_range(conditions):
+            raise ValueError(f"'{column}' needs (op, value) conditions, got {conditions!r}")
+        if isinstance(conditions, tuple):
+            conditions = [conditions]
+        for op, bound in conditions:
+            if op not in OPERATORS:
+                raise ValueError(f"unsupported operator '{op}' (use {list(OPERATORS)})")
+            if op in ('>', '>=', '=='):
+                lo = max(lo, int(np.searchsorted(values, bound, side='right' if op == '>' else 'left')))
+            if op in ('<', '<=', '=='):
+                hi = min(hi, int(np.searchsorted(values, bound, side='left' if op == '<' else 'right')))
+        return order[lo:max(lo, hi)]
+
+    def positions(self, **predicates):
+        """
+        Sorted row positions matching every predicate (AND).
+        """
+        unknown = set(predicates) - set(self.sorted) - set(self.bitmaps)
+        if unknown:
+            raise KeyError(f"no index on {sorted(unknown)}")
+
+        bits = None
+        for column, wanted in predicates.items():
+            if column in self.bitmaps:
+                bitmap = self._bitmap(column, wanted)
+                bits = bitmap if bits is None else bits & bitmap
+
+        candidates = None
+        for column, conditions in predicates.items():
+            if column in self.sorted:
+                rows = self._range(column, conditions)
+                candidates = rows if candidates is None else np.intersect1d(candidates, rows, assume_unique=True)
+
+        if candidates is None:
+            if bits is None:
+                return np.arange(self.rows)
+            return np.flatnonzero(np.unpackbits(bits, count=self.rows))
+
+        if bits is not None:
+            if len(candidates) * 8 < self.rows:
+                # Few candidates: look their bits up directly
+                hit = (bits[candidates >> 3] >> (7 - (candidates & 7))) & 1
+                candidates = candidates[hit.astype(bool)]
+            else:
+                # Many: scattering them is slower than one sequential compare,
+                # so the range becomes a bitmap straight from the column
+                mask = np.ones(self.rows, dtype=bool)
+                for column, conditions in predicates.items():
+                    if column in self.sorted:
+                        for op, bound in ([conditions] if isinstance(conditions, tuple) else conditions):
+                            mask &= OPERATORS[op](self.columns[column], bound)
+                return np.flatnonzero(np.unpackbits(bits & np.packbits(mask), count=self.rows))
+        return np.sort(candidates)
+
+    def count(self, **predicates):
+        return len(self.positions(**predicates))
+
+    def filter(self, **predicates):
+        """
+        The matching rows of the DataFrame, in original order (same as df[mask]).
+        """
+        return self.df.iloc[self.positions(**predicates)]
+
+def mask_for(df, **predicates):
+    """
+    The plain pandas boolean mask for the same predicates (the reference).
+    Same reading as the index: a tuple is (op, value), a list/set of values is isin.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for column, wanted in predicates.items():
+        if _is_range(wanted):
+            for op, bound in ([wanted] if isinstance(wanted, tuple) else wanted):
+                mask &= OPERATORS[op](df[column], bound).to_numpy()
+        elif isinstance(wanted, (list, set)):
+            mask &= df[column].isin(wanted).to_numpy()
+        else:
+            mask &= (df[column] == wanted).to_numpy()
+    return mask
+
+# ==========================================
+# BENCHMARK: pandas mask vs index, on synthetic day8 transactions
+# python transaction_index.py --rows 10000000
+# ==========================================
+QUERIES = {
+    "Completed & Amount > 10000": dict(Status='Completed', Amount=('>', 10000)),
+    "Failed & Amount > 59000": dict(Status='Failed', Amount=('>', 59000)),
+    "Korba & Pending & 20000 <= Amount < 21000": dict(City='Korba', Status='Pending',
+                                                       Amount=[('>=', 20000), ('<', 21000)]),
+    "Raipur or Durg & Completed": dict(City=['Raipur', 'Durg'], Status='Completed'),
+}
+
+def benchmark(df, repeats=5):
+    from benchmarks import best_time
+    start = time.perf_counter()
+    index = TransactionIndex(df)
+    print(f"{len(df):,} rows (index built in {time.perf_counter() - start:.2f}s)")
+    for label, predicates in QUERIES.items():
+        expected = np.flatnonzero(mask_for(df, **predicates))
+        found = index.positions(**predicates)
+        assert np.array_equal(found, expected), label
+
+        scan = best_time(lambda: np.flatnonzero(mask_for(df, **predicates)), repeats)
+        indexed = best_time(lambda: index.positions(**predicates), repeats)
+        print(f"  {label:<42} {len(found):>10,} rows | mask {scan * 1e3:8.2f} ms | "
+              f"index {indexed * 1e3:8.2f} ms | {scan / indexed:6.1f}x")
+
+if __name__ == "__main__":
+    from groupby_engine import make_transactions
+
+    parser = argparse.ArgumentParser(description='Query latency: boolean mask vs sorted/bitmap index')
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    print("--- SYSTEM: BENCHMARKING INDEXED FILTERS ---")
+    benchmark(make_transactions(args.rows), args.repeats)